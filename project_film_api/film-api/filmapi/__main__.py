@@ -0,0 +1,170 @@
+"""The command line interface of the app."""
+
+import argparse
+import asyncio
+import logging
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+from filmapi.config import config
+from filmapi.container import Container
+from filmapi.db import connect, database, read_from_primary
+from filmapi.migrations import check_schema, migrate, schema_version
+from filmapi.repositories.exportdb import COLUMNAR_FORMATS, columnar_available
+from filmapi.repositories.pagination import MAX_LIMIT, FilmSort
+from filmapi.server import serve
+from filmapi.utils.benchmark import benchmark_film_pages
+from filmapi.utils.catalog import CatalogFormat, ExportFormat, detect_format
+
+
+async def migrate_schema() -> None:
+    """A function applying the pending schema migrations."""
+    await connect(database)
+    try:
+        applied = await migrate(database)
+        version = await schema_version(database)
+    finally:
+        await database.disconnect()
+
+    for migration in applied:
+        print(f"Applied {migration.version}: {migration.description}")
+    print(f"Schema is at version {version}")
+
+
+async def import_catalog(path: Path, fmt: CatalogFormat) -> None:
+    """A function importing a catalog file into the database.
+
+    Args:
+        path (Path): The catalog file.
+        fmt (CatalogFormat): The file format.
+    """
+    await connect(database)
+    try:
+        await check_schema(database)
+        with path.open(encoding="utf-8-sig", newline="") as stream:
+            report = await Container.import_service().import_catalog(stream, fmt)
+    finally:
+        await database.disconnect()
+
+    for error in report.errors:
+        logging.warning("Line %d rejected: %s", error.line, error.detail)
+    print(report.model_dump_json(indent=2, exclude={"errors"}))
+
+
+async def export_catalog(path: Path | None, fmt: ExportFormat) -> None:
+    """A function exporting the catalog to a file or the standard output.
+
+    Args:
+        path (Path | None): The output file, the standard output if None.
+        fmt (ExportFormat): The output format.
+    """
+    await connect(database)
+    try:
+        with path.open("wb") if path else nullcontext(sys.stdout.buffer) as output:
+            async for chunk in Container.export_service().export_catalog(fmt):
+                output.write(chunk)
+    finally:
+        await database.disconnect()
+
+
+async def benchmark_pages(limit: int, pages: int, rounds: int, sort: FilmSort) -> None:
+    """A function comparing the ways a page of films can be rendered.
+
+    Args:
+        limit (int): The page size.
+        pages (int): The number of consecutive pages to render.
+        rounds (int): The number of times every page is rendered.
+        sort (FilmSort): The sort key.
+    """
+    await connect(database)
+    try:
+        results = await benchmark_film_pages(limit, pages, rounds, sort)
+    finally:
+        await database.disconnect()
+
+    print(f"{'renderer':<10}{'wall ms':>10}{'cpu ms':>10}{'bytes':>12}")
+    for result in results:
+        print(
+            f"{result['renderer']:<10}"
+            f"{result['wall_ms_per_page']:>10.3f}"
+            f"{result['cpu_ms_per_page']:>10.3f}"
+            f"{result['bytes_per_page']:>12}"
+        )
+
+
+def main() -> None:
+    """The entry point of the command line interface."""
+    parser = argparse.ArgumentParser(prog="python -m filmapi")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser(
+        "serve",
+        help="Serve the API with preloaded worker processes.",
+    )
+    serve_parser.add_argument("--host", default=config.SERVER_HOST)
+    serve_parser.add_argument("--port", type=int, default=config.SERVER_PORT)
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Defaults to SERVER_WORKERS or the number of usable CPUs.",
+    )
+
+    commands.add_parser("migrate", help="Apply the pending schema migrations.")
+
+    import_parser = commands.add_parser(
+        "import",
+        help="Bulk import a CSV or NDJSON film catalog.",
+    )
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--format", choices=["csv", "ndjson"], dest="fmt")
+
+    export_parser = commands.add_parser(
+        "export",
+        help="Stream the catalog as CSV, NDJSON, Parquet or Arrow.",
+    )
+    export_parser.add_argument("-o", "--output", type=Path)
+    export_parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson", "parquet", "arrow"],
+        default="csv",
+        dest="fmt",
+    )
+
+    benchmark_parser = commands.add_parser(
+        "benchmark",
+        help="Compare rendering film pages in Python and in Postgres.",
+    )
+    benchmark_parser.add_argument("--limit", type=int, default=MAX_LIMIT)
+    benchmark_parser.add_argument("--pages", type=int, default=20)
+    benchmark_parser.add_argument("--rounds", type=int, default=5)
+    benchmark_parser.add_argument(
+        "--sort",
+        choices=["id", "title", "release_year"],
+        default="id",
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "serve":
+        sys.exit(serve(args.host, args.port, args.workers))
+
+    read_from_primary.set(True)
+
+    if args.command == "migrate":
+        asyncio.run(migrate_schema())
+    elif args.command == "import":
+        if not (fmt := args.fmt or detect_format(args.path.name)):
+            parser.error("cannot detect the catalog format, pass --format")
+        asyncio.run(import_catalog(args.path, fmt))
+    elif args.command == "export":
+        if args.fmt in COLUMNAR_FORMATS and not columnar_available():
+            parser.error(f"{args.fmt} export requires pyarrow")
+        asyncio.run(export_catalog(args.output, args.fmt))
+    elif args.command == "benchmark":
+        asyncio.run(benchmark_pages(args.limit, args.pages, args.rounds, args.sort))
+
+
+if __name__ == "__main__":
+    main()
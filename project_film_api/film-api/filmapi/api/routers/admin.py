@@ -0,0 +1,94 @@
+"""A module containing administrative endpoints."""
+
+import io
+import tempfile
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from filmapi.api.utils.admin import require_admin_token
+from filmapi.api.utils.streaming import NDJSON_MEDIA_TYPE
+from filmapi.container import Container
+from filmapi.dto.importdto import ImportDTO
+from filmapi.repositories.exportdb import COLUMNAR_FORMATS, columnar_available
+from filmapi.services.iexport import IExportService
+from filmapi.services.iimport import IImportService
+from filmapi.utils.catalog import EXPORT_MEDIA_TYPES, CatalogFormat, ExportFormat
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+CONTENT_TYPE_FORMATS: dict[str, CatalogFormat] = {
+    "text/csv": "csv",
+    NDJSON_MEDIA_TYPE: "ndjson",
+}
+
+
+@router.post("/import", response_model=ImportDTO, status_code=200)
+@inject
+async def import_catalog(
+        request: Request,
+        fmt: CatalogFormat | None = Query(default=None, alias="format"),
+        service: IImportService = Depends(Provide[Container.import_service]),
+) -> ImportDTO:
+    """An endpoint for importing a CSV or NDJSON catalog sent as the body.
+
+    The body is spooled to a temporary file rather than memory, then
+    parsed and copied into the database chunk by chunk.
+
+    Args:
+        request (Request): The request with the catalog body.
+        fmt (CatalogFormat | None): The format, taken from the
+            `Content-Type` header if not given.
+        service (IImportService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 415 if the format is not supported.
+
+    Returns:
+        ImportDTO: The import statistics."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if not (fmt := fmt or CONTENT_TYPE_FORMATS.get(content_type)):
+        raise HTTPException(status_code=415, detail="Unsupported catalog format")
+
+    with tempfile.TemporaryFile() as spool:
+        async for data in request.stream():
+            await run_in_threadpool(spool.write, data)
+        spool.seek(0)
+
+        with io.TextIOWrapper(spool, encoding="utf-8-sig", errors="replace", newline="") as stream:
+            return await service.import_catalog(stream, fmt)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+@inject
+async def export_catalog(
+        fmt: ExportFormat = Query(default="csv", alias="format"),
+        service: IExportService = Depends(Provide[Container.export_service]),
+) -> StreamingResponse:
+    """An endpoint for downloading the whole catalog.
+
+    Args:
+        fmt (ExportFormat): The output format.
+        service (IExportService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 501 if a columnar format is requested without
+            `pyarrow` installed.
+
+    Returns:
+        StreamingResponse: The catalog streamed as it is read."""
+    if fmt in COLUMNAR_FORMATS and not columnar_available():
+        raise HTTPException(status_code=501, detail="Columnar export requires pyarrow")
+
+    return StreamingResponse(
+        service.export_catalog(fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="catalog.{fmt}"'},
+    )
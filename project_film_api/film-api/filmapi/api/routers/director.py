@@ -3,10 +3,19 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 
+from filmapi.api.utils.responses import page_response
 from filmapi.container import Container
 from filmapi.domain.director import Director, DirectorIn
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    NameSearchSort,
+    NameSort,
+)
 from filmapi.services.idirector import IDirectorService
 
 router = APIRouter()
@@ -32,36 +41,53 @@ async def create_director(
     return new_director.model_dump() if new_director else {}
 
 
-@router.get("/all", response_model=Iterable[Director], status_code=200)
+@router.get("/all", response_model=PageDTO[Director], status_code=200)
 @inject
 async def get_all_directors(
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: NameSort = "name",
         service: IDirectorService = Depends(Provide[Container.director_service]),
-) -> Iterable:
-    """An endpoint for getting all directors.
+) -> Response:
+    """An endpoint for getting a page of all directors.
 
     Args:
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (NameSort): The sort key.
         service (IDirectorService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The director attribute collection. """
-    directors = await service.get_all_directors()
-    return directors
+        Response: The page of director attributes with the next page cursor."""
+    directors = await service.get_all_directors(limit=limit, cursor=cursor, sort=sort)
+    return page_response(directors)
 
-@router.get ("/search", response_model=Iterable[Director], status_code=200)
+@router.get ("/search", response_model=PageDTO[Director], status_code=200)
 @inject
 async def get_director_by_name(
         name: str,
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: NameSearchSort = "name",
         service: IDirectorService = Depends(Provide[Container.director_service]),
-) -> Iterable:
+) -> Response:
     """An endpoint for getting directors with the provided text in their name.
 
     Args:
         service (IDirectorService, optional): The injected service dependency
         name (string): Part of director's name.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (NameSearchSort): The sort key.
     Returns:
-        Iterable[Director]: The director attribute collection."""
-    directors = await service.get_director_by_name(name)
-    return directors
+        Response: The page of director attributes with the next page cursor."""
+    directors = await service.get_director_by_name(
+        name,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    return page_response(directors)
 
 
 @router.get("/{director_id}", response_model=Director, status_code=200)
@@ -104,13 +130,11 @@ async def edit_director(
 
     Returns:
         dict: The updated director details."""
-    if await service.get_director_by_id(director_id=director_id):
-        new_director = await service.edit_director(
-            director_id=director_id,
-            data=updated_director,
-        )
-        return new_director.model_dump() if new_director \
-            else {}
+    if new_director := await service.edit_director(
+        director_id=director_id,
+        data=updated_director,
+    ):
+        return new_director.model_dump()
 
     raise HTTPException(status_code=404, detail="Director not found.")
 
@@ -132,8 +156,7 @@ async def delete_director(
         Returns:
             dict: Empty if operation finished.
         """
-    if await service.get_director_by_id(director_id=director_id):
-        await service.delete_director(director_id)
+    if await service.delete_director(director_id):
         return
 
     raise HTTPException(status_code=404, detail="Director not found.")
\ No newline at end of file
@@ -3,12 +3,32 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, Query
-
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from filmapi.api.utils.responses import page_response
+from filmapi.api.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    stream_models,
+    wants_ndjson,
+)
 from filmapi.container import Container
-from filmapi.domain.film import Film, FilmIn
+from filmapi.domain.film import Film, FilmBatchItem, FilmGenresIn, FilmIn
 from filmapi.domain.genre import Genre
+from filmapi.dto.batchdto import BatchDTO
 from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.filmgenresdto import FilmGenresDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.batch import MAX_BATCH_SIZE
+from filmapi.repositories.search import GenreMatch
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    FilmSearchSort,
+    FilmSort,
+    PageRendering,
+)
 from filmapi.services.ifilm import IFilmService
 
 router = APIRouter()
@@ -33,6 +53,36 @@ async def create_film(
 
     return new_film.model_dump() if new_film else {}
 
+@router.post("/batch", response_model=BatchDTO, status_code=201)
+@inject
+async def create_films(
+        films: list[FilmBatchItem] = Body(min_length=1, max_length=MAX_BATCH_SIZE),
+        partial: bool = False,
+        service: IFilmService = Depends(Provide[Container.film_service]),
+) -> BatchDTO:
+    """An endpoint for adding a batch of films in one transaction.
+
+    Args:
+        films (list[FilmBatchItem]): The films data with optional genre ids.
+        partial (bool): Whether to create the valid films when some items
+            are rejected.
+        service (IFilmService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 422 with per-item errors if any item is rejected
+            and `partial` is not set.
+
+    Returns:
+        BatchDTO: The new film ids in input order and per-item errors."""
+    batch = await service.create_films(films, partial=partial)
+    if batch.errors and not partial:
+        raise HTTPException(
+            status_code=422,
+            detail=[error.model_dump() for error in batch.errors],
+        )
+
+    return batch
+
 @router.post("/addgenre", response_model=dict, status_code = 201)
 @inject
 async def add_film_genre(
@@ -47,58 +97,136 @@ async def add_film_genre(
         genre_id (int): A genre's id.
         service (IFilmService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 404 if the film or the genre does not exist.
+
     Returns:
         dict: The film's genres."""
-    if await service.get_film_by_id(film_id=film_id):
-        genres = await service.add_film_genre(film_id, genre_id)
-        if genres is not None:
-            return {"genres": [dict(genre) for genre in genres]}
+    genres = await service.add_film_genre(film_id, genre_id)
+    if genres is not None:
+        return {"genres": [dict(genre) for genre in genres]}
 
     raise HTTPException(status_code=404, detail="Film or genre not found")
 
 
-@router.get("/all", response_model=Iterable[FilmDTO], status_code=200)
+@router.post("/genres", response_model=FilmGenresDTO, status_code=200)
+@inject
+async def set_film_genres(
+        data: FilmGenresIn,
+        service: IFilmService = Depends(Provide[Container.film_service]),
+) -> FilmGenresDTO:
+    """An endpoint for adding, removing or replacing genres of many films.
+
+    Args:
+        data (FilmGenresIn): Genre ids per film and the assignment mode.
+        service (IFilmService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 with the missing ids if any film or genre
+            does not exist, in which case nothing is changed.
+
+    Returns:
+        FilmGenresDTO: The numbers of added and removed film genres."""
+    result = await service.set_film_genres(data)
+    if result.missing_film_ids or result.missing_genre_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=result.model_dump(include={"missing_film_ids", "missing_genre_ids"}),
+        )
+
+    return result
+
+
+@router.get(
+    "/all",
+    response_model=PageDTO[FilmDTO],
+    status_code=200,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 @inject
 async def get_all_films(
+        request: Request,
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: FilmSort = "id",
+        stream: bool = False,
+        render: PageRendering = "app",
         service: IFilmService = Depends(Provide[Container.film_service]),
-) -> Iterable:
-    """An endpoint for getting all films.
+) -> Response:
+    """An endpoint for getting a page of all films or streaming the catalog.
+
+    The whole catalog is streamed when `stream` is set or the client
+    accepts `application/x-ndjson`; the body is then NDJSON or a chunked
+    JSON array, depending on the Accept header. With `render=db` the page
+    is rendered as JSON by Postgres and passed through unchanged.
 
     Args:
+        request (Request): The incoming HTTP request.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (FilmSort): The sort key.
+        stream (bool): Whether to stream every film instead of a page.
+        render (PageRendering): Whether the app or the database renders
+            the page.
         service (IFilmService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The film attribute collection. """
-    films = await service.get_all_films()
-    return films
+        Response: The page of film attributes with the next page cursor,
+            or the streamed catalog. """
+    if stream or wants_ndjson(request):
+        return stream_models(request, service.stream_films())
+
+    if render == "db":
+        return Response(
+            content=await service.get_all_films_json(limit=limit, cursor=cursor, sort=sort),
+            media_type=JSON_MEDIA_TYPE,
+        )
 
-@router.get("", response_model=Iterable[FilmDTO], status_code=200)
+    films = await service.get_all_films(limit=limit, cursor=cursor, sort=sort)
+    return page_response(films)
+
+@router.get("", response_model=PageDTO[FilmDTO], status_code=200)
 @inject
 async def search_films(
         title: str | None = None,
         genre_ids: list[int] | None = Query(default=None),
+        genre_match: GenreMatch = "any",
         director_name: str | None = None,
         year: int | None = None,
+        fulltext: str | None = None,
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: FilmSearchSort | None = None,
         service: IFilmService = Depends(Provide[Container.film_service]),
-) -> Iterable[FilmDTO]:
+) -> Response:
     """The endpoint for searching a film from the repository with various filters.
 
         Args:
             title (str): Part of film's title.
             genre_ids (list[int]): Film's genres.
+            genre_match (GenreMatch): Whether a film needs any or all of the genres.
             director_name (str): Name of the film's director.
             year (int): Release year.
+            fulltext (str): Full-text query over title and description.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSearchSort): The sort key, relevance if `fulltext` is given.
             service (IFilmService, optional): The injected service dependency.
 
         Returns:
-            Iterable[Any]: List of films that match the criteria."""
+            Response: The page of films that match the criteria."""
     films = await service.search_films(
         title=title,
         genre_ids=genre_ids,
+        genre_match=genre_match,
         director_name=director_name,
         year=year,
+        fulltext=fulltext,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
     )
-    return films
+    return page_response(films)
 
 @router.get("/{film_id}/genres", response_model=Iterable[Genre], status_code=200)
 @inject
@@ -112,12 +240,14 @@ async def get_film_genres(
         service (IFilmService, optional): The injected service dependency.
     Returns:
         Iterable[Genre]: The genre attribute collection."""
-    if await service.get_film_by_id(film_id=film_id):
-        genres = await service.get_film_genres(film_id)
-        return genres
+    if film := await service.get_film_by_id(film_id=film_id):
+        return [
+            Genre(id=genre.genre_id, name=genre.genre_name)
+            for genre in film.genres
+        ]
     raise HTTPException(status_code=404, detail="Film not found")
 
-@router.get("/{film_id}", response_model=Film, status_code=200)
+@router.get("/{film_id}", response_model=FilmDTO, status_code=200)
 @inject
 async def get_film_by_id(
         film_id: int,
@@ -133,7 +263,7 @@ async def get_film_by_id(
         HTTPException: 404 if film does not exist.
 
     Returns:
-        Film: The film attribute. """
+        FilmDTO: The film attributes with its director and genres. """
     if film := await service.get_film_by_id(film_id):
         return film.model_dump()
     raise HTTPException(status_code=404, detail="Film not found")
@@ -157,13 +287,11 @@ async def update_film(
 
     Returns:
         dict: The updated film details."""
-    if await service.get_film_by_id(film_id=film_id):
-        new_film = await service.update_film(
-            film_id=film_id,
-            data=updated_film,
-        )
-        return new_film.model_dump() if new_film \
-            else {}
+    if new_film := await service.update_film(
+        film_id=film_id,
+        data=updated_film,
+    ):
+        return new_film.model_dump()
 
     raise HTTPException(status_code=404, detail="Film not found.")
 
@@ -185,8 +313,7 @@ async def delete_film(
         Returns:
             dict: Empty if operation finished.
         """
-    if await service.get_film_by_id(film_id=film_id):
-        await service.delete_film(film_id)
+    if await service.delete_film(film_id):
         return
 
     raise HTTPException(status_code=404, detail="Film not found.")
\ No newline at end of file
@@ -3,10 +3,19 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 
+from filmapi.api.utils.responses import page_response
 from filmapi.container import Container
 from filmapi.domain.genre import Genre, GenreIn
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    NameSearchSort,
+    NameSort,
+)
 from filmapi.services.igenre import IGenreService
 
 router = APIRouter()
@@ -32,36 +41,53 @@ async def create_genre(
     return new_genre.model_dump() if new_genre else {}
 
 
-@router.get("/all", response_model=Iterable[Genre], status_code=200)
+@router.get("/all", response_model=PageDTO[Genre], status_code=200)
 @inject
 async def get_all_genres(
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: NameSort = "name",
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> Iterable:
-    """An endpoint for getting all genres.
+) -> Response:
+    """An endpoint for getting a page of all genres.
 
     Args:
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (NameSort): The sort key.
         service (IGenreService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The genre attribute collection. """
-    genres = await service.get_all_genres()
-    return genres
+        Response: The page of genre attributes with the next page cursor."""
+    genres = await service.get_all_genres(limit=limit, cursor=cursor, sort=sort)
+    return page_response(genres)
 
-@router.get ("/search", response_model=Iterable[Genre], status_code=200)
+@router.get ("/search", response_model=PageDTO[Genre], status_code=200)
 @inject
 async def get_genre_by_name(
         name: str,
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: str | None = None,
+        sort: NameSearchSort = "name",
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> Iterable:
+) -> Response:
     """An endpoint for getting genres with the provided text in their name.
 
     Args:
         service (IGenreService, optional): The injected service dependency
         name (string): Part of genre's name.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (NameSearchSort): The sort key.
     Returns:
-        Iterable[Genre]: The genre attribute collection."""
-    genres = await service.get_genre_by_name(name)
-    return genres
+        Response: The page of genre attributes with the next page cursor."""
+    genres = await service.get_genre_by_name(
+        name,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    return page_response(genres)
 
 
 @router.get("/{genre_id}", response_model=Genre, status_code=200)
@@ -104,13 +130,11 @@ async def edit_genre(
 
     Returns:
         dict: The updated genre details."""
-    if await service.get_by_id(genre_id=genre_id):
-        new_genre = await service.edit_genre(
-            genre_id=genre_id,
-            data=updated_genre,
-        )
-        return new_genre.model_dump() if new_genre \
-            else {}
+    if new_genre := await service.edit_genre(
+        genre_id=genre_id,
+        data=updated_genre,
+    ):
+        return new_genre.model_dump()
 
     raise HTTPException(status_code=404, detail="Genre not found.")
 
@@ -132,8 +156,7 @@ async def delete_genre(
         Returns:
             dict: Empty if operation finished.
         """
-    if await service.get_by_id(genre_id=genre_id):
-        await service.delete_genre(genre_id)
+    if await service.delete_genre(genre_id):
         return
 
     raise HTTPException(status_code=404, detail="Genre not found.")
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""A module containing operational endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Response
+
+from filmapi.api.utils.admin import require_admin_token
+from filmapi.cache.ibackend import ICacheBackend
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.singleflight import SingleFlight
+from filmapi.container import Container
+from filmapi.db import database, replica_database
+from filmapi.repositories.statements import statements
+from filmapi.utils.password import password_hasher
+
+router = APIRouter()
+
+
+@router.get(
+    "/pool",
+    response_model=dict,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_pool_stats() -> dict:
+    """An endpoint for getting database pool statistics.
+
+    Returns:
+        dict: The pool size, wait and checkout statistics, with those of
+            the replica pool under `replica` if one is configured."""
+    if replica_database is database:
+        return database.stats()
+    return {**database.stats(), "replica": replica_database.stats()}
+
+
+@router.get("/ready", response_model=dict, status_code=200)
+async def get_readiness(response: Response) -> dict:
+    """An endpoint reporting whether the instance can take traffic.
+
+    The instance is ready once the schema was checked and every pool was
+    warmed up, until it starts shutting down.
+
+    Args:
+        response (Response): The response, turned into a 503 if not ready.
+
+    Returns:
+        dict: The overall readiness and that of every pool."""
+    pools = {"primary": database.is_warm}
+    if replica_database is not database:
+        pools["replica"] = replica_database.is_warm
+    ready = all(pools.values())
+    if not ready:
+        response.status_code = 503
+    return {"ready": ready, "pools": pools}
+
+
+@router.get(
+    "/queries",
+    response_model=dict,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_query_stats() -> dict:
+    """An endpoint for getting precompiled statement statistics.
+
+    Returns:
+        dict: The call count and timing of every statement."""
+    return statements.stats()
+
+
+@router.get(
+    "/cache",
+    response_model=dict,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+@inject
+async def get_cache_stats(
+        film_cache: TTLCache = Depends(Provide[Container.film_cache]),
+        search_cache: TTLCache = Depends(Provide[Container.search_cache]),
+        read_flights: SingleFlight = Depends(Provide[Container.read_flights]),
+        cache_backend: ICacheBackend = Depends(Provide[Container.cache_backend]),
+) -> dict:
+    """An endpoint for getting entity cache statistics.
+
+    Args:
+        film_cache (TTLCache, optional): The injected film cache.
+        search_cache (TTLCache, optional): The injected search cache.
+        read_flights (SingleFlight, optional): The injected read coalescing
+            group.
+        cache_backend (ICacheBackend, optional): The injected shared cache
+            backend.
+
+    Returns:
+        dict: The size, hit, miss and eviction counters of every cache."""
+    return {
+        "film": film_cache.stats(),
+        "search": search_cache.stats(),
+        "flights": read_flights.stats(),
+        "shared": cache_backend.stats(),
+    }
+
+
+@router.get(
+    "/passwords",
+    response_model=dict,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_password_stats() -> dict:
+    """An endpoint for getting password hashing executor statistics.
+
+    Returns:
+        dict: The concurrency, queue depth and timing of bcrypt operations."""
+    return password_hasher.stats()
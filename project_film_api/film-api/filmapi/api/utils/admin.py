@@ -0,0 +1,23 @@
+"""A module containing the guard of administrative endpoints."""
+
+import secrets
+
+from fastapi import Header, HTTPException
+
+from filmapi.config import config
+
+
+async def require_admin_token(x_admin_token: str | None = Header(default=None)) -> None:
+    """A dependency checking the admin token of a request.
+
+    Args:
+        x_admin_token (str | None): The `X-Admin-Token` header.
+
+    Raises:
+        HTTPException: 403 if admin endpoints are disabled or the token
+            does not match `ADMIN_TOKEN`.
+    """
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, config.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
@@ -0,0 +1,101 @@
+"""A module containing the per-request database connection middleware."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from filmapi.config import config
+from filmapi.db import database, read_from_primary, replica_database
+from filmapi.pool import request_connections
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_COOKIE = "filmapi_primary_until"
+
+
+def _pinned_to_primary(scope: Scope) -> bool:
+    """A function checking whether the client wrote a moment ago.
+
+    Args:
+        scope (Scope): The connection scope.
+
+    Returns:
+        bool: True if the client's read-your-writes window is still open.
+    """
+    until = HTTPConnection(scope).cookies.get(PRIMARY_COOKIE)
+    try:
+        return until is not None and float(until) > time.time()
+    except ValueError:
+        return False
+
+
+class RequestConnectionMiddleware:
+    """An ASGI middleware sharing pooled connections within every request.
+
+    Connections are checked out lazily by the first query of the request
+    and kept for its following queries, so requests answered without the
+    database, such as cache hits, never take one from the pool.
+
+    With a read replica configured, safe requests read from the replica. Other requests and requests of clients that wrote
+    within the last `DB_READ_YOUR_WRITES_WINDOW` seconds stay on the
+    primary; the window is kept in a cookie set on every successful
+    write, so it holds across workers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the incoming ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+        if scope["type"] != "http" or not database.is_connected:
+            await self.app(scope, receive, send)
+            return
+
+        if replica_database is database:
+            async with request_connections():
+                await self.app(scope, receive, send)
+            return
+
+        writes = scope["method"] not in SAFE_METHODS
+        token = read_from_primary.set(writes or _pinned_to_primary(scope))
+        try:
+            async with request_connections():
+                await self.app(scope, receive, self._pin_session(send) if writes else send)
+        finally:
+            read_from_primary.reset(token)
+
+    @staticmethod
+    def _pin_session(send: Send) -> Send:
+        """A method opening the read-your-writes window on a successful write.
+
+        Args:
+            send (Send): The send channel.
+
+        Returns:
+            Send: The send channel adding the window cookie to the response.
+        """
+        window = config.DB_READ_YOUR_WRITES_WINDOW
+
+        async def send_pinned(message: Message) -> None:
+            """A helper adding the cookie to a successful response start."""
+            if window > 0 and message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_COOKIE}={time.time() + window:.3f}; Max-Age={int(window) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        return send_pinned
@@ -0,0 +1,21 @@
+"""A module containing helpers for building responses from DTOs."""
+
+from fastapi.responses import Response
+
+from filmapi.api.utils.streaming import JSON_MEDIA_TYPE
+from filmapi.dto.pagedto import PageDTO
+
+
+def page_response(page: PageDTO) -> Response:
+    """A function rendering a page without validating it again.
+
+    Pages served from a snapshot carry their JSON already, so the items
+    are not serialized once more on every request.
+
+    Args:
+        page (PageDTO): The page.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(content=page.to_json(), media_type=JSON_MEDIA_TYPE)
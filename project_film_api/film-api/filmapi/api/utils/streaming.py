@@ -0,0 +1,137 @@
+"""A module containing helpers for streaming large JSON responses."""
+
+from typing import AsyncIterator
+
+from fastapi import Request
+from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+CHUNK_ROWS = 200
+
+
+def _accepted_types(accept: str) -> dict[str, float]:
+    """A function parsing the media ranges of an Accept header.
+
+    Args:
+        accept (str): The Accept header value.
+
+    Returns:
+        dict[str, float]: The quality of every listed media range.
+    """
+    qualities = {}
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.lower()] = quality
+    return qualities
+
+
+def _quality(qualities: dict[str, float], media_type: str) -> float:
+    """A function finding the quality of a media type in parsed ranges.
+
+    The most specific range matching the type decides, so `*/*` only
+    applies to types which no other range names.
+
+    Args:
+        qualities (dict[str, float]): The qualities by media range.
+        media_type (str): The media type to look up.
+
+    Returns:
+        float: The quality, 0 if no range matches the type.
+    """
+    main_type = media_type.partition("/")[0]
+    for media_range in (media_type, f"{main_type}/*", "*/*"):
+        if media_range in qualities:
+            return qualities[media_range]
+    return 0.0
+
+
+def wants_ndjson(request: Request) -> bool:
+    """A function checking whether the client asked for NDJSON.
+
+    NDJSON is only sent to clients naming it explicitly in the Accept
+    header with a nonzero quality not lower than the one of JSON; a
+    wildcard alone keeps the plain JSON response.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        bool: True if NDJSON is the preferred accepted media type.
+    """
+    qualities = _accepted_types(request.headers.get("accept", ""))
+    ndjson = qualities.get(NDJSON_MEDIA_TYPE, 0.0)
+    return ndjson > 0 and ndjson >= _quality(qualities, JSON_MEDIA_TYPE)
+
+
+async def _ndjson_chunks(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """A generator serializing models into newline delimited JSON chunks.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to serialize.
+
+    Yields:
+        bytes: Up to `CHUNK_ROWS` serialized lines.
+    """
+    chunk = []
+    async for item in items:
+        chunk.append(item.model_dump_json())
+        if len(chunk) == CHUNK_ROWS:
+            yield ("\n".join(chunk) + "\n").encode()
+            chunk.clear()
+
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode()
+
+
+async def _json_array_chunks(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """A generator serializing models into chunks of a single JSON array.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to serialize.
+
+    Yields:
+        bytes: The opening bracket, element chunks and the closing bracket.
+    """
+    yield b"["
+    separator = ""
+    chunk = []
+    async for item in items:
+        chunk.append(separator + item.model_dump_json())
+        separator = ","
+        if len(chunk) == CHUNK_ROWS:
+            yield "".join(chunk).encode()
+            chunk.clear()
+
+    yield ("".join(chunk) + "]").encode()
+
+
+def stream_models(
+        request: Request,
+        items: AsyncIterator[BaseModel],
+) -> StreamingResponse:
+    """A function streaming models in the format negotiated with the client.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        items (AsyncIterator[BaseModel]): The models to stream.
+
+    Returns:
+        StreamingResponse: NDJSON if accepted by the client, a chunked
+            JSON array otherwise.
+    """
+    if wants_ndjson(request):
+        return StreamingResponse(_ndjson_chunks(items), media_type=NDJSON_MEDIA_TYPE)
+
+    return StreamingResponse(_json_array_chunks(items), media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+
+class ICacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Abstract for reading a value from the backend.
+        Args:
+            key (str): The cache key.
+        Returns:
+            bytes | None: The stored value, None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Abstract for storing a value in the backend.
+        Args:
+            key (str): The cache key.
+            value (bytes): The serialized value.
+            ttl (float): Seconds the value is kept for."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Abstract for dropping values from the backend.
+        Args:
+            *keys (str): The cache keys."""
+
+    @abstractmethod
+    async def clear(self, prefix: str = "") -> None:
+        """Abstract for dropping every value whose key has a prefix.
+        Args:
+            prefix (str): The key prefix, every value if empty."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Abstract for getting the backend counters.
+        Returns:
+            dict: The backend statistics."""
+
+    async def close(self) -> None:
+        """The method for releasing the backend resources."""
@@ -0,0 +1,217 @@
+"""A module containing the in-process LRU cache tied to table versions."""
+
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+from filmapi.cache.versions import table_versions
+from filmapi.db import load_fresh, read_from_primary
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """A bounded LRU cache whose entries expire after a time to live.
+
+    The cache is bounded by the total size of its entries. Every entry
+    counts as one unless a size function is given, e.g. the length of the
+    value's JSON for the cache of search results.
+
+    Missing entities are cached too, as `None` with a shorter time to live,
+    so repeated lookups of unknown ids do not reach the database either.
+
+    Every entry also remembers the versions of the tables it was read from
+    and is dropped as soon as any of them changes, so a write committed by
+    any worker invalidates it in every worker, not only in the one which
+    made the write.
+
+    Values read from the primary and from the replica are kept apart, so
+    a caller pinned to the primary never gets one read from a lagging
+    replica.
+    """
+
+    def __init__(
+            self,
+            maxsize: int,
+            ttl: float,
+            negative_ttl: float | None = None,
+            tables: Iterable[str] = (),
+            size_of: Callable[[ValueT], int] | None = None,
+    ) -> None:
+        """The initializer of the cache.
+
+        Args:
+            maxsize (int): The maximum total size of the entries.
+            ttl (float): Seconds a found value is kept for.
+            negative_ttl (float | None): Seconds a missing value is kept
+                for, `ttl` if None.
+            tables (Iterable[str]): The tables the values are read from.
+            size_of (Callable[[ValueT], int] | None): The size of a found
+                value, one for every value if None.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.tables = tuple(tables)
+        self._size_of = size_of
+        self._entries: OrderedDict[
+            tuple[bool, KeyT], tuple[tuple[int, ...], float, int, ValueT | None]
+        ] = (
+            OrderedDict()
+        )
+        self._generation = 0
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _versions(self) -> tuple[int, ...]:
+        """A method reading the current versions of the tables.
+
+        Returns:
+            tuple[int, ...]: The versions in the order of `tables`.
+        """
+        return tuple(table_versions.get(table) for table in self.tables)
+
+    def _drop(self, entry_key: tuple[bool, KeyT]) -> None:
+        """A method removing an entry if it is stored.
+
+        Args:
+            entry_key (tuple[bool, KeyT]): The entry key, prefixed with
+                whether the value was read from the primary.
+        """
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def lookup(self, key: KeyT) -> tuple[bool, ValueT | None]:
+        """A method looking a key up.
+
+        Args:
+            key (KeyT): The cache key.
+
+        Returns:
+            tuple[bool, ValueT | None]: Whether the key was found and
+                the cached value, which is None for a missing entity.
+        """
+        entry_key = (read_from_primary.get(), key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        versions, expires, _, value = entry
+        if versions != self._versions():
+            self._drop(entry_key)
+            self.invalidations += 1
+            self.misses += 1
+            return False, None
+        if expires <= time.monotonic():
+            self._drop(entry_key)
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return True, value
+
+    def store(
+            self,
+            key: KeyT,
+            value: ValueT | None,
+            versions: tuple[int, ...] | None = None,
+    ) -> None:
+        """A method storing a value, evicting least recently used entries.
+
+        A value larger than the whole cache is not stored.
+
+        Args:
+            key (KeyT): The cache key.
+            value (ValueT | None): The value, None for a missing entity.
+            versions (tuple[int, ...] | None): The table versions the
+                value was read at, the current ones if None.
+        """
+        size = 1 if value is None or self._size_of is None else self._size_of(value)
+        if size > self.maxsize:
+            return
+
+        if versions is None:
+            versions = self._versions()
+        ttl = self.ttl if value is not None else self.negative_ttl
+        entry_key = (read_from_primary.get(), key)
+        self._drop(entry_key)
+        self._entries[entry_key] = (versions, time.monotonic() + ttl, size, value)
+        self.size += size
+        while self.size > self.maxsize:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, *keys: KeyT) -> None:
+        """A method dropping the given keys.
+
+        Args:
+            *keys (KeyT): The keys to drop.
+        """
+        self._generation += 1
+        for key in keys:
+            self._drop((False, key))
+            self._drop((True, key))
+
+    def clear(self) -> None:
+        """A method dropping every entry."""
+        self._generation += 1
+        self._entries.clear()
+        self.size = 0
+
+    async def get_or_load(
+            self,
+            key: KeyT,
+            load: Callable[[], Awaitable[ValueT | None]],
+    ) -> ValueT | None:
+        """A method reading a value through the cache.
+
+        A value loaded while the cache was invalidated is returned but not
+        stored, and the table versions are read before loading, so a write
+        racing the load never leaves a stale entry. Right after a change of
+        the tables the value is loaded from the primary.
+
+        Args:
+            key (KeyT): The cache key.
+            load (Callable[[], Awaitable[ValueT | None]]): The loader
+                called on a miss.
+
+        Returns:
+            ValueT | None: The cached or loaded value.
+        """
+        found, value = self.lookup(key)
+        if found:
+            return value
+
+        generation = self._generation
+        versions = self._versions()
+        value = await load_fresh(self.tables, load)
+        if generation == self._generation:
+            self.store(key, value, versions)
+        return value
+
+    def stats(self) -> dict:
+        """A method returning the cache counters.
+
+        Returns:
+            dict: The entry count, size, hit, miss, eviction, expiration
+                and invalidation counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
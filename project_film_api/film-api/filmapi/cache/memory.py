@@ -0,0 +1,78 @@
+"""A module containing the in-process stand-in for a shared cache backend."""
+
+import time
+from collections import OrderedDict
+
+from filmapi.cache.ibackend import ICacheBackend
+
+
+class MemoryBackend(ICacheBackend):
+    """A bounded LRU backend private to the process.
+
+    It stores the same serialized bytes as the shared backends, so it can
+    replace them in a single worker setup or when no shared storage is
+    available.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """The initializer of the backend.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> bytes | None:
+        """The method for reading a value.
+            Args:
+                key (str): The cache key.
+            Returns:
+                bytes | None: The stored value, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """The method for storing a value.
+            Args:
+                key (str): The cache key.
+                value (bytes): The serialized value.
+                ttl (float): Seconds the value is kept for."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        """The method for dropping values.
+            Args:
+                *keys (str): The cache keys."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self, prefix: str = "") -> None:
+        """The method for dropping every value whose key has a prefix.
+            Args:
+                prefix (str): The key prefix, every value if empty."""
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        """The method for getting the backend counters.
+            Returns:
+                dict: The size, hit and miss counters."""
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,96 @@
+"""A module containing the cache backend on a Redis-compatible server."""
+
+import re
+
+from filmapi.cache.ibackend import ICacheBackend
+
+try:
+    from redis import asyncio as aioredis  # type: ignore
+except ImportError:  # pragma: no cover
+    aioredis = None
+
+KEY_PREFIX = "filmapi:"
+CLEAR_SCAN_COUNT = 1000
+
+
+def redis_available() -> bool:
+    """A function checking whether the optional `redis` client is installed.
+
+    Returns:
+        bool: True if the Redis backend is available.
+    """
+    return aioredis is not None
+
+
+class RedisBackend(ICacheBackend):
+    """A backend storing the values on a Redis-compatible server.
+
+    Unlike the shared memory backend it is shared by every host, at the
+    cost of a network round trip per lookup. The `redis` client is an
+    optional dependency, so the app creates the backend at startup and
+    refuses to start if `CACHE_BACKEND` is `redis` without it.
+    """
+
+    def __init__(self, url: str) -> None:
+        """The initializer of the backend.
+
+        Args:
+            url (str): The server URL, e.g. `redis://localhost:6379/0`.
+        """
+        if not redis_available():
+            raise RuntimeError("The Redis cache backend needs the `redis` package")
+        self._client = aioredis.from_url(url)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> bytes | None:
+        """The method for reading a value.
+            Args:
+                key (str): The cache key.
+            Returns:
+                bytes | None: The stored value, None if missing or expired."""
+        value = await self._client.get(KEY_PREFIX + key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """The method for storing a value.
+            Args:
+                key (str): The cache key.
+                value (bytes): The serialized value.
+                ttl (float): Seconds the value is kept for."""
+        await self._client.set(KEY_PREFIX + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, *keys: str) -> None:
+        """The method for dropping values.
+            Args:
+                *keys (str): The cache keys."""
+        if keys:
+            await self._client.delete(*(KEY_PREFIX + key for key in keys))
+
+    async def clear(self, prefix: str = "") -> None:
+        """The method for dropping every value whose key has a prefix.
+            Args:
+                prefix (str): The key prefix, every value if empty."""
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", KEY_PREFIX + prefix) + "*"
+        keys = []
+        async for key in self._client.scan_iter(match=pattern, count=CLEAR_SCAN_COUNT):
+            keys.append(key)
+            if len(keys) == CLEAR_SCAN_COUNT:
+                await self._client.unlink(*keys)
+                keys.clear()
+        if keys:
+            await self._client.unlink(*keys)
+
+    def stats(self) -> dict:
+        """The method for getting the backend counters of this worker.
+            Returns:
+                dict: The hit and miss counters."""
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+    async def close(self) -> None:
+        """The method for closing the server connections."""
+        await self._client.aclose()
@@ -0,0 +1,159 @@
+"""A module containing the entity cache kept in a shared backend."""
+
+import hashlib
+import json
+import os
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+from filmapi.cache.ibackend import ICacheBackend
+from filmapi.db import read_from_primary
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+GENERATION_TTL = 30 * 24 * 3600.0
+
+
+def schema_hash(*models: type[BaseModel]) -> str:
+    """A function fingerprinting the JSON schemas of cached models.
+
+    A backend outliving the process stores the fingerprint next to the
+    values, so a release changing what is cached never reads what an
+    older one wrote.
+
+    Args:
+        *models (type[BaseModel]): The models of the cached values.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    schemas = json.dumps([model.model_json_schema() for model in models], sort_keys=True)
+    return hashlib.blake2b(schemas.encode(), digest_size=8).hexdigest()
+
+
+class SharedCache(Generic[ModelT]):
+    """A cache of one kind of entity stored as JSON in a shared backend.
+
+    Values are kept as serialized bytes, so every worker using the same
+    backend reads what any of them loaded. A missing entity is stored as
+    an empty value with a shorter time to live. Values read from the
+    primary and from the replica are stored under different keys, so a
+    caller pinned to the primary never gets one read from a lagging
+    replica.
+
+    The namespace has a generation stored in the backend and replaced on
+    every invalidation. Every value is stored with the generation read
+    before it was loaded and only served while that generation is still
+    current, so a load racing an invalidation in any worker never leaves
+    a stale value behind.
+    """
+
+    def __init__(
+            self,
+            backend: ICacheBackend,
+            namespace: str,
+            model: type[ModelT],
+            ttl: float,
+            negative_ttl: float,
+    ) -> None:
+        """The initializer of the cache.
+
+        Args:
+            backend (ICacheBackend): The backend storing the values.
+            namespace (str): The key prefix of the entity kind.
+            model (type[ModelT]): The model the values are parsed into.
+            ttl (float): Seconds a found value is kept for.
+            negative_ttl (float): Seconds a missing value is kept for.
+        """
+        self._backend = backend
+        self.namespace = namespace
+        self._model = model
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._generation_key = f"{namespace}:generation"
+
+    def _key(self, key: Hashable, primary: bool) -> str:
+        """A method building the backend key of an entity.
+
+        Args:
+            key (Hashable): The entity key.
+            primary (bool): Whether the value is read from the primary.
+
+        Returns:
+            str: The namespaced key.
+        """
+        return f"{self.namespace}:{'primary' if primary else 'replica'}:{key}"
+
+    async def _generation(self) -> bytes:
+        """A method reading the current generation of the namespace.
+
+        A generation lost from the backend, e.g. evicted, is replaced by a
+        new one, so no value stored before can match it.
+
+        Returns:
+            bytes: The generation.
+        """
+        generation = await self._backend.get(self._generation_key)
+        if not generation:
+            generation = await self._new_generation()
+        return generation
+
+    async def _new_generation(self) -> bytes:
+        """A method replacing the generation of the namespace.
+
+        Returns:
+            bytes: The new generation.
+        """
+        generation = os.urandom(8).hex().encode()
+        await self._backend.set(self._generation_key, generation, GENERATION_TTL)
+        return generation
+
+    async def get_or_load(
+            self,
+            key: Hashable,
+            load: Callable[[], Awaitable[ModelT | None]],
+    ) -> ModelT | None:
+        """A method reading an entity through the cache.
+
+        Args:
+            key (Hashable): The entity key.
+            load (Callable[[], Awaitable[ModelT | None]]): The loader
+                called on a miss.
+
+        Returns:
+            ModelT | None: The cached or loaded entity.
+        """
+        backend_key = self._key(key, read_from_primary.get())
+        data = await self._backend.get(backend_key)
+        generation = await self._generation()
+        if data is not None:
+            stored_generation, _, payload = data.partition(b":")
+            if stored_generation == generation:
+                return self._model.model_validate_json(payload) if payload else None
+
+        value = await load()
+        if value is None:
+            await self._backend.set(backend_key, generation + b":", self.negative_ttl)
+        else:
+            await self._backend.set(
+                backend_key,
+                generation + b":" + value.model_dump_json().encode(),
+                self.ttl,
+            )
+        return value
+
+    async def invalidate(self, *keys: Hashable) -> None:
+        """A method dropping the given entities.
+
+        Args:
+            *keys (Hashable): The entity keys.
+        """
+        await self._new_generation()
+        await self._backend.delete(
+            *(self._key(key, primary) for key in keys for primary in (False, True))
+        )
+
+    async def clear(self) -> None:
+        """A method dropping every entity of the namespace."""
+        await self._backend.clear(f"{self.namespace}:")
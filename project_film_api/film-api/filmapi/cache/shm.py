@@ -0,0 +1,326 @@
+"""A module containing the cache backend shared by the workers of a host."""
+
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterator
+
+from filmapi.cache.ibackend import ICacheBackend
+
+MAGIC = b"FILMSHM2"
+# magic, schema hash, slot size, slot count
+HEADER = struct.Struct("<8s16sII")
+HEADER_SIZE = 64
+# sequence, expiry timestamp, key hash, key length, value length
+SLOT = struct.Struct("<QdQII")
+SEQUENCE = struct.Struct("<Q")
+PROBES = 8
+READ_RETRIES = 16
+LOCK_RETRY_DELAY = 0.0005
+
+
+def _hash(key: bytes) -> int:
+    """A function hashing a key the same way in every process.
+
+    Args:
+        key (bytes): The encoded key.
+
+    Returns:
+        int: The non-zero 64-bit hash, zero marks an empty slot.
+    """
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryBackend(ICacheBackend):
+    """A fixed-size hash table in a memory-mapped file.
+
+    Every worker maps the same file, ideally on tmpfs such as `/dev/shm`,
+    so a value stored by one worker is read by the others straight from
+    memory. A key lives in one of a few slots next to its hash position;
+    when they are all taken the entry closest to expiry is replaced.
+
+    Writers serialize on an exclusive `flock` of the file, taken without
+    blocking and retried after a short sleep, so a worker waiting for it
+    keeps serving other requests. Readers take no lock: each slot carries
+    a sequence number that is odd while the slot is written, and a read
+    is retried if the number was odd or changed while the slot was copied.
+
+    The header holds the schema hash of the cached models and the layout,
+    and the file is named after them, so workers of another release or
+    with other settings use a file of their own. A file is created
+    complete under a temporary name and then linked into place, so it is
+    never resized while another worker has it mapped.
+    """
+
+    def __init__(self, path: str, size: int, slot_size: int, schema: str) -> None:
+        """The initializer of the backend.
+
+        Args:
+            path (str): The path prefix of the shared file.
+            size (int): The size of the file in bytes.
+            slot_size (int): The size of a slot, bounding the size of the
+                key and value stored in it.
+            schema (str): The schema hash of the cached models.
+        """
+        self.slot_size = slot_size
+        self.slot_count = (size - HEADER_SIZE) // slot_size
+        self._capacity = slot_size - SLOT.size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversized = 0
+        self.lock_waits = 0
+
+        length = HEADER_SIZE + self.slot_count * slot_size
+        header = HEADER.pack(MAGIC, schema.encode(), slot_size, self.slot_count)
+        self.path = f"{path}-{hashlib.blake2b(header, digest_size=8).hexdigest()}"
+        if not os.path.exists(self.path):
+            self._create(header, length)
+        self._fd = os.open(self.path, os.O_RDWR)
+        if (
+            os.fstat(self._fd).st_size != length
+            or os.pread(self._fd, HEADER.size, 0) != header
+        ):
+            os.close(self._fd)
+            raise RuntimeError(f"Shared cache file {self.path} has an unexpected layout")
+        self._map = mmap.mmap(self._fd, length)
+
+    def _create(self, header: bytes, length: int) -> None:
+        """A method creating the shared file unless another worker did.
+
+        Args:
+            header (bytes): The file header.
+            length (int): The file size.
+        """
+        directory, name = os.path.split(self.path)
+        fd, temporary = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.")
+        try:
+            os.ftruncate(fd, length)
+            os.pwrite(fd, header, 0)
+            os.link(temporary, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            os.close(fd)
+            os.unlink(temporary)
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[None]:
+        """A context manager holding the exclusive writer lock."""
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                self.lock_waits += 1
+                await asyncio.sleep(LOCK_RETRY_DELAY)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offsets(self, key_hash: int) -> Iterator[int]:
+        """A method listing the slots a key may be stored in.
+
+        Args:
+            key_hash (int): The key hash.
+
+        Yields:
+            int: The slot offsets.
+        """
+        start = key_hash % self.slot_count
+        for probe in range(PROBES):
+            yield HEADER_SIZE + (start + probe) % self.slot_count * self.slot_size
+
+    def _read(self, offset: int, key_hash: int, key: bytes) -> bytes | None:
+        """A method reading a slot without locking.
+
+        Args:
+            offset (int): The slot offset.
+            key_hash (int): The key hash.
+            key (bytes): The encoded key.
+
+        Returns:
+            bytes | None: The value if the slot holds the live key.
+        """
+        for _ in range(READ_RETRIES):
+            sequence, expires, slot_hash, key_length, value_length = (
+                SLOT.unpack_from(self._map, offset)
+            )
+            if sequence & 1:
+                continue
+            if slot_hash != key_hash or key_length != len(key):
+                return None
+            if key_length + value_length > self._capacity:
+                continue
+
+            start = offset + SLOT.size
+            data = self._map[start:start + key_length + value_length]
+            if SEQUENCE.unpack_from(self._map, offset)[0] != sequence:
+                continue
+            if data[:key_length] != key or expires <= time.time():
+                return None
+            return data[key_length:]
+        return None
+
+    def _write(
+            self,
+            offset: int,
+            key_hash: int = 0,
+            data: bytes = b"",
+            key_length: int = 0,
+            expires: float = 0.0,
+    ) -> None:
+        """A method writing a slot, the writer lock has to be held.
+
+        Args:
+            offset (int): The slot offset.
+            key_hash (int): The key hash, zero to empty the slot.
+            data (bytes): The key followed by the value.
+            key_length (int): The length of the key in `data`.
+            expires (float): The expiry timestamp.
+        """
+        sequence = SEQUENCE.unpack_from(self._map, offset)[0]
+        SEQUENCE.pack_into(self._map, offset, sequence + 1)
+        SLOT.pack_into(
+            self._map,
+            offset,
+            sequence + 1,
+            expires,
+            key_hash,
+            key_length,
+            len(data) - key_length,
+        )
+        self._map[offset + SLOT.size:offset + SLOT.size + len(data)] = data
+        SEQUENCE.pack_into(self._map, offset, sequence + 2)
+
+    def _expires(self, offset: int) -> float:
+        """A method reading the expiry of a slot, under the lock.
+
+        Args:
+            offset (int): The slot offset.
+
+        Returns:
+            float: The expiry timestamp, zero for an empty slot.
+        """
+        _, expires, slot_hash, _, _ = SLOT.unpack_from(self._map, offset)
+        return expires if slot_hash else 0.0
+
+    def _holds(self, offset: int, key_hash: int, key: bytes) -> bool:
+        """A method checking whether a slot holds a key, under the lock.
+
+        Args:
+            offset (int): The slot offset.
+            key_hash (int): The key hash.
+            key (bytes): The encoded key.
+
+        Returns:
+            bool: True if the slot holds the key.
+        """
+        _, _, slot_hash, key_length, _ = SLOT.unpack_from(self._map, offset)
+        start = offset + SLOT.size
+        return (
+            slot_hash == key_hash
+            and key_length == len(key)
+            and self._map[start:start + key_length] == key
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        """The method for reading a value.
+            Args:
+                key (str): The cache key.
+            Returns:
+                bytes | None: The stored value, None if missing or expired."""
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        for offset in self._offsets(key_hash):
+            value = self._read(offset, key_hash, encoded)
+            if value is not None:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """The method for storing a value.
+            A value too large for a slot is not stored and drops the
+            previous value of the key.
+            Args:
+                key (str): The cache key.
+                value (bytes): The serialized value.
+                ttl (float): Seconds the value is kept for."""
+        encoded = key.encode()
+        if len(encoded) + len(value) > self._capacity:
+            self.oversized += 1
+            await self.delete(key)
+            return
+
+        key_hash = _hash(encoded)
+        now = time.time()
+        async with self._locked():
+            offsets = list(self._offsets(key_hash))
+            target = next(
+                (offset for offset in offsets if self._holds(offset, key_hash, encoded)),
+                None,
+            )
+            if target is None:
+                target = min(offsets, key=self._expires)
+                if self._expires(target) > now:
+                    self.evictions += 1
+            self._write(target, key_hash, encoded + value, len(encoded), now + ttl)
+
+    async def delete(self, *keys: str) -> None:
+        """The method for dropping values.
+            Args:
+                *keys (str): The cache keys."""
+        async with self._locked():
+            for key in keys:
+                encoded = key.encode()
+                key_hash = _hash(encoded)
+                for offset in self._offsets(key_hash):
+                    if self._holds(offset, key_hash, encoded):
+                        self._write(offset)
+
+    async def clear(self, prefix: str = "") -> None:
+        """The method for dropping every value whose key has a prefix.
+            Args:
+                prefix (str): The key prefix, every value if empty."""
+        encoded = prefix.encode()
+        async with self._locked():
+            for slot in range(self.slot_count):
+                offset = HEADER_SIZE + slot * self.slot_size
+                _, _, slot_hash, key_length, _ = SLOT.unpack_from(self._map, offset)
+                start = offset + SLOT.size
+                if (
+                    slot_hash
+                    and key_length >= len(encoded)
+                    and self._map[start:start + len(encoded)] == encoded
+                ):
+                    self._write(offset)
+
+    def stats(self) -> dict:
+        """The method for getting the backend counters of this worker.
+            Returns:
+                dict: The layout, hit, miss and eviction counters."""
+        return {
+            "backend": "shm",
+            "path": self.path,
+            "slots": self.slot_count,
+            "slot_size": self.slot_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "oversized": self.oversized,
+            "lock_waits": self.lock_waits,
+        }
+
+    async def close(self) -> None:
+        """The method for unmapping the shared file."""
+        self._map.close()
+        os.close(self._fd)
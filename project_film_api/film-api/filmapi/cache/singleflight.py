@@ -0,0 +1,88 @@
+"""A module coalescing identical concurrent reads into a single load."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from filmapi.db import read_from_primary
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+_LEADER_CANCELLED = object()
+
+
+class _Flight:
+    """A load in progress, run by the caller which started it."""
+
+    def __init__(self) -> None:
+        """The initializer of the flight."""
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class SingleFlight(Generic[KeyT, ValueT]):
+    """A group of loads in which identical concurrent calls share one load.
+
+    The first caller of a key runs the load itself, in its own task and
+    with its own request connection, and later callers of the same key
+    await its result instead of loading again. The result or exception is
+    handed to every waiter and forgotten once done, so failures are never
+    cached. If the running caller is cancelled, a waiter takes over and
+    loads again.
+
+    Loads are grouped per database they read from, so a caller pinned to
+    the primary never receives a value read from a lagging replica.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the group."""
+        self._flights: dict[tuple[bool, KeyT], _Flight] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def do(self, key: KeyT, load: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        """A method loading a value, joining an identical load in progress.
+
+        Args:
+            key (KeyT): The key identifying identical loads.
+            load (Callable[[], Awaitable[ValueT]]): The loader called if no
+                load of the key is in progress.
+
+        Returns:
+            ValueT: The loaded value.
+        """
+        flight_key = (read_from_primary.get(), key)
+        while (flight := self._flights.get(flight_key)) is not None:
+            self.coalesced += 1
+            value = await asyncio.shield(flight.result)
+            if value is not _LEADER_CANCELLED:
+                return value
+
+        flight = self._flights[flight_key] = _Flight()
+        self.loads += 1
+        try:
+            value = await load()
+        except Exception as e:
+            flight.result.set_exception(e)
+            # Marks the exception as retrieved in case nobody awaits it.
+            flight.result.exception()
+            raise
+        except BaseException:
+            flight.result.set_result(_LEADER_CANCELLED)
+            raise
+        else:
+            flight.result.set_result(value)
+            return value
+        finally:
+            del self._flights[flight_key]
+
+    def stats(self) -> dict:
+        """A method returning the coalescing counters.
+
+        Returns:
+            dict: The in-flight, load and coalesced call counters.
+        """
+        return {
+            "in_flight": len(self._flights),
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,150 @@
+"""A module containing versioned in-memory snapshots of small tables."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Generic, Iterable, Mapping, TypeVar
+
+from pydantic import BaseModel
+
+from filmapi.cache.versions import table_versions
+from filmapi.db import load_fresh
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import paginate_sorted
+
+ItemT = TypeVar("ItemT", bound=BaseModel)
+
+
+class Snapshot(Generic[ItemT]):
+    """An immutable copy of a table, sorted and serialized up front."""
+
+    def __init__(
+            self,
+            version: int,
+            items: Iterable[ItemT],
+            sort_keys: Mapping[str, Callable[[ItemT], Any]],
+    ) -> None:
+        """The initializer of the snapshot.
+
+        Args:
+            version (int): The table version the items were read at.
+            items (Iterable[ItemT]): The table rows.
+            sort_keys (Mapping[str, Callable[[ItemT], Any]]): The sort
+                value getters by sort key name.
+        """
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.sort_keys = sort_keys
+        self.by_id: dict[int, ItemT] = {item.id: item for item in items}
+        self.serialized = {
+            item_id: item.model_dump_json().encode()
+            for item_id, item in self.by_id.items()
+        }
+        self.sorted: dict[str, tuple[list[tuple[Any, int]], list[ItemT]]] = {}
+        for sort, sort_key in sort_keys.items():
+            keyed = sorted((sort_key(item), item.id) for item in self.by_id.values())
+            self.sorted[sort] = (keyed, [self.by_id[item_id] for _, item_id in keyed])
+
+    def page(
+            self,
+            sort: str,
+            limit: int,
+            cursor: str | None = None,
+            match: Callable[[ItemT], bool] | None = None,
+            rank: Callable[[ItemT], float] | None = None,
+    ) -> PageDTO:
+        """A method returning a page of the snapshot items.
+
+        Args:
+            sort (str): The sort key name, ignored if `rank` is given.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            match (Callable[[ItemT], bool] | None): The item filter.
+            rank (Callable[[ItemT], float] | None): The relevance of an
+                item, lower first, used instead of a sort key.
+
+        Returns:
+            PageDTO: The page with its JSON already rendered.
+        """
+        if rank:
+            keyed = sorted(
+                (rank(item), item.id)
+                for item in self.by_id.values()
+                if match is None or match(item)
+            )
+            keys, items = keyed, [self.by_id[item_id] for _, item_id in keyed]
+        else:
+            keys, items = self.sorted[sort]
+            if match:
+                pairs = [(key, item) for key, item in zip(keys, items) if match(item)]
+                keys = [key for key, _ in pairs]
+                items = [item for _, item in pairs]
+
+        return paginate_sorted(keys, items, sort, limit, cursor, self.serialized)
+
+
+class TableSnapshot(Generic[ItemT]):
+    """A holder refreshing the snapshot of a table when its version changes.
+
+    A new snapshot is built aside and swapped in with a single assignment,
+    so readers always see a complete one. A reload right after a change
+    of the table reads from the primary.
+    """
+
+    def __init__(
+            self,
+            table: str,
+            load: Callable[[], Awaitable[Iterable[ItemT]]],
+            sort_keys: Mapping[str, Callable[[ItemT], Any]],
+            max_age: float,
+    ) -> None:
+        """The initializer of the holder.
+
+        Args:
+            table (str): The table name the version is tracked under.
+            load (Callable[[], Awaitable[Iterable[ItemT]]]): The loader
+                reading every row of the table.
+            sort_keys (Mapping[str, Callable[[ItemT], Any]]): The sort
+                value getters by sort key name.
+            max_age (float): Seconds after which the snapshot is reloaded
+                even if no change was noticed.
+        """
+        self.table = table
+        self._load = load
+        self._sort_keys = sort_keys
+        self._max_age = max_age
+        self._snapshot: Snapshot[ItemT] | None = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, snapshot: Snapshot[ItemT] | None) -> bool:
+        """A method checking whether a snapshot can still be served.
+
+        Args:
+            snapshot (Snapshot[ItemT] | None): The snapshot.
+
+        Returns:
+            bool: True if the table did not change and the snapshot
+                is not too old.
+        """
+        return (
+            snapshot is not None
+            and snapshot.version == table_versions.get(self.table)
+            and time.monotonic() - snapshot.loaded_at < self._max_age
+        )
+
+    async def get(self) -> Snapshot[ItemT]:
+        """A method returning the current snapshot, reloading it if needed.
+
+        Concurrent callers noticing a change wait for a single reload.
+
+        Returns:
+            Snapshot[ItemT]: The snapshot.
+        """
+        if self._is_fresh(self._snapshot):
+            return self._snapshot
+
+        async with self._lock:
+            if not self._is_fresh(self._snapshot):
+                version = table_versions.get(self.table)
+                items = await load_fresh((self.table,), self._load)
+                self._snapshot = Snapshot(version, items, self._sort_keys)
+            return self._snapshot
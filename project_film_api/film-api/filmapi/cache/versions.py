@@ -0,0 +1,137 @@
+"""A module tracking the versions of the catalog tables."""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Iterable
+
+import asyncpg  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+TABLE_CHANGED_CHANNEL = "table_changed"
+LISTEN_RETRY_DELAY = 5.0
+
+
+class TableVersions:
+    """A set of per-table version counters kept in sync across workers.
+
+    Every catalog table has a statement-level trigger sending its name on
+    the `table_changed` channel, so a write committed by any process bumps
+    the version in every worker listening here. Writes made through this
+    process bump the version right away, without waiting for the
+    notification. Versions only ever grow, so comparing a stored version
+    with the current one tells whether the table changed since.
+
+    The time of the last change of every table is kept too, so loads made
+    right after a change can avoid a replica which has not replayed it.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the version counters."""
+        self._versions: dict[str, int] = {}
+        self._epoch = 0
+        self._changed_at: dict[str, float] = {}
+        self._all_changed_at = -math.inf
+        self._task: asyncio.Task | None = None
+
+    def get(self, table: str) -> int:
+        """A method returning the current version of a table.
+
+        Args:
+            table (str): The table name.
+
+        Returns:
+            int: The version.
+        """
+        return self._epoch + self._versions.get(table, 0)
+
+    def bump(self, *tables: str) -> None:
+        """A method marking tables as changed.
+
+        Args:
+            *tables (str): The changed table names.
+        """
+        now = time.monotonic()
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+            self._changed_at[table] = now
+
+    def bump_all(self) -> None:
+        """A method marking every table as changed."""
+        self._epoch += 1
+        self._all_changed_at = time.monotonic()
+
+    def changed_within(self, tables: Iterable[str], seconds: float) -> bool:
+        """A method checking whether any of the tables changed lately.
+
+        Args:
+            tables (Iterable[str]): The table names.
+            seconds (float): The length of the period.
+
+        Returns:
+            bool: True if any of the tables changed in the last `seconds`.
+        """
+        since = time.monotonic() - seconds
+        return self._all_changed_at > since or any(
+            self._changed_at.get(table, -math.inf) > since for table in tables
+        )
+
+    def _notified(self, _: object, __: int, ___: str, table: str) -> None:
+        """A callback bumping the table named in a notification.
+
+        Args:
+            table (str): The notification payload.
+        """
+        self.bump(table)
+
+    async def _listen(self, dsn: str) -> None:
+        """A method listening for table changes until cancelled.
+
+        Every table is bumped after (re)connecting, since notifications
+        sent while disconnected are lost.
+
+        Args:
+            dsn (str): The database connection string.
+        """
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(TABLE_CHANGED_CHANNEL, self._notified)
+                self.bump_all()
+                await closed.wait()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Listening for table changes failed: %s", e)
+            finally:
+                if connection is not None:
+                    await connection.close()
+
+            self.bump_all()
+            await asyncio.sleep(LISTEN_RETRY_DELAY)
+
+    def start(self, dsn: str) -> None:
+        """A method starting the background listener.
+
+        Args:
+            dsn (str): The database connection string.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(dsn))
+
+    async def stop(self) -> None:
+        """A method stopping the background listener."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+table_versions = TableVersions()
+
@@ -1,6 +1,6 @@
 
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,5 +14,45 @@ class AppConfig(BaseConfig):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
 
-
-config = AppConfig()
\ No newline at end of file
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_MAX_CONNECTIONS: int = 90
+    DB_POOL_ACQUIRE_TIMEOUT: float = 10.0
+    DB_POOL_MAX_QUERIES: int = 50000
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_CONNECT_RETRIES: int = 10
+    DB_CONNECT_BASE_DELAY: float = 0.1
+    DB_CONNECT_MAX_DELAY: float = 5.0
+    DB_ECHO: bool = False
+    DB_REPLICA_URL: Optional[str] = None
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+
+    CACHE_MAXSIZE: int = 10000
+    CACHE_TTL: float = 60.0
+    CACHE_NEGATIVE_TTL: float = 5.0
+    SNAPSHOT_MAX_AGE: float = 300.0
+    SEARCH_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    SEARCH_CACHE_TTL: float = 60.0
+    CACHE_BACKEND: Literal["shm", "redis", "memory"] = "shm"
+    CACHE_SHM_PATH: str = "/dev/shm/filmapi-cache"
+    CACHE_SHM_SIZE: int = 32 * 1024 * 1024
+    CACHE_SHM_SLOT_SIZE: int = 4096
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE: int = 65
+    SERVER_ACCESS_LOG: bool = False
+
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    ADMIN_TOKEN: Optional[str] = None
+
+
+config = AppConfig()
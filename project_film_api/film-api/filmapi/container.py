@@ -1,15 +1,29 @@
 """Module providing containers injecting dependencies."""
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, List, Selector, Singleton
+
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.memory import MemoryBackend
+from filmapi.cache.rediscache import RedisBackend
+from filmapi.cache.shared import SharedCache, schema_hash
+from filmapi.cache.shm import SharedMemoryBackend
+from filmapi.cache.singleflight import SingleFlight
+from filmapi.config import config
+from filmapi.db import versioned_tables
+from filmapi.dto.filmdto import FilmDTO
 
 from filmapi.repositories.filmdb import FilmRepository
 from filmapi.repositories.genredb import GenreRepository
 from filmapi.repositories.directordb import DirectorRepository
 from filmapi.repositories.user import UserRepository
+from filmapi.repositories.importdb import ImportRepository
+from filmapi.repositories.exportdb import ExportRepository
 from filmapi.services.film import FilmService
 from filmapi.services.genre import GenreService
 from filmapi.services.director import DirectorService
 from filmapi.services.user import UserService
+from filmapi.services.importer import ImportService
+from filmapi.services.exporter import ExportService
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
@@ -17,8 +31,73 @@ class Container(DeclarativeContainer):
     genre_repository = Singleton(GenreRepository)
     director_repository = Singleton(DirectorRepository)
     user_repository = Singleton(UserRepository)
+    import_repository = Singleton(ImportRepository)
+    export_repository = Singleton(ExportRepository)
+
+    film_cache = Singleton(
+        TTLCache,
+        maxsize=config.CACHE_MAXSIZE,
+        ttl=config.CACHE_TTL,
+        negative_ttl=config.CACHE_NEGATIVE_TTL,
+        tables=[table.name for table in versioned_tables],
+    )
+
+    cache_backend = Selector(
+        lambda: config.CACHE_BACKEND,
+        shm=Singleton(
+            SharedMemoryBackend,
+            path=config.CACHE_SHM_PATH,
+            size=config.CACHE_SHM_SIZE,
+            slot_size=config.CACHE_SHM_SLOT_SIZE,
+            schema=schema_hash(FilmDTO),
+        ),
+        redis=Singleton(RedisBackend, url=config.CACHE_REDIS_URL),
+        memory=Singleton(MemoryBackend, maxsize=config.CACHE_MAXSIZE),
+    )
+    film_store = Singleton(
+        SharedCache,
+        backend=cache_backend,
+        namespace="film",
+        model=FilmDTO,
+        ttl=config.CACHE_TTL,
+        negative_ttl=config.CACHE_NEGATIVE_TTL,
+    )
+
+    search_cache = Singleton(
+        TTLCache,
+        maxsize=config.SEARCH_CACHE_MAX_BYTES,
+        ttl=config.SEARCH_CACHE_TTL,
+        tables=[table.name for table in versioned_tables],
+        size_of=lambda page: len(page.to_json()),
+    )
+
+    read_flights = Singleton(SingleFlight)
 
-    film_service = Factory(FilmService, repository=film_repository)
-    genre_service = Factory(GenreService, repository=genre_repository)
-    director_service = Factory(DirectorService, repository=director_repository)
+    film_service = Factory(
+        FilmService,
+        repository=film_repository,
+        cache=film_cache,
+        store=film_store,
+        search_cache=search_cache,
+        flights=read_flights,
+    )
+    genre_service = Factory(
+        GenreService,
+        repository=genre_repository,
+        film_store=film_store,
+        flights=read_flights,
+    )
+    director_service = Factory(
+        DirectorService,
+        repository=director_repository,
+        film_store=film_store,
+        flights=read_flights,
+    )
     user_service = Factory(UserService, repository=user_repository)
+    import_service = Factory(
+        ImportService,
+        repository=import_repository,
+        caches=List(film_cache),
+        stores=List(film_store),
+    )
+    export_service = Factory(ExportService, repository=export_repository)
@@ -1,18 +1,25 @@
 """A module providing database access."""
 
 import asyncio
+import logging
+import random
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterable, TypeVar
 
-import databases
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
 from asyncpg.exceptions import ( # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
+from filmapi.cache.versions import table_versions
 from filmapi.config import config
+from filmapi.migrations import check_schema
+from filmapi.pool import Database
+
+ValueT = TypeVar("ValueT")
 
 metadata = sqlalchemy.MetaData()
 
@@ -54,6 +61,44 @@ film_genre_table = sqlalchemy.Table(
                       primary_key=True),
 )
 
+# The schema, indexes included, is defined by the migrations alone, so the
+# tables here only describe what queries need. The sort keys below match
+# the expression indexes created there.
+film_title_key = sqlalchemy.func.coalesce(
+    film_table.c.title,
+    sqlalchemy.literal_column("''"),
+)
+film_release_year_key = sqlalchemy.func.coalesce(
+    film_table.c.release_year,
+    sqlalchemy.literal_column("0"),
+)
+
+# The configuration is part of the ix_films_search index created by
+# migration 2, so queries only use the index while both agree. Changing
+# it needs a new migration rebuilding the index.
+FTS_CONFIG = "english"
+
+fts_config = sqlalchemy.literal_column(f"'{FTS_CONFIG}'::regconfig")
+
+film_search_vector = sqlalchemy.func.setweight(
+    sqlalchemy.func.to_tsvector(
+        fts_config,
+        sqlalchemy.func.coalesce(film_table.c.title, sqlalchemy.literal_column("''")),
+    ),
+    sqlalchemy.literal_column("'A'"),
+).op("||")(
+    sqlalchemy.func.setweight(
+        sqlalchemy.func.to_tsvector(
+            fts_config,
+            sqlalchemy.func.coalesce(
+                film_table.c.description,
+                sqlalchemy.literal_column("''"),
+            ),
+        ),
+        sqlalchemy.literal_column("'B'"),
+    )
+)
+
 user_table = sqlalchemy.Table(
     "users",
     metadata,
@@ -67,44 +112,139 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String),
 )
 
+versioned_tables = (director_table, genre_table, film_table, film_genre_table)
+
+staging_metadata = sqlalchemy.MetaData()
+
+film_import_table = sqlalchemy.Table(
+    "film_import",
+    staging_metadata,
+    sqlalchemy.Column("line", sqlalchemy.BigInteger),
+    sqlalchemy.Column("title", sqlalchemy.Text),
+    sqlalchemy.Column("description", sqlalchemy.Text),
+    sqlalchemy.Column("release_year", sqlalchemy.Integer),
+    sqlalchemy.Column("director_name", sqlalchemy.Text),
+    sqlalchemy.Column("birth_year", sqlalchemy.Integer),
+    sqlalchemy.Column("genres", ARRAY(sqlalchemy.Text)),
+    sqlalchemy.Column("director_id", sqlalchemy.Integer),
+    sqlalchemy.Column("film_id", sqlalchemy.Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-)
+pool_options = {
+    "acquire_timeout": config.DB_POOL_ACQUIRE_TIMEOUT,
+    "max_queries": config.DB_POOL_MAX_QUERIES,
+    "max_inactive_connection_lifetime": config.DB_POOL_MAX_INACTIVE_LIFETIME,
+    "command_timeout": config.DB_COMMAND_TIMEOUT,
+    "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+}
+
+database = Database(db_uri, **pool_options)
 
-database = databases.Database(
-    db_uri,
-    force_rollback=True,
+replica_database = (
+    Database(config.DB_REPLICA_URL, **pool_options) if config.DB_REPLICA_URL
+    else database
 )
 
+read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+def reader() -> Database:
+    """A function choosing the database read-only queries run against.
+
+    Reads go to the replica unless the current request is pinned to the
+    primary, because it writes or its client wrote a moment ago. Without
+    a configured replica both are the primary.
+
+    Returns:
+        Database: The replica or the primary database.
+    """
+    return database if read_from_primary.get() else replica_database
+
+
+async def load_fresh(tables: Iterable[str], load: Callable[[], Awaitable[ValueT]]) -> ValueT:
+    """A function loading a value to be cached from an up to date database.
+
+    A load repopulating a cache within `DB_READ_YOUR_WRITES_WINDOW`
+    seconds after a change of its tables reads from the primary, so a
+    lagging replica never puts the value from before the change back.
+
+    Args:
+        tables (Iterable[str]): The tables the value is read from.
+        load (Callable[[], Awaitable[ValueT]]): The loader.
+
+    Returns:
+        ValueT: The loaded value.
+    """
+    if (
+        replica_database is database
+        or read_from_primary.get()
+        or not table_versions.changed_within(tables, config.DB_READ_YOUR_WRITES_WINDOW)
+    ):
+        return await load()
+
+    token = read_from_primary.set(True)
+    try:
+        return await load()
+    finally:
+        read_from_primary.reset(token)
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+if config.DB_ECHO:
+    logging.basicConfig()
+    logging.getLogger("databases").setLevel(logging.DEBUG)
+
+
+async def connect(db: Database) -> None:
+    """Function connecting a pool, retrying with exponential backoff.
+
+    The delay before every retry is drawn between zero and a cap doubling
+    with each attempt, so instances starting together do not retry in
+    lockstep.
 
     Args:
-        retries (int, optional): Number of retries of connect to DB.
-            Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        db (Database): The database to connect.
+
+    Raises:
+        ConnectionError: If every attempt failed.
     """
-    for attempt in range(retries):
+    for attempt in range(config.DB_CONNECT_RETRIES):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+            await db.connect()
             return
         except (
             OperationalError,
             DatabaseError,
             CannotConnectNowError,
             ConnectionDoesNotExistError,
+            OSError,
         ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            await asyncio.sleep(delay)
+            logging.warning("Attempt %d to connect failed: %s", attempt + 1, e)
+            if attempt + 1 < config.DB_CONNECT_RETRIES:
+                cap = config.DB_CONNECT_BASE_DELAY * 2 ** attempt
+                await asyncio.sleep(random.uniform(0, min(config.DB_CONNECT_MAX_DELAY, cap)))
+
+    raise ConnectionError("Could not connect to DB after several retries.")
 
-    raise ConnectionError("Could not connect to DB after several retries.")
\ No newline at end of file
+
+async def init_db() -> None:
+    """Function connecting the pools of a serving instance.
+
+    The schema is only checked, migrations are applied beforehand by
+    `python -m filmapi migrate`. Both pools are warmed up before the
+    instance reports ready.
+
+    Raises:
+        SchemaVersionError: If the schema is behind the code.
+    """
+    await connect(database)
+    await check_schema(database)
+    await database.warm_up()
+    if replica_database is not database:
+        await connect(replica_database)
+        await replica_database.warm_up()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Literal, Optional
 
 class FilmIn(BaseModel):
     title: str
@@ -8,4 +8,11 @@ class FilmIn(BaseModel):
     director_id: int
 
 class Film(FilmIn):
-    id: int
\ No newline at end of file
+    id: int
+
+class FilmBatchItem(FilmIn):
+    genre_ids: list[int] = []
+
+class FilmGenresIn(BaseModel):
+    mode: Literal["add", "remove", "replace"] = "add"
+    films: dict[int, set[int]]
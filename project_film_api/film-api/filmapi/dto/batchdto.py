@@ -0,0 +1,17 @@
+"""A module containing the batch write result DTOs."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BatchErrorDTO(BaseModel):
+    """A model representing DTO for a rejected batch item."""
+    index: int
+    detail: str
+
+
+class BatchDTO(BaseModel):
+    """A model representing DTO for the result of a batch write."""
+    ids: list[Optional[int]]
+    errors: list[BatchErrorDTO] = []
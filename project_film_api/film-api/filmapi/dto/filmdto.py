@@ -4,6 +4,7 @@ from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
 from filmapi.dto.directordto import DirectorDTO
+from filmapi.dto.genredto import GenreDTO
 
 
 class FilmDTO(BaseModel):
@@ -13,6 +14,7 @@ class FilmDTO(BaseModel):
     description: Optional[str]
     release_year: Optional[int]
     director: DirectorDTO
+    genres: list[GenreDTO] = []
 
 
     model_config = ConfigDict(
@@ -28,15 +30,28 @@ class FilmDTO(BaseModel):
             record (Record): The DB record.
         Returns:
             FilmDTO: The final DTO instance."""
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"),
-            title=record_dict.get("title"),
-            description=record_dict.get("description"),
-            release_year=record_dict.get("release_year"),
-            director=DirectorDTO(
-                director_id=record_dict.get("director_id"),
-                director_name=record_dict.get("director_name"),
-                birth_year=record_dict.get("birth_year"),
-            ),
-        )
\ No newline at end of file
+        return cls.model_validate(cls.dump_record(record))
+
+    @staticmethod
+    def dump_record(record: Record) -> dict:
+        """A method for converting a DB record straight into the DTO's JSON shape.
+
+        No model is built, so read endpoints can serialize the result
+        without validating every row twice.
+
+        Args:
+            record (Record): The DB record.
+        Returns:
+            dict: The film with its director and genres as plain data."""
+        return {
+            "id": record["id"],
+            "title": record["title"],
+            "description": record["description"],
+            "release_year": record["release_year"],
+            "director": {
+                "director_id": record["director_id"],
+                "director_name": record["director_name"],
+                "birth_year": record["birth_year"],
+            },
+            "genres": record["genres"] or [],
+        }
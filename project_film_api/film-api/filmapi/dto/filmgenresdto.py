@@ -0,0 +1,11 @@
+"""A module containing the bulk genre assignment result DTO."""
+
+from pydantic import BaseModel
+
+
+class FilmGenresDTO(BaseModel):
+    """A model representing DTO for the result of a bulk genre assignment."""
+    added: int = 0
+    removed: int = 0
+    missing_film_ids: list[int] = []
+    missing_genre_ids: list[int] = []
@@ -0,0 +1,23 @@
+"""A module containing the catalog import report DTO."""
+
+from pydantic import BaseModel
+
+
+class ImportErrorDTO(BaseModel):
+    """A model representing DTO for a rejected import line."""
+    line: int
+    detail: str
+
+
+class ImportDTO(BaseModel):
+    """A model representing DTO for the result of a catalog import."""
+    rows: int = 0
+    rejected: int = 0
+    directors_created: int = 0
+    genres_created: int = 0
+    films_created: int = 0
+    films_updated: int = 0
+    film_genres_created: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    errors: list[ImportErrorDTO] = []
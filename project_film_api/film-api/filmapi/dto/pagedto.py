@@ -0,0 +1,73 @@
+"""A module containing the paginated response DTO."""
+
+import json
+from typing import Generic, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel, PrivateAttr
+
+ItemT = TypeVar("ItemT")
+
+
+class PageDTO(BaseModel, Generic[ItemT]):
+    """A model representing DTO for a single page of a list endpoint."""
+    items: list[ItemT]
+    next_cursor: Optional[str] = None
+    _serialized: Optional[bytes] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_serialized(
+            cls,
+            items: list[ItemT],
+            next_cursor: Optional[str],
+            serialized_items: Sequence[bytes],
+    ) -> "PageDTO":
+        """A method building a page whose items are already serialized.
+
+        Args:
+            items (list[ItemT]): The page items.
+            next_cursor (Optional[str]): The cursor to the next page.
+            serialized_items (Sequence[bytes]): The JSON of every item.
+
+        Returns:
+            PageDTO: The page able to render itself without serializing
+                the items again.
+        """
+        page = cls(items=items, next_cursor=next_cursor)
+        page._serialized = cls.render(
+            b"[" + b",".join(serialized_items) + b"]",
+            next_cursor,
+        )
+        return page
+
+    @staticmethod
+    def render(items_json: bytes, next_cursor: Optional[str]) -> bytes:
+        """A method wrapping an already rendered JSON array of items in a page.
+
+        Args:
+            items_json (bytes): The JSON array of the items.
+            next_cursor (Optional[str]): The cursor to the next page.
+
+        Returns:
+            bytes: The JSON of the page.
+        """
+        return b"".join((
+            b'{"items":',
+            items_json,
+            b',"next_cursor":',
+            json.dumps(next_cursor).encode(),
+            b"}",
+        ))
+
+    def to_json(self) -> bytes:
+        """A method rendering the page as JSON.
+
+        The JSON is kept after the first call, so a cached page is
+        serialized only once.
+
+        Returns:
+            bytes: The JSON of the page.
+        """
+        if self._serialized is None:
+            self._serialized = self.model_dump_json().encode()
+
+        return self._serialized
@@ -10,24 +10,36 @@ from filmapi.api.routers.genre import router as genre_router
 from filmapi.api.routers.film import router as film_router
 from filmapi.api.routers.director import router as director_router
 from filmapi.api.routers.user import router as user_router
+from filmapi.api.routers.system import router as system_router
+from filmapi.api.routers.admin import router as admin_router
+from filmapi.api.utils.connection import RequestConnectionMiddleware
+from filmapi.cache.versions import table_versions
 from filmapi.container import Container
-from filmapi.db import database, init_db
+from filmapi.db import database, init_db, replica_database
+from filmapi.repositories.pagination import InvalidCursorError
+from filmapi.utils.password import PasswordHasherBusyError
 
 container = Container()
 container.wire(modules=[
     "filmapi.api.routers.genre",
     "filmapi.api.routers.film",
     "filmapi.api.routers.director",
-    "filmapi.api.routers.user"
+    "filmapi.api.routers.user",
+    "filmapi.api.routers.admin",
+    "filmapi.api.routers.system",
 ])
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
+    container.cache_backend()
     await init_db()
-    await database.connect()
+    table_versions.start(str(database.url.replace(driver="")))
     yield
+    await table_versions.stop()
+    await container.cache_backend().close()
+    await replica_database.disconnect()
     await database.disconnect()
 
 
@@ -36,6 +48,9 @@ app.include_router(genre_router, prefix="/genre")
 app.include_router(director_router, prefix="/director")
 app.include_router(film_router, prefix="/film")
 app.include_router(user_router, prefix="/user")
+app.include_router(system_router, prefix="/system")
+app.include_router(admin_router, prefix="/admin")
+app.add_middleware(RequestConnectionMiddleware)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handle_logging(
@@ -51,4 +66,42 @@ async def http_exception_handle_logging(
     Returns:
         Response: The HTTP response.
     """
-    return await http_exception_handler(request, exception)
\ No newline at end of file
+    return await http_exception_handler(request, exception)
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handle(
+    request: Request,
+    exception: InvalidCursorError,
+) -> Response:
+    """A function turning malformed pagination cursors into 400 responses.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        exception (InvalidCursorError): A related exception.
+
+    Returns:
+        Response: The HTTP response.
+    """
+    return await http_exception_handler(
+        request,
+        HTTPException(status_code=400, detail=str(exception)),
+    )
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handle(
+    request: Request,
+    exception: PasswordHasherBusyError,
+) -> Response:
+    """A function turning an overloaded password hasher into 503 responses.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        exception (PasswordHasherBusyError): A related exception.
+
+    Returns:
+        Response: The HTTP response.
+    """
+    return await http_exception_handler(
+        request,
+        HTTPException(status_code=503, detail=str(exception), headers={"Retry-After": "1"}),
+    )
@@ -0,0 +1,198 @@
+"""A module containing the versioned schema migrations."""
+
+import logging
+from typing import NamedTuple
+
+import sqlalchemy
+
+from filmapi.cache.versions import TABLE_CHANGED_CHANNEL
+from filmapi.pool import Database
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_ID = 7_402_115_001
+
+
+class Migration(NamedTuple):
+    """A schema change applied once, in a transaction of its own.
+
+    Migrations are never edited once released; any later change of the
+    schema is a new migration with the next version.
+    """
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+class SchemaVersionError(RuntimeError):
+    """An error raised when the database schema is behind the code."""
+
+
+MIGRATIONS = (
+    Migration(1, "Create the catalog and user tables", (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE TABLE IF NOT EXISTS directors ("
+        " id SERIAL NOT NULL,"
+        " name VARCHAR,"
+        " birth_year INTEGER,"
+        " PRIMARY KEY (id))",
+        "CREATE TABLE IF NOT EXISTS genres ("
+        " id SERIAL NOT NULL,"
+        " name VARCHAR,"
+        " PRIMARY KEY (id),"
+        " UNIQUE (name))",
+        "CREATE TABLE IF NOT EXISTS users ("
+        " id UUID DEFAULT gen_random_uuid() NOT NULL,"
+        " email VARCHAR,"
+        " password VARCHAR,"
+        " PRIMARY KEY (id),"
+        " UNIQUE (email))",
+        "CREATE TABLE IF NOT EXISTS films ("
+        " id SERIAL NOT NULL,"
+        " title VARCHAR,"
+        " description VARCHAR,"
+        " release_year INTEGER,"
+        " director_id INTEGER,"
+        " PRIMARY KEY (id),"
+        " FOREIGN KEY (director_id) REFERENCES directors (id))",
+        "CREATE TABLE IF NOT EXISTS film_genres ("
+        " film_id INTEGER NOT NULL,"
+        " genre_id INTEGER NOT NULL,"
+        " PRIMARY KEY (film_id, genre_id),"
+        " FOREIGN KEY (film_id) REFERENCES films (id),"
+        " FOREIGN KEY (genre_id) REFERENCES genres (id))",
+    )),
+    Migration(2, "Add the indexes of the catalog queries", (
+        "CREATE INDEX IF NOT EXISTS ix_directors_name_id ON directors (name, id)",
+        "CREATE INDEX IF NOT EXISTS ix_directors_name_trgm"
+        " ON directors USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_genres_name_id ON genres (name, id)",
+        "CREATE INDEX IF NOT EXISTS ix_genres_name_trgm ON genres USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_films_title_id ON films (title, id)",
+        "CREATE INDEX IF NOT EXISTS ix_films_release_year_id"
+        " ON films (coalesce(release_year, 0), id)",
+        "CREATE INDEX IF NOT EXISTS ix_films_release_year ON films (release_year)",
+        "CREATE INDEX IF NOT EXISTS ix_films_director_id ON films (director_id)",
+        "CREATE INDEX IF NOT EXISTS ix_films_title_trgm ON films USING gin (title gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_films_search ON films USING gin (("
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')"
+        " || setweight(to_tsvector("
+        "'english'::regconfig, coalesce(description, '')), 'B')))",
+        "CREATE INDEX IF NOT EXISTS ix_film_genres_genre_id_film_id"
+        " ON film_genres (genre_id, film_id)",
+    )),
+    Migration(3, "Notify listeners of changed catalog tables", (
+        "CREATE OR REPLACE FUNCTION notify_table_changed() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ BEGIN "
+        f"PERFORM pg_notify('{TABLE_CHANGED_CHANNEL}', TG_TABLE_NAME); "
+        "RETURN NULL; END $$",
+        *(
+            f"CREATE OR REPLACE TRIGGER {table}_changed "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION notify_table_changed()"
+            for table in ("directors", "genres", "films", "film_genres")
+        ),
+    )),
+    Migration(4, "Sort films by title with missing titles first", (
+        "CREATE INDEX IF NOT EXISTS ix_films_title_key_id ON films (coalesce(title, ''), id)",
+        "DROP INDEX IF EXISTS ix_films_title_id",
+    )),
+    Migration(5, "Drop the unused trigram indexes of genre and director names", (
+        "DROP INDEX IF EXISTS ix_genres_name_trgm",
+        "DROP INDEX IF EXISTS ix_directors_name_trgm",
+    )),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+migration_table = sqlalchemy.Table(
+    "schema_migrations",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("version", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("description", sqlalchemy.Text),
+    sqlalchemy.Column(
+        "applied_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+
+async def schema_version(database: Database) -> int:
+    """A function reading the version the database schema is migrated to.
+
+    Args:
+        database (Database): The connected database.
+
+    Returns:
+        int: The highest applied version, 0 if none was applied.
+    """
+    if not await database.fetch_val("SELECT to_regclass('schema_migrations') IS NOT NULL"):
+        return 0
+    query = sqlalchemy.select(sqlalchemy.func.max(migration_table.c.version))
+    return await database.fetch_val(query) or 0
+
+
+async def check_schema(database: Database) -> int:
+    """A function making sure the database schema is recent enough.
+
+    A newer schema is accepted, so instances of the previous release keep
+    running while a deployment migrates the database ahead of them.
+
+    Args:
+        database (Database): The connected database.
+
+    Raises:
+        SchemaVersionError: If migrations are missing.
+
+    Returns:
+        int: The version of the database schema.
+    """
+    version = await schema_version(database)
+    if version < SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version}, {SCHEMA_VERSION} is required; "
+            "run `python -m filmapi migrate`"
+        )
+    if version > SCHEMA_VERSION:
+        logger.warning("Database schema version %d is newer than %d", version, SCHEMA_VERSION)
+    return version
+
+
+async def migrate(database: Database) -> list[Migration]:
+    """A function applying every pending migration.
+
+    Each migration runs in its own transaction holding an advisory lock,
+    so concurrent runs apply it once and a failed one leaves the schema
+    at the previous version. A database created before migrations
+    existed is adopted, as the first ones only create what is missing.
+
+    Args:
+        database (Database): The connected database.
+
+    Returns:
+        list[Migration]: The migrations applied by this run.
+    """
+    applied = []
+    for migration in MIGRATIONS:
+        async with database.transaction():
+            await database.execute(
+                sqlalchemy.select(sqlalchemy.func.pg_advisory_xact_lock(MIGRATION_LOCK_ID))
+            )
+            await database.execute(
+                sqlalchemy.schema.CreateTable(migration_table, if_not_exists=True)
+            )
+            if migration.version <= await schema_version(database):
+                continue
+            for statement in migration.statements:
+                await database.execute(statement)
+            await database.execute(
+                migration_table.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                )
+            )
+        logger.info("Applied migration %d: %s", migration.version, migration.description)
+        applied.append(migration)
+    return applied
@@ -0,0 +1,368 @@
+"""A module providing the pooled asyncpg database backend."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator
+
+import databases
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+from databases.core import LOG_EXTRA, Connection, DatabaseURL
+from sqlalchemy.engine.interfaces import Dialect
+
+from filmapi.config import config
+
+logger = logging.getLogger("databases")
+
+
+class PoolStats:
+    """A class collecting connection checkout statistics of the pool."""
+
+    def __init__(self) -> None:
+        """The initializer of the pool statistics."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_hold = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        """A method registering a successful connection checkout.
+
+        Args:
+            wait (float): Time spent waiting for the connection in seconds.
+        """
+        self.checkouts += 1
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def record_release(self, hold: float) -> None:
+        """A method registering a connection returned to the pool.
+
+        Args:
+            hold (float): Time the connection was checked out in seconds.
+        """
+        self.in_use -= 1
+        self.total_hold += hold
+
+    def as_dict(self) -> dict:
+        """A method returning the statistics as a plain dictionary.
+
+        Returns:
+            dict: The checkout statistics.
+        """
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "avg_wait_ms": self._average(self.total_wait),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "avg_hold_ms": self._average(self.total_hold),
+        }
+
+    def _average(self, total: float) -> float:
+        """A private method computing the average duration per checkout.
+
+        Args:
+            total (float): The accumulated duration in seconds.
+
+        Returns:
+            float: The average duration in milliseconds.
+        """
+        if not self.checkouts:
+            return 0.0
+        return round(total / self.checkouts * 1000, 3)
+
+
+class PooledConnection(PostgresConnection):
+    """A connection backend timing every checkout from the pool."""
+
+    _database: "PooledBackend"
+
+    async def acquire(self) -> None:
+        """A method checking out a connection within the acquire timeout."""
+        assert self._connection is None, "Connection is already acquired"
+        assert self._database._pool is not None, "DatabaseBackend is not running"
+
+        stats = self._database.stats
+        started = time.perf_counter()
+        try:
+            self._connection = await self._database._pool.acquire(
+                timeout=self._database.acquire_timeout,
+            )
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise
+
+        self._checked_out = time.perf_counter()
+        stats.record_checkout(self._checked_out - started)
+
+    async def release(self) -> None:
+        """A method returning the connection to the pool."""
+        await super().release()
+        self._database.stats.record_release(
+            time.perf_counter() - self._checked_out,
+        )
+
+
+class PooledBackend(PostgresBackend):
+    """The asyncpg backend with a tunable, instrumented pool."""
+
+    def __init__(
+            self,
+            database_url: DatabaseURL | str,
+            acquire_timeout: float | None = None,
+            **options: Any,
+    ) -> None:
+        """The initializer of the pooled backend.
+
+        Args:
+            database_url (DatabaseURL | str): The database URL.
+            acquire_timeout (float | None): Max seconds to wait for a connection.
+            **options (Any): Options passed to `asyncpg.create_pool`.
+        """
+        super().__init__(database_url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.stats = PoolStats()
+
+    def _get_connection_kwargs(self) -> dict:
+        """A method returning the options of the pool about to be created.
+
+        The pool sizes are read from the configuration when connecting,
+        not when the database is declared, so the server can share its
+        connection budget among the workers it forks before they connect.
+
+        Returns:
+            dict: The options passed to `asyncpg.create_pool`.
+        """
+        return {
+            **super()._get_connection_kwargs(),
+            "min_size": min(config.DB_POOL_MIN_SIZE, config.DB_POOL_MAX_SIZE),
+            "max_size": config.DB_POOL_MAX_SIZE,
+        }
+
+    def connection(self) -> PooledConnection:
+        """A method creating a connection backend bound to the pool.
+
+        Returns:
+            PooledConnection: The connection backend.
+        """
+        return PooledConnection(self, self._dialect)
+
+    def pool_size(self) -> dict:
+        """A method describing the current size of the pool.
+
+        Returns:
+            dict: The pool size details.
+        """
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "min_size": 0, "max_size": 0}
+
+        return {
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size(),
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+        }
+
+
+class RequestConnections:
+    """The pooled connections held by one request.
+
+    Nothing is checked out when the request starts. The first query of
+    the request takes a connection from the pool and the request keeps it
+    for its following queries, instead of taking and returning one around
+    every query. Tasks started by the request, such as the body of a
+    streaming response, share its connections.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the request connections."""
+        self.task = asyncio.current_task()
+        self._held: list[Connection] = []
+
+    async def hold(self, connection: Connection) -> None:
+        """A method keeping a connection checked out until it is released.
+
+        Args:
+            connection (Connection): The connection a query just entered.
+        """
+        if connection not in self._held:
+            self._held.append(connection)
+            await Connection.__aenter__(connection)
+
+    async def release(self) -> None:
+        """A method returning the held connections to the pool.
+
+        A connection still used by a query or a transaction goes back when
+        it is done. The next query of the request checks one out again.
+        """
+        held, self._held = self._held, []
+        for connection in held:
+            await connection.__aexit__()
+
+
+_request_connections: ContextVar[RequestConnections | None] = ContextVar(
+    "request_connections",
+    default=None,
+)
+
+
+@asynccontextmanager
+async def request_connections() -> AsyncIterator[RequestConnections]:
+    """A function holding the connections lazily checked out by a request.
+
+    Yields:
+        RequestConnections: The connections of the request.
+    """
+    connections = RequestConnections()
+    token = _request_connections.set(connections)
+    try:
+        yield connections
+    finally:
+        try:
+            await connections.release()
+        finally:
+            _request_connections.reset(token)
+
+
+async def release_request_connections() -> None:
+    """A function returning the connections of the current request early.
+
+    It is called before waiting on something other than the database, so
+    the request does not keep a connection other requests could use.
+    """
+    connections = _request_connections.get()
+    if connections is not None:
+        await connections.release()
+
+
+class _RequestConnection(Connection):
+    """A connection held by the request it was first used in."""
+
+    async def __aenter__(self) -> Connection:
+        """A method checking out the connection for a query.
+
+        Returns:
+            Connection: The connection.
+        """
+        await super().__aenter__()
+        connections = _request_connections.get()
+        if connections is not None:
+            await connections.hold(self)
+        return self
+
+
+class Database(databases.Database):
+    """The database handle using the pooled asyncpg backend."""
+
+    SUPPORTED_BACKENDS = {
+        **databases.Database.SUPPORTED_BACKENDS,
+        "postgresql": "filmapi.pool:PooledBackend",
+    }
+
+    _backend: PooledBackend
+    is_warm = False
+
+    @property
+    def _current_task(self) -> asyncio.Task:
+        """The task the connections are looked up by.
+
+        Within a request it is the task handling the request, so the tasks
+        it starts use its connection.
+
+        Returns:
+            asyncio.Task: The task owning the connection.
+        """
+        connections = _request_connections.get()
+        if connections is not None and connections.task is not None:
+            return connections.task
+        return super()._current_task
+
+    def connection(self) -> Connection:
+        """A method returning the connection of the current task.
+
+        Returns:
+            Connection: The connection, checked out on its first use.
+        """
+        if self._global_connection is not None:
+            return self._global_connection
+
+        if not self._connection:
+            self._connection = _RequestConnection(self, self._backend)
+
+        return self._connection
+
+    @property
+    def dialect(self) -> Dialect:
+        """The SQLAlchemy dialect queries are compiled with.
+
+        Returns:
+            Dialect: The dialect of the backend.
+        """
+        return self._backend._dialect
+
+    async def fetch_prepared(self, method: str, sql: str, args: list) -> Any:
+        """A method running compiled SQL text directly on asyncpg.
+
+        The text is passed to asyncpg unchanged, so it stays in the
+        statement cache of every connection it ran on. It runs on the
+        connection of the current task, under its query lock and logged
+        like the queries run through `databases`.
+
+        Args:
+            method (str): The name of the asyncpg fetch method.
+            sql (str): The SQL text with positional parameters.
+            args (list): The processed values of the parameters.
+
+        Returns:
+            Any: The result of the fetch method.
+        """
+        async with self.connection() as connection:
+            async with connection._query_lock:
+                logger.debug(
+                    "Query: %s Args: %s",
+                    sql.replace(" \n", " ").replace("\n", " "),
+                    repr(tuple(args)),
+                    extra=LOG_EXTRA,
+                )
+                return await getattr(connection.raw_connection, method)(sql, *args)
+
+    async def warm_up(self) -> None:
+        """A method checking out the minimum number of connections at once.
+
+        Every connection the pool keeps open runs a trivial query, so the
+        first requests find them established and usable.
+        """
+        pool = self._backend._pool
+
+        async def ping() -> None:
+            """A helper running a query on a connection of the pool."""
+            async with pool.acquire(timeout=self._backend.acquire_timeout) as connection:
+                await connection.fetchval("SELECT 1")
+
+        await asyncio.gather(*(ping() for _ in range(pool.get_min_size())))
+        self.is_warm = True
+
+    async def disconnect(self) -> None:
+        """A method closing the pool."""
+        self.is_warm = False
+        await super().disconnect()
+
+    def stats(self) -> dict:
+        """A method returning pool size and checkout statistics.
+
+        Returns:
+            dict: The pool statistics.
+        """
+        return {
+            **self._backend.pool_size(),
+            **self._backend.stats.as_dict(),
+        }
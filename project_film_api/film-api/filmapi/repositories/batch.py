@@ -0,0 +1,125 @@
+"""A module containing helpers for batched writes."""
+
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Insert,
+    Integer,
+    Table,
+    Update,
+    any_,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from filmapi.db import database
+
+RowT = TypeVar("RowT")
+
+MAX_BATCH_SIZE = 5000
+BATCH_ROWS = 1000
+
+
+def chunked(rows: Sequence[RowT], size: int = BATCH_ROWS) -> Iterator[Sequence[RowT]]:
+    """A function splitting rows into multi-row statement sized chunks.
+
+    Postgres caps a statement at 32767 bind parameters, so a multi-row
+    insert has to be split once `rows * columns` gets near that limit.
+
+    Args:
+        rows (Sequence[RowT]): The rows to split.
+        size (int): The maximum number of rows in a chunk.
+
+    Yields:
+        Sequence[RowT]: The consecutive chunks.
+    """
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def int_array(values: Sequence[int]) -> ColumnElement:
+    """A function binding a list of integers as a single array parameter.
+
+    Unlike an `IN` list, the statement text and parameter count stay the
+    same no matter how many values are bound.
+
+    Args:
+        values (Sequence[int]): The values to bind.
+
+    Returns:
+        ColumnElement: The `integer[]` bind parameter.
+    """
+    return cast(bindparam(None, list(values), type_=ARRAY(Integer)), ARRAY(Integer))
+
+
+def int_array_param(name: str) -> ColumnElement:
+    """A function declaring a named `integer[]` parameter of a statement.
+
+    Args:
+        name (str): The bind parameter name.
+
+    Returns:
+        ColumnElement: The `integer[]` bind parameter.
+    """
+    return cast(bindparam(name, type_=ARRAY(Integer)), ARRAY(Integer))
+
+
+async def count_rows(statement: Insert | Update | Delete) -> int:
+    """A function executing a write statement and counting affected rows.
+
+    Args:
+        statement (Insert | Update | Delete): The write statement.
+
+    Returns:
+        int: The number of inserted, updated or deleted rows.
+    """
+    affected = statement.returning(literal_column("1")).cte()
+    return await database.fetch_val(select(func.count()).select_from(affected))
+
+
+async def existing_ids(id_column: ColumnElement, ids: Iterable[int]) -> set[int]:
+    """A function checking which of the given ids exist, in one query.
+
+    Args:
+        id_column (ColumnElement): The primary key column.
+        ids (Iterable[int]): The ids to look up.
+
+    Returns:
+        set[int]: The ids present in the table.
+    """
+    ids = list(set(ids))
+    if not ids:
+        return set()
+
+    query = select(id_column).where(id_column == any_(int_array(ids)))
+    return {record[0] for record in await database.fetch_all(query)}
+
+
+async def reserve_ids(table: Table, count: int) -> list[int]:
+    """A function drawing a block of ids from a table's serial sequence.
+
+    Multi-row `INSERT ... RETURNING` does not guarantee the returned rows
+    follow the order of the inserted ones, so batch writes take their ids
+    up front and insert them explicitly.
+
+    Args:
+        table (Table): The table with a serial `id` column.
+        count (int): The number of ids to reserve.
+
+    Returns:
+        list[int]: The reserved ids in ascending order.
+    """
+    sequence = func.pg_get_serial_sequence(
+        literal_column(f"'{table.name}'"),
+        literal_column("'id'"),
+    )
+    query = select(func.nextval(sequence)).select_from(
+        func.generate_series(1, count),
+    )
+    return sorted(record[0] for record in await database.fetch_all(query))
@@ -2,38 +2,104 @@ from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
 
+from filmapi.cache.snapshot import TableSnapshot
+from filmapi.cache.versions import table_versions
+from filmapi.config import config
 from filmapi.domain.film import Film
+from filmapi.dto.pagedto import PageDTO
 from filmapi.repositories.idirector import IDirectorRepository
+from filmapi.repositories.search import trigram_distance
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    NAME_SORT_KEYS,
+    NameSearchSort,
+    NameSort,
+)
 from filmapi.domain.director import Director, DirectorIn
 from filmapi.db import (
     director_table,
     database, film_table,
 )
 
+
+def _to_director(record: Record) -> Director:
+    """A function converting a director record into the domain model.
+    Args:
+        record (Record): The DB record.
+    Returns:
+        Director: The director model."""
+    return Director(**dict(record))
+
+
+async def _load_directors() -> list[Director]:
+    """A function reading every director for the in-memory snapshot.
+    It reads the primary, since reloads follow changes noticed there and
+    a lagging replica would keep stale rows until the next change.
+    Returns:
+        list[Director]: All directors."""
+    return [_to_director(record) for record in await database.fetch_all(director_table.select())]
+
+
 class DirectorRepository(IDirectorRepository):
-    async def get_all_directors(self) -> Iterable[Any]:
-        """The method for getting all directors from the database.
+    """A class implementing the director repository.
+
+    The table is small and rarely written, so reads are served from an
+    in-memory snapshot reloaded whenever the table version changes.
+    """
 
+    def __init__(self) -> None:
+        """The initializer of the 'director repository'."""
+        self._snapshot = TableSnapshot(
+            director_table.name,
+            _load_directors,
+            NAME_SORT_KEYS,
+            config.SNAPSHOT_MAX_AGE,
+        )
+
+    async def get_all_directors(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The method for getting a page of all directors from the database.
+
+                Args:
+                    limit (int): The page size.
+                    cursor (str | None): The cursor of the previous page.
+                    sort (NameSort): The sort key.
                 Returns:
-                    Iterable[Any]: The collection of the all directors.
+                    PageDTO: The page of directors.
                 """
-        query = (director_table.select()
-                 .order_by(director_table.c.name.asc()))
-        directors = await database.fetch_all(query)
-        return [Director(**dict(director)) for director in directors]
+        snapshot = await self._snapshot.get()
+        return snapshot.page(sort, limit, cursor)
 
-    async def get_director_by_name(self, name: str) -> Iterable[Any]:
+    async def get_director_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The method for getting directors by a part of their name.
             Args:
                 name (str): Part of director's name.
+                limit (int): The page size.
+                cursor (str | None): The cursor of the previous page.
+                sort (NameSearchSort): The sort key.
             Returns:
-                Iterable[Any]: The collection of directors that match.
+                PageDTO: The page of directors that match.
                 """
-        query = (director_table.select()
-                 .where(director_table.c.name.ilike(f'%{name}%'))
-                 .order_by(director_table.c.name.asc()))
-        directors = await database.fetch_all(query)
-        return [Director(**dict(director)) for director in directors]
+        term = name.casefold()
+        snapshot = await self._snapshot.get()
+        return snapshot.page(
+            sort,
+            limit,
+            cursor,
+            match=lambda director: term in (director.name or "").casefold(),
+            rank=(lambda director: trigram_distance(name, director.name or "")) if sort == "relevance"
+            else None,
+        )
 
     async def get_director_by_id(self, director_id: int) -> Any | None:
         """The method for getting a director by its id.
@@ -41,9 +107,8 @@ class DirectorRepository(IDirectorRepository):
                 director_id (int): Director's id.
             Returns:
                 Any | None: Director from the database."""
-
-        director = await self._get_by_id(director_id)
-        return Director(**dict(director)) if director else None
+        snapshot = await self._snapshot.get()
+        return snapshot.by_id.get(director_id)
 
 
     async def create_director(self, data: DirectorIn) -> Any | None:
@@ -52,10 +117,13 @@ class DirectorRepository(IDirectorRepository):
                 data (DirectorIn): Attributes of the director.
             Returns:
                 Any | None: Newly created director. """
-        query = (director_table.insert()
-                 .values(**data.model_dump()))
-        new_director_id = await database.execute(query)
-        new_director = await self._get_by_id(new_director_id)
+        query = (
+            director_table.insert()
+            .values(**data.model_dump())
+            .returning(*director_table.c)
+        )
+        new_director = await database.fetch_one(query)
+        table_versions.bump(director_table.name)
         return Director(**dict(new_director)) if new_director else None
 
     async def edit_director(self, director_id: int, data: DirectorIn) -> Any | None:
@@ -64,40 +132,32 @@ class DirectorRepository(IDirectorRepository):
                 director_id (int): Director's id.
                 data (DirectorIn): New attributes for the director.
             Returns:
-                Any | None: Updated director. """
-
-        if self._get_by_id(director_id):
-            query = (
-                director_table.update()
-                .where(director_table.c.id == director_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-            director = await self._get_by_id(director_id)
-            return Director(**dict(director)) if director else None
-        return None
+                Any | None: Updated director, None if it does not exist. """
+        query = (
+            director_table.update()
+            .where(director_table.c.id == director_id)
+            .values(**data.model_dump())
+            .returning(*director_table.c)
+        )
+        director = await database.fetch_one(query)
+        if director is None:
+            return None
+
+        table_versions.bump(director_table.name)
+        return Director(**dict(director))
 
     async def delete_director(self, director_id: int) -> bool:
         """The method for deleting a director from the database.
             Args:
                 director_id (int): Director's id.
             Returns:
-                bool: Operation's success."""
-        if self._get_by_id(director_id):
-            query = director_table \
-                .delete() \
-                .where(director_table.c.id == director_id)
-            await database.execute(query)
-
-            return True
-        return False
-
-    async def _get_by_id(self, director_id: int) -> Record | None:
-        """A private method for getting a director from the db by its ID.
-            Args:
-                director_id (int): Director's id.
-            Returns:
-                Any | None: Director record if possible."""
-        query = (director_table.select()
-                 .where(director_table.c.id == director_id))
-        return await database.fetch_one(query)
\ No newline at end of file
+                bool: Operation's success, False if it does not exist."""
+        query = (
+            director_table.delete()
+            .where(director_table.c.id == director_id)
+            .returning(director_table.c.id)
+        )
+        deleted = await database.fetch_val(query) is not None
+        if deleted:
+            table_versions.bump(director_table.name)
+        return deleted
\ No newline at end of file
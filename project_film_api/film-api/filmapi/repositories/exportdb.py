@@ -0,0 +1,295 @@
+"""A module containing the catalog export repository."""
+
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterator
+
+from sqlalchemy import Select, func, literal_column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from starlette.concurrency import run_in_threadpool
+
+from filmapi.db import (
+    database,
+    director_table,
+    film_genre_table,
+    film_table,
+    genre_table,
+)
+from filmapi.repositories.iexport import IExportRepository
+from filmapi.utils.catalog import GENRE_SEPARATOR, ExportFormat
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.ipc  # type: ignore
+    import pyarrow.parquet  # type: ignore
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+COPY_QUEUE_CHUNKS = 64
+CURSOR_BATCH_ROWS = 50000
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def columnar_available() -> bool:
+    """A function checking whether the optional `pyarrow` is installed.
+
+    Returns:
+        bool: True if Parquet and Arrow exports are available.
+    """
+    return pyarrow is not None
+
+
+def _catalog_select(genres_as_text: bool = False) -> Select:
+    """A function building the flat catalog query.
+
+    Args:
+        genres_as_text (bool): Whether to join genre names with `|`
+            instead of returning an array, as the CSV import expects.
+
+    Returns:
+        Select: Films with their director and genre names, ordered by id.
+    """
+    genres = (
+        select(
+            func.coalesce(
+                func.array_agg(aggregate_order_by(genre_table.c.name, genre_table.c.name)),
+                literal_column("'{}'::text[]"),
+            )
+        )
+        .select_from(
+            film_genre_table
+            .join(genre_table, film_genre_table.c.genre_id == genre_table.c.id)
+        )
+        .where(film_genre_table.c.film_id == film_table.c.id)
+        .scalar_subquery()
+    )
+    if genres_as_text:
+        genres = func.array_to_string(genres, literal_column(f"'{GENRE_SEPARATOR}'"))
+
+    return (
+        select(
+            film_table.c.id,
+            film_table.c.title,
+            film_table.c.description,
+            film_table.c.release_year,
+            film_table.c.director_id,
+            director_table.c.name.label("director_name"),
+            director_table.c.birth_year,
+            genres.label("genres"),
+        )
+        .select_from(
+            film_table
+            .outerjoin(director_table, film_table.c.director_id == director_table.c.id)
+        )
+        .order_by(film_table.c.id)
+    )
+
+
+def _to_sql(query: Select) -> str:
+    """A function rendering a query as a literal SQL string for `COPY`.
+
+    Args:
+        query (Select): The query without bound parameters.
+
+    Returns:
+        str: The SQL text.
+    """
+    return str(query.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    ))
+
+
+async def _copy_chunks(sql: str, **options: Any) -> AsyncIterator[bytes]:
+    """A generator streaming the output of `COPY (query) TO STDOUT`.
+
+    The copy runs in a separate task feeding a bounded queue, so a slow
+    client applies backpressure to the server instead of the rows
+    piling up in memory.
+
+    Args:
+        sql (str): The query to copy out.
+        **options (Any): The `copy_from_query` format options.
+
+    Yields:
+        bytes: The chunks of the copy output.
+    """
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+    space = asyncio.Semaphore(COPY_QUEUE_CHUNKS)
+
+    async def put(chunk: bytes) -> None:
+        await space.acquire()
+        chunks.put_nowait(chunk)
+
+    async with database.connection() as connection:
+        copy = asyncio.create_task(
+            connection.raw_connection.copy_from_query(sql, output=put, **options),
+        )
+        copy.add_done_callback(lambda _: chunks.put_nowait(None))
+        try:
+            while (chunk := await chunks.get()) is not None:
+                space.release()
+                yield chunk
+            await copy
+        finally:
+            if not copy.done():
+                copy.cancel()
+                with suppress(asyncio.CancelledError):
+                    await copy
+
+
+class _ChunkSink:
+    """A write-only file collecting what a pyarrow writer produced."""
+
+    def __init__(self) -> None:
+        """The initializer of the sink."""
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        """A method buffering written bytes.
+
+        Args:
+            data (bytes): The written bytes.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        """A method returning the number of bytes written so far.
+
+        Returns:
+            int: The stream position.
+        """
+        return self._position
+
+    def writable(self) -> bool:
+        """A method telling pyarrow the sink accepts writes.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def flush(self) -> None:
+        """A method required by the file protocol, nothing is buffered."""
+
+    def close(self) -> None:
+        """A method marking the sink as closed."""
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """A method taking the bytes written since the last call.
+
+        Returns:
+            bytes: The buffered bytes.
+        """
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema() -> Any:
+    """A function building the Arrow schema of the catalog.
+
+    Returns:
+        pyarrow.Schema: The schema matching `_catalog_select`.
+    """
+    return pyarrow.schema([
+        ("id", pyarrow.int32()),
+        ("title", pyarrow.string()),
+        ("description", pyarrow.string()),
+        ("release_year", pyarrow.int32()),
+        ("director_id", pyarrow.int32()),
+        ("director_name", pyarrow.string()),
+        ("birth_year", pyarrow.int32()),
+        ("genres", pyarrow.list_(pyarrow.string())),
+    ])
+
+
+def _write_batch(writer: Any, sink: _ChunkSink, schema: Any, rows: list) -> bytes:
+    """A function encoding a batch of records with a pyarrow writer.
+
+    Args:
+        writer (Any): The Parquet or Arrow IPC writer.
+        sink (_ChunkSink): The sink the writer writes to.
+        schema (pyarrow.Schema): The catalog schema.
+        rows (list): The fetched records.
+
+    Returns:
+        bytes: The encoded batch.
+    """
+    batch = pyarrow.RecordBatch.from_pydict(
+        {name: [row[name] for row in rows] for name in schema.names},
+        schema=schema,
+    )
+    writer.write_batch(batch)
+    return sink.drain()
+
+
+class ExportRepository(IExportRepository):
+    """A class implementing the catalog export repository."""
+
+    async def export_catalog(self, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        """The method for streaming the whole catalog in a given format.
+            CSV and NDJSON are rendered by Postgres and streamed with
+            `COPY ... TO STDOUT`, Parquet and Arrow are encoded from
+            batches read through a server-side cursor.
+            Args:
+                fmt (ExportFormat): The output format.
+            Yields:
+                bytes: The chunks of the encoded catalog."""
+        if fmt in COLUMNAR_FORMATS:
+            chunks = self._columnar_chunks(fmt)
+        elif fmt == "ndjson":
+            catalog = _catalog_select().subquery("catalog")
+            # A single JSON column is copied as CSV with control characters
+            # JSON always escapes as quote and delimiter, so Postgres emits
+            # every document verbatim instead of escaping it like text COPY.
+            chunks = _copy_chunks(
+                _to_sql(select(func.row_to_json(catalog.table_valued()))),
+                format="csv",
+                quote="\x01",
+                delimiter="\x02",
+            )
+        else:
+            chunks = _copy_chunks(
+                _to_sql(_catalog_select(genres_as_text=True)),
+                format="csv",
+                header=True,
+            )
+
+        async for chunk in chunks:
+            yield chunk
+
+    @staticmethod
+    async def _columnar_chunks(fmt: ExportFormat) -> AsyncIterator[bytes]:
+        """The method for streaming the catalog as Parquet or Arrow IPC.
+            Args:
+                fmt (ExportFormat): Either `parquet` or `arrow`.
+            Yields:
+                bytes: The encoded row groups or record batches. The writer
+                    is closed even if the client disconnects."""
+        schema = _arrow_schema()
+        sink = _ChunkSink()
+        writer = (
+            pyarrow.parquet.ParquetWriter(sink, schema) if fmt == "parquet"
+            else pyarrow.ipc.new_stream(sink, schema)
+        )
+        sql = _to_sql(_catalog_select())
+
+        try:
+            async with database.connection() as connection:
+                async with connection.transaction():
+                    cursor = await connection.raw_connection.cursor(sql)
+                    while rows := await cursor.fetch(CURSOR_BATCH_ROWS):
+                        yield await run_in_threadpool(_write_batch, writer, sink, schema, rows)
+        finally:
+            writer.close()
+        yield sink.drain()
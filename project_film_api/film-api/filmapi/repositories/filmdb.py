@@ -1,151 +1,622 @@
-from typing import Iterable, Any
+from typing import AsyncIterator, Callable, Iterable, Any
 
-from asyncpg import Record
-from sqlalchemy import select
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Integer,
+    Select,
+    String,
+    Text,
+    and_,
+    bindparam,
+    exists,
+    func,
+    literal_column,
+    any_,
+    cast,
+    select,
+    true,
+    false,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 
-from filmapi.domain.film import FilmIn, Film
+from filmapi.cache.versions import table_versions
+from filmapi.domain.film import FilmBatchItem, FilmGenresIn, FilmIn, Film
 from filmapi.domain.genre import Genre
+from filmapi.dto.batchdto import BatchDTO, BatchErrorDTO
 from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.filmgenresdto import FilmGenresDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.batch import (
+    chunked,
+    count_rows,
+    existing_ids,
+    int_array,
+    int_array_param,
+    reserve_ids,
+)
 from filmapi.repositories.ifilm import IFilmRepository
+from filmapi.repositories.loader import BatchLoader, load_film_genres
+from filmapi.repositories.search import (
+    GenreMatch,
+    contains,
+    like_pattern,
+    matches,
+    rank,
+    relevance,
+)
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    FilmSearchSort,
+    FilmSort,
+    SORT_KEY,
+    build_page,
+    encode_cursor,
+    keyset_page,
+    keyset_params,
+    paginate,
+)
+from filmapi.repositories.statements import Statement, statements
 from filmapi.db import (
     genre_table,
     film_table,
     film_genre_table,
-    database, director_table,
+    film_release_year_key,
+    film_title_key,
+    film_search_vector,
+    database, director_table, reader,
 )
 
+FILM_SORT_COLUMNS = {
+    "id": film_table.c.id,
+    "title": film_title_key,
+    "release_year": film_release_year_key,
+}
+
+def _film_select() -> Select:
+    """A function building the film query with the director and genres embedded.
+
+    Genres are aggregated by a correlated subquery evaluated only for the
+    returned rows, so a page of films costs a single round trip.
+    Returns:
+        Select: The film query."""
+    genres = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            literal_column("'genre_id'"), genre_table.c.id,
+                            literal_column("'genre_name'"), genre_table.c.name,
+                        ),
+                        genre_table.c.name,
+                    )
+                ),
+                literal_column("'[]'::json"),
+            )
+        )
+        .select_from(
+            film_genre_table
+            .join(genre_table, film_genre_table.c.genre_id == genre_table.c.id)
+        )
+        .where(film_genre_table.c.film_id == film_table.c.id)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            film_table.c.id,
+            film_table.c.title,
+            film_table.c.description,
+            film_table.c.release_year,
+            director_table.c.id.label("director_id"),
+            director_table.c.name.label("director_name"),
+            director_table.c.birth_year.label("birth_year"),
+            type_coerce(genres, JSON).label("genres"),
+        )
+        .select_from(
+            film_table
+            .join(director_table, film_table.c.director_id == director_table.c.id)
+        )
+    )
+
+
+def film_page_query(limit: int, cursor: str | None, sort: FilmSort) -> Select:
+    """A function building the query of a page of all films.
+
+    Args:
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (FilmSort): The sort key.
+    Returns:
+        Select: The paginated film query, fetching one extra row."""
+    return paginate(_film_select(), sort, FILM_SORT_COLUMNS[sort], film_table.c.id, limit, cursor)
+
+
+def _json_object(**fields: ColumnElement) -> ColumnElement:
+    """A function building a `json_build_object` call from named fields.
+    Args:
+        **fields (ColumnElement): The values by JSON key.
+    Returns:
+        ColumnElement: The JSON object expression."""
+    arguments = []
+    for key, value in fields.items():
+        arguments += [literal_column(f"'{key}'"), value]
+    return func.json_build_object(*arguments)
+
+
+def _json_page(query: Select) -> Select:
+    """A function rendering a paginated film query into JSON inside Postgres.
+
+    The items are aggregated into one JSON array of the `FilmDTO` shape and
+    returned as text, next to the position of the last item the cursor is
+    built from, so no film row is decoded or serialized in Python. The
+    page size is the `limit` bind parameter.
+    Args:
+        query (Select): The film query from `keyset_page`, with one extra row.
+    Returns:
+        Select: A single row of `items`, `row_count`, the sort key and id of
+            the last item."""
+    page = query.subquery("page")
+    numbered = select(
+        page,
+        func.row_number().over(order_by=(page.c[SORT_KEY], page.c.id)).label("position"),
+    ).subquery("numbered")
+    film = numbered.c
+    limit = bindparam("limit", type_=Integer)
+    document = _json_object(
+        id=film.id,
+        title=film.title,
+        description=film.description,
+        release_year=film.release_year,
+        director=_json_object(
+            director_id=film.director_id,
+            director_name=film.director_name,
+            birth_year=film.birth_year,
+        ),
+        genres=film.genres,
+    )
+    is_last = film.position == limit
+    return select(
+        cast(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(document, film.position))
+                .filter(film.position <= limit),
+                literal_column("'[]'::json"),
+            ),
+            Text,
+        ).label("items"),
+        func.count().label("row_count"),
+        func.min(film[SORT_KEY]).filter(is_last).label(SORT_KEY),
+        func.min(film.id).filter(is_last).label("id"),
+    )
+
+
+def _genre_filter(genre_match: GenreMatch) -> ColumnElement:
+    """A function building the semi-join filtering films by genres.
+
+    The genres are the `genre_ids` array parameter. Films needing any of
+    them are found with an EXISTS probe and films needing all of them by
+    counting their matching genres against the `genre_count` parameter,
+    both answered from the `film_genres` primary key, so no join rows are
+    multiplied and no DISTINCT step is needed.
+    Args:
+        genre_match (GenreMatch): Whether a film needs any or all of them.
+    Returns:
+        ColumnElement: The filter clause."""
+    is_requested = and_(
+        film_genre_table.c.film_id == film_table.c.id,
+        film_genre_table.c.genre_id == any_(int_array_param("genre_ids")),
+    )
+    if genre_match == "all":
+        matched = select(func.count()).select_from(film_genre_table).where(is_requested)
+        return matched.scalar_subquery() == bindparam("genre_count", type_=Integer)
+    return exists().where(is_requested)
+
+
+def _search_query(
+        title: bool,
+        genre_match: GenreMatch | None,
+        director_name: bool,
+        year: bool,
+        fulltext: bool,
+        sort: FilmSearchSort,
+        after: bool,
+) -> Select:
+    """A function building the search query of one combination of filters.
+
+    The filter values are the `title_pattern`, `title`, `genre_ids`,
+    `genre_count`, `director_name`, `year` and `fulltext` bind parameters.
+    Args:
+        title (bool): Whether films are filtered by title.
+        genre_match (GenreMatch | None): How films are filtered by genres,
+            None if they are not.
+        director_name (bool): Whether films are filtered by director.
+        year (bool): Whether films are filtered by release year.
+        fulltext (bool): Whether films are filtered by a full-text query.
+        sort (FilmSearchSort): The sort key.
+        after (bool): Whether the page starts after a cursor.
+    Returns:
+        Select: The paginated search query."""
+    query = _film_select()
+    title_term = bindparam("title", type_=String)
+    fulltext_query = bindparam("fulltext", type_=String)
+
+    if title:
+        query = query.where(contains(film_table.c.title, bindparam("title_pattern", type_=String)))
+    if genre_match:
+        query = query.where(_genre_filter(genre_match))
+    if director_name:
+        query = query.where(director_table.c.name == bindparam("director_name", type_=String))
+    if year:
+        query = query.where(film_table.c.release_year == bindparam("year", type_=Integer))
+    if fulltext:
+        query = query.where(matches(film_search_vector, fulltext_query))
+
+    if sort != "relevance":
+        sort_column = FILM_SORT_COLUMNS[sort]
+    elif fulltext:
+        sort_column = rank(film_search_vector, fulltext_query)
+    elif title:
+        sort_column = relevance(film_table.c.title, title_term)
+    else:
+        sort_column = film_table.c.id
+
+    return keyset_page(query, sort_column, film_table.c.id, after)
+
+
+def _page_statements(
+        name: str,
+        build: Callable[[FilmSort, bool], Select],
+) -> dict[tuple[str, bool], Statement]:
+    """A function registering a paginated statement for every sort key.
+
+    Args:
+        name (str): The statement name prefix.
+        build (Callable[[FilmSort, bool], Select]): The query builder taking
+            the sort key and whether the page starts after a cursor.
+    Returns:
+        dict[tuple[str, bool], Statement]: The statements by sort key and
+            whether they start after a cursor."""
+    return {
+        (sort, after): statements.register(
+            f"{name}:{sort}:{'after' if after else 'first'}",
+            build(sort, after),
+        )
+        for sort in FILM_SORT_COLUMNS
+        for after in (False, True)
+    }
+
+
+FILM_BY_ID = statements.register(
+    "film_by_id",
+    _film_select().where(film_table.c.id == bindparam("film_id", type_=Integer)),
+)
+FILM_PAGES = _page_statements(
+    "film_page",
+    lambda sort, after: keyset_page(_film_select(), FILM_SORT_COLUMNS[sort], film_table.c.id, after),
+)
+FILM_JSON_PAGES = _page_statements(
+    "film_page_json",
+    lambda sort, after: _json_page(
+        keyset_page(_film_select(), FILM_SORT_COLUMNS[sort], film_table.c.id, after)
+    ),
+)
 class FilmRepository(IFilmRepository):
-    async def get_all_films(self) -> Iterable[Any]:
-        """The method for getting all films from the database.
-                Returns:
-                    Iterable[Any]: The collection of the all films.
+    """A class implementing the film repository.
+
+    Genres needed one film at a time are resolved through a batch loader,
+    so lookups made within one loop tick share one query. Directors need
+    no loader, as every film query joins them in.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the 'film repository'."""
+        self._genres: BatchLoader[int, list[Genre]] = BatchLoader(load_film_genres, default=list)
+
+    async def get_all_films(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> PageDTO:
+        """The method for getting a page of all films from the database.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSort): The sort key.
+        Returns:
+            PageDTO: The page of films.
                 """
-        query = (
-            select(
-                film_table,
-                director_table.c.id.label("director_id"),
-                director_table.c.name.label("director_name"),
-                director_table.c.birth_year,
+        films = await FILM_PAGES[sort, bool(cursor)].fetch_all(**keyset_params(sort, limit, cursor))
+        return build_page(films, sort, limit, FilmDTO.dump_record)
 
-            )
-            .select_from(
-                film_table
-                .join(director_table, film_table.c.director_id == director_table.c.id)
-            )
+    async def get_all_films_json(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> bytes:
+        """The method for getting a page of all films rendered by Postgres.
+            The JSON text built by the database is passed through unchanged,
+            only the cursor is added around it.
+            Args:
+                limit (int): The page size.
+                cursor (str | None): The cursor of the previous page.
+                sort (FilmSort): The sort key.
+            Returns:
+                bytes: The JSON of the page."""
+        page = await FILM_JSON_PAGES[sort, bool(cursor)].fetch_one(
+            limit=limit,
+            **keyset_params(sort, limit, cursor),
         )
-        films = await database.fetch_all(query)
-        return [FilmDTO.from_record(film) for film in films]
+        next_cursor = (
+            encode_cursor(sort, page[SORT_KEY], page["id"]) if page["row_count"] > limit
+            else None
+        )
+        return PageDTO.render(page["items"].encode(), next_cursor)
+
+    async def stream_films(self) -> AsyncIterator[FilmDTO]:
+        """The method for streaming every film from the database.
+
+        Rows are read through a server-side cursor in one transaction, so
+        the stream is a consistent snapshot of the catalog and memory use
+        stays constant no matter how large it is.
+        Yields:
+            FilmDTO: The next film ordered by id."""
+        query = _film_select().order_by(film_table.c.id)
+        async for film in reader().iterate(query):
+            yield FilmDTO.from_record(film)
 
     async def search_films(
             self,
             title: str | None = None,
             genre_ids: list[int] | None = None,
+            genre_match: GenreMatch = "any",
             director_name: str | None = None,
             year: int | None = None,
-    ) -> Iterable[Any]:
+            fulltext: str | None = None,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSearchSort | None = None,
+    ) -> PageDTO:
         """The method for searching a film from the database with various filters.
+        Every combination of filters is compiled into a statement once, so
+        later searches of the same shape only bind new values.
         Args:
             title (str): Part of film's title.
             genre_ids (list[int]): Film's genres.
+            genre_match (GenreMatch): Whether a film needs any or all of the genres.
             director_name (str): Name of the film's director.
             year (int): Release year.
+            fulltext (str): Full-text query over title and description.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSearchSort): The sort key, relevance if `fulltext` is given.
         Returns:
-            Iterable[Any]: List of films that match the criteria."""
-        query = (
-            select(
-                film_table,
-                director_table.c.id.label("director_id"),
-                director_table.c.name.label("director_name"),
-                director_table.c.birth_year.label("birth_year"),
-            )
-            .select_from(
-                film_table
-                .join(director_table, film_table.c.director_id == director_table.c.id)
-                .outerjoin(film_genre_table, film_table.c.id == film_genre_table.c.film_id)
-                .outerjoin(genre_table, film_genre_table.c.genre_id == genre_table.c.id)
-            )
-            .distinct(film_table.c.id)
+            PageDTO: The page of films that match the criteria."""
+        sort = sort or ("relevance" if fulltext else "id")
+        genre_match = genre_match if genre_ids else None
+        shape = (
+            bool(title),
+            genre_match,
+            bool(director_name),
+            bool(year),
+            bool(fulltext),
+            sort,
+            bool(cursor),
+        )
+        statement = statements.get_or_register(
+            "film_search:" + ":".join(str(part) for part in shape),
+            lambda: _search_query(*shape),
         )
 
-        if title:
-            query = query.where(film_table.c.title.ilike(f"%{title}%"))
-        if genre_ids:
-            query = query.where(genre_table.c.id.in_(genre_ids))
-        if director_name:
-            query = query.where(director_table.c.name == director_name)
-        if year:
-            query = query.where(film_table.c.release_year == year)
-
-        films = await database.fetch_all(query)
-        return [FilmDTO.from_record(film) for film in films]
+        unique_genre_ids = sorted(set(genre_ids or ()))
+        films = await statement.fetch_all(
+            title_pattern=like_pattern(title) if title else None,
+            title=title,
+            genre_ids=unique_genre_ids,
+            genre_count=len(unique_genre_ids),
+            director_name=director_name,
+            year=year,
+            fulltext=fulltext,
+            **keyset_params(sort, limit, cursor),
+        )
+        return build_page(films, sort, limit, FilmDTO.dump_record)
 
     async def get_film_by_id(self, film_id: int) -> Any | None:
         """The method for getting a film from the database by its id.
         Args:
             film_id (int): A film's id.
         Returns:
-            Any | None: Film in the database if it exists."""
-        query = (
-            select(
-                film_table,
-                director_table.c.id.label("director_id"),
-                director_table.c.name.label("director_name"),
-                director_table.c.birth_year.label("birth_year"),
-            ).select_from(
-                film_table
-                .join(director_table, film_table.c.director_id == director_table.c.id)
-            ).where(
-            film_table.c.id == film_id
-            )
-        )
-        film =  await database.fetch_one(query)
-        return Film(**dict(film)) if film else None
+            Any | None: Film with its director and genres if it exists."""
+        film = await FILM_BY_ID.fetch_one(film_id=film_id)
+        return FilmDTO.from_record(film) if film else None
 
     async def add_film_genre(self, film_id: int, genre_id: int) -> Iterable[Any] | None:
         """The method for adding a genre to a film.
-        Args:
-            film_id (int): A film's id.
-            genre_id (int): A genre's id.
-        Returns:
-            Iterable[Any]: List of a film's genres."""
-        query = film_genre_table.insert().values(film_id=film_id, genre_id=genre_id)
-        await database.execute(query)
-        query = film_genre_table.select().where(film_genre_table.c.film_id == film_id)
+            The pair is inserted only if both the film and the genre exist,
+            and the film's genres are returned by the same statement.
+            Args:
+                film_id (int): A film's id.
+                genre_id (int): A genre's id.
+            Returns:
+                Iterable[Any] | None: List of a film's genres, None if the
+                    film or the genre does not exist."""
+        added = (
+            insert(film_genre_table)
+            .from_select(
+                ["film_id", "genre_id"],
+                select(film_table.c.id, genre_table.c.id)
+                .where(film_table.c.id == film_id)
+                .where(genre_table.c.id == genre_id),
+            )
+            .on_conflict_do_nothing()
+            .returning(film_genre_table.c.film_id, film_genre_table.c.genre_id)
+            .cte("added")
+        )
+        query = union_all(
+            select(added.c.film_id, added.c.genre_id, true().label("added")),
+            select(film_genre_table.c.film_id, film_genre_table.c.genre_id, false())
+            .where(film_genre_table.c.film_id == film_id)
+            .where(exists().where(genre_table.c.id == genre_id)),
+        )
         film_genres = await database.fetch_all(query)
-        return [dict(film_genre) for film_genre in film_genres]
+        if not film_genres:
+            return None
+
+        if any(film_genre["added"] for film_genre in film_genres):
+            table_versions.bump(film_genre_table.name)
+        return [
+            {"film_id": film_genre["film_id"], "genre_id": film_genre["genre_id"]}
+            for film_genre in film_genres
+        ]
+
+    async def set_film_genres(self, data: FilmGenresIn) -> FilmGenresDTO:
+        """The method for adding, removing or replacing genres of many films.
+            The requested pairs are bound as two arrays and unnested in the
+            database, so any number of films costs the same few statements.
+            Args:
+                data (FilmGenresIn): Genre ids per film and the assignment mode.
+            Returns:
+                FilmGenresDTO: Numbers of added and removed pairs, or the
+                    missing ids if nothing was changed."""
+        pairs = [
+            (film_id, genre_id)
+            for film_id, genre_ids in data.films.items()
+            for genre_id in genre_ids
+        ]
+        requested = (
+            func.unnest(
+                int_array([film_id for film_id, _ in pairs]),
+                int_array([genre_id for _, genre_id in pairs]),
+            )
+            .table_valued("film_id", "genre_id")
+            .render_derived(name="requested")
+        )
+        requested_pairs = select(requested.c.film_id, requested.c.genre_id)
+        assigned_pair = tuple_(film_genre_table.c.film_id, film_genre_table.c.genre_id)
+        result = FilmGenresDTO()
+
+        async with database.transaction():
+            if data.mode != "remove":
+                genre_ids = {genre_id for _, genre_id in pairs}
+                result.missing_film_ids = sorted(
+                    data.films.keys() - await existing_ids(film_table.c.id, data.films)
+                )
+                result.missing_genre_ids = sorted(
+                    genre_ids - await existing_ids(genre_table.c.id, genre_ids)
+                )
+                if result.missing_film_ids or result.missing_genre_ids:
+                    return result
+
+            if data.mode == "remove":
+                result.removed = await count_rows(
+                    film_genre_table.delete().where(assigned_pair.in_(requested_pairs))
+                )
+            elif data.mode == "replace":
+                result.removed = await count_rows(
+                    film_genre_table.delete()
+                    .where(film_genre_table.c.film_id == any_(int_array(list(data.films))))
+                    .where(assigned_pair.not_in(requested_pairs))
+                )
+
+            if data.mode != "remove":
+                result.added = await count_rows(
+                    insert(film_genre_table)
+                    .from_select(["film_id", "genre_id"], requested_pairs)
+                    .on_conflict_do_nothing()
+                )
+
+        table_versions.bump(film_genre_table.name)
+        return result
 
     async def get_film_genres(self, film_id: int) -> Iterable[Any] | None:
         """The method for getting a film's genres.
-        Args:
-            film_id (int): A film's id.
-        Returns:
-            Iterable[Any]: List of a film's genres."""
+            Lookups of many films within one loop tick share one query.
+            Args:
+                film_id (int): A film's id.
+            Returns:
+                Iterable[Any]: List of a film's genres."""
+        return await self._genres.load(film_id)
+
+    async def create_film(self, data: FilmIn) -> Any | None:
+        """The method for creating a new film in database.
+            Args:
+                data (FilmIn): Attributes of the film.
+            Returns:
+                Any | None: Newly created film. """
         query = (
-            select(
+            film_table.insert()
+            .values(**data.model_dump())
+            .returning(*film_table.c)
+        )
+        new_film = await database.fetch_one(query)
+        table_versions.bump(film_table.name)
+        return Film(**dict(new_film)) if new_film else None
+
+    async def create_films(
+            self,
+            data: list[FilmBatchItem],
+            partial: bool = False,
+    ) -> BatchDTO:
+        """The method for creating a batch of films with their genres.
+            The directors and genres of the whole batch are validated with
+            one query each, then films and `film_genres` rows are written
+            with multi-row inserts inside a single transaction.
+            Args:
+                data (list[FilmBatchItem]): Attributes and genre ids of the films.
+                partial (bool): Whether to create the valid films when
+                    some items are rejected.
+            Returns:
+                BatchDTO: Created ids in input order and per-item errors."""
+        async with database.transaction():
+            directors = await existing_ids(
+                director_table.c.id,
+                (item.director_id for item in data),
+            )
+            genres = await existing_ids(
                 genre_table.c.id,
-                genre_table.c.name,
-            ).select_from(
-                film_table
-                .outerjoin(film_genre_table, film_table.c.id == film_genre_table.c.film_id)
-                .outerjoin(genre_table, film_genre_table.c.genre_id == genre_table.c.id)
-            ).where(
-                film_table.c.id == film_id
+                (genre_id for item in data for genre_id in item.genre_ids),
             )
-        )
-        genres = await database.fetch_all(query)
-        return [Genre(**dict(genre)) for genre in genres]
 
-    async def create_film(self, data: FilmIn) -> Any | None:
-        """The method for creating a film entry in database.
-        Args:
-            data (FilmIn): Attributes of the film.
-        Returns:
-              Any | None: Newly created film."""
-        query = (film_table.insert()
-                 .values(**data.model_dump()))
-        new_film_id = await database.execute(query)
-        new_film = await self._get_by_id(new_film_id)
-        return Film(**dict(new_film)) if new_film else None
+            errors = []
+            valid = []
+            for index, item in enumerate(data):
+                if item.director_id not in directors:
+                    detail = f"Director {item.director_id} not found"
+                elif missing := sorted(set(item.genre_ids) - genres):
+                    detail = f"Genres {missing} not found"
+                else:
+                    valid.append(index)
+                    continue
+                errors.append(BatchErrorDTO(index=index, detail=detail))
+
+            ids: list[int | None] = [None] * len(data)
+            if not valid or (errors and not partial):
+                return BatchDTO(ids=ids, errors=errors)
+
+            film_ids = await reserve_ids(film_table, len(valid))
+            films = []
+            film_genres = []
+            for index, film_id in zip(valid, film_ids):
+                item = data[index]
+                ids[index] = film_id
+                films.append({"id": film_id, **item.model_dump(exclude={"genre_ids"})})
+                film_genres.extend(
+                    {"film_id": film_id, "genre_id": genre_id}
+                    for genre_id in dict.fromkeys(item.genre_ids)
+                )
+
+            for rows in chunked(films):
+                await database.execute(film_table.insert().values(list(rows)))
+            for rows in chunked(film_genres):
+                await database.execute(film_genre_table.insert().values(list(rows)))
+
+        table_versions.bump(film_table.name, film_genre_table.name)
+        return BatchDTO(ids=ids, errors=errors)
 
     async def update_film(self, film_id: int, data: FilmIn) -> Any | None:
         """The method for updating film data in database.
@@ -153,39 +624,32 @@ class FilmRepository(IFilmRepository):
                 film_id (int): Film's id.
                 data (FilmIn): New attributes for the film.
             Returns:
-                Any | None: Updated film. """
-
-        if await self._get_by_id(film_id):
-            query = (
-                film_table.update()
-                .where(film_table.c.id == film_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-            film = await self._get_by_id(film_id)
-            return Film(**dict(film)) if film else None
-        return None
-    async def delete_film(self, film_id: int) -> bool:
-        """The method for deleting film data from the database.
-        Args:
-            film_id (int): Film's id.
-        Returns:
-            bool: Success of the operation."""
-        if await self._get_by_id(film_id):
-            query = film_table \
-                .delete() \
-                .where(film_table.c.id == film_id)
-            await database.execute(query)
+                Any | None: Updated film, None if it does not exist. """
+        query = (
+            film_table.update()
+            .where(film_table.c.id == film_id)
+            .values(**data.model_dump())
+            .returning(*film_table.c)
+        )
+        film = await database.fetch_one(query)
+        if film is None:
+            return None
 
-            return True
-        return False
+        table_versions.bump(film_table.name)
+        return Film(**dict(film))
 
-    async def _get_by_id(self, film_id: int) -> Record | None:
-        """A private method for getting a film from the db by its ID.
+    async def delete_film(self, film_id: int) -> bool:
+        """The method for deleting a film from the database.
             Args:
                 film_id (int): Film's id.
             Returns:
-                Any | None: Film record if possible."""
-        query = (film_table.select()
-                 .where(film_table.c.id == film_id))
-        return await database.fetch_one(query)
\ No newline at end of file
+                bool: Operation's success, False if it does not exist."""
+        query = (
+            film_table.delete()
+            .where(film_table.c.id == film_id)
+            .returning(film_table.c.id)
+        )
+        deleted = await database.fetch_val(query) is not None
+        if deleted:
+            table_versions.bump(film_table.name)
+        return deleted
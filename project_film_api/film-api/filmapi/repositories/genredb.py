@@ -3,8 +3,19 @@ from typing import Any, Iterable
 from asyncpg import Record  # type: ignore
 from sqlalchemy import select, join
 
+from filmapi.cache.snapshot import TableSnapshot
+from filmapi.cache.versions import table_versions
+from filmapi.config import config
 from filmapi.domain.film import Film
+from filmapi.dto.pagedto import PageDTO
 from filmapi.repositories.igenre import IGenreRepository
+from filmapi.repositories.search import trigram_distance
+from filmapi.repositories.pagination import (
+    DEFAULT_LIMIT,
+    NAME_SORT_KEYS,
+    NameSearchSort,
+    NameSort,
+)
 from filmapi.domain.genre import Genre, GenreIn
 from filmapi.db import (
     genre_table,
@@ -13,30 +24,85 @@ from filmapi.db import (
     database, director_table,
 )
 
+
+def _to_genre(record: Record) -> Genre:
+    """A function converting a genre record into the domain model.
+    Args:
+        record (Record): The DB record.
+    Returns:
+        Genre: The genre model."""
+    return Genre(**dict(record))
+
+
+async def _load_genres() -> list[Genre]:
+    """A function reading every genre for the in-memory snapshot.
+    It reads the primary, since reloads follow changes noticed there and
+    a lagging replica would keep stale rows until the next change.
+    Returns:
+        list[Genre]: All genres."""
+    return [_to_genre(record) for record in await database.fetch_all(genre_table.select())]
+
+
 class GenreRepository(IGenreRepository):
-    async def get_all_genres(self) -> Iterable[Any]:
-        """The method for getting all genres from the database.
+    """A class implementing the genre repository.
+
+    The table is small and rarely written, so reads are served from an
+    in-memory snapshot reloaded whenever the table version changes.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the 'genre repository'."""
+        self._snapshot = TableSnapshot(
+            genre_table.name,
+            _load_genres,
+            NAME_SORT_KEYS,
+            config.SNAPSHOT_MAX_AGE,
+        )
 
+    async def get_all_genres(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The method for getting a page of all genres from the database.
+
+                Args:
+                    limit (int): The page size.
+                    cursor (str | None): The cursor of the previous page.
+                    sort (NameSort): The sort key.
                 Returns:
-                    Iterable[Any]: The collection of the all genres.
+                    PageDTO: The page of genres.
                 """
-        query = (genre_table.select()
-                 .order_by(genre_table.c.name.asc()))
-        genres = await database.fetch_all(query)
-        return [Genre(**genre) for genre in genres]
-    
-    async def get_genre_by_name(self, name: str) -> Iterable[Any]:
+        snapshot = await self._snapshot.get()
+        return snapshot.page(sort, limit, cursor)
+
+    async def get_genre_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The method for getting genres by a part of their name.
             Args:
                 name (str): Part of genre's name.
+                limit (int): The page size.
+                cursor (str | None): The cursor of the previous page.
+                sort (NameSearchSort): The sort key.
             Returns:
-                Iterable[Any]: The collection of genres that match.
+                PageDTO: The page of genres that match.
                 """
-        query = (genre_table.select()
-                 .where(genre_table.c.name.ilike(f'%{name}%'))
-                 .order_by(genre_table.c.name.asc()))
-        genres = await database.fetch_all(query)
-        return [Genre(**dict(genre)) for genre in genres]
+        term = name.casefold()
+        snapshot = await self._snapshot.get()
+        return snapshot.page(
+            sort,
+            limit,
+            cursor,
+            match=lambda genre: term in (genre.name or "").casefold(),
+            rank=(lambda genre: trigram_distance(name, genre.name or "")) if sort == "relevance"
+            else None,
+        )
 
     async def get_by_id(self, genre_id: int) -> Any | None:
         """The method for getting a genre by its id.
@@ -44,9 +110,8 @@ class GenreRepository(IGenreRepository):
                 genre_id (int): Genre's id.
             Returns:
                 Any | None: Genre from the database."""
-
-        genre = await self._get_by_id(genre_id)
-        return Genre(**dict(genre)) if genre else None
+        snapshot = await self._snapshot.get()
+        return snapshot.by_id.get(genre_id)
 
     async def create_genre(self, data: GenreIn) -> Any | None:
         """The method for creating a new genre in database.
@@ -54,10 +119,13 @@ class GenreRepository(IGenreRepository):
                 data (GenreIn): Attributes of the genre.
             Returns:
                 Any | None: Newly created genre. """
-        query = (genre_table.insert()
-                 .values(**data.model_dump()))
-        new_genre_id = await database.execute(query)
-        new_genre = await self._get_by_id(new_genre_id)
+        query = (
+            genre_table.insert()
+            .values(**data.model_dump())
+            .returning(*genre_table.c)
+        )
+        new_genre = await database.fetch_one(query)
+        table_versions.bump(genre_table.name)
         return Genre(**dict(new_genre)) if new_genre else None
 
     async def edit_genre(self, genre_id: int, data: GenreIn) -> Any | None:
@@ -66,40 +134,32 @@ class GenreRepository(IGenreRepository):
                 genre_id (int): Genre's id.
                 data (GenreIn): New attributes for the genre.
             Returns:
-                Any | None: Updated genre. """
-
-        if await self._get_by_id(genre_id):
-            query = (
-                genre_table.update()
-                .where(genre_table.c.id == genre_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-            genre = await self._get_by_id(genre_id)
-            return Genre(**dict(genre)) if genre else None
-        return None
+                Any | None: Updated genre, None if it does not exist. """
+        query = (
+            genre_table.update()
+            .where(genre_table.c.id == genre_id)
+            .values(**data.model_dump())
+            .returning(*genre_table.c)
+        )
+        genre = await database.fetch_one(query)
+        if genre is None:
+            return None
+
+        table_versions.bump(genre_table.name)
+        return Genre(**dict(genre))
 
     async def delete_genre(self, genre_id: int) -> bool:
         """The method for deleting a genre from the database.
             Args:
                 genre_id (int): Genre's id.
             Returns:
-                bool: Operation's success."""
-        if await self._get_by_id(genre_id):
-            query = genre_table \
-                .delete() \
-                .where(genre_table.c.id == genre_id)
-            await database.execute(query)
-
-            return True
-        return False
-
-    async def _get_by_id(self, genre_id: int) -> Record | None:
-        """A private method for getting a genre from the db by its ID.
-            Args:
-                genre_id (int): Genre's id.
-            Returns:
-                Any | None: Genre record if possible."""
-        query = (genre_table.select()
-                 .where(genre_table.c.id == genre_id))
-        return await database.fetch_one(query)
\ No newline at end of file
+                bool: Operation's success, False if it does not exist."""
+        query = (
+            genre_table.delete()
+            .where(genre_table.c.id == genre_id)
+            .returning(genre_table.c.id)
+        )
+        deleted = await database.fetch_val(query) is not None
+        if deleted:
+            table_versions.bump(genre_table.name)
+        return deleted
\ No newline at end of file
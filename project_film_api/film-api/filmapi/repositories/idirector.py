@@ -3,22 +3,42 @@ from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
 from filmapi.domain.director import Director, DirectorIn
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import DEFAULT_LIMIT, NameSearchSort, NameSort
 
 
 class IDirectorRepository(ABC):
     @abstractmethod
-    async def get_all_directors(self) -> Iterable[Any]:
-        """Abstract for getting all directors.
+    async def get_all_directors(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """Abstract for getting a page of all directors.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
+            PageDTO: The page of directors in database."""
 
     @abstractmethod
-    async def get_director_by_name(self, name: str) -> Iterable[Any]:
+    async def get_director_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """Abstract for getting a director by a part of its name.
         Args:
             name (str): Part of the director's name.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSearchSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
+            PageDTO: The page of directors in database."""
     @abstractmethod
     async def get_director_by_id(self, director_id: int) -> Any | None:
         """Abstract for getting a director by its id.
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from filmapi.utils.catalog import ExportFormat
+
+
+class IExportRepository(ABC):
+    @abstractmethod
+    def export_catalog(self, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        """Abstract for streaming the whole catalog from the repository.
+        Args:
+            fmt (ExportFormat): The output format.
+        Returns:
+            AsyncIterator[bytes]: The chunks of the encoded catalog."""
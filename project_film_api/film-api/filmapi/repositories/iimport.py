@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from filmapi.dto.importdto import ImportDTO
+from filmapi.utils.catalog import ImportChunk
+
+
+class IImportRepository(ABC):
+    @abstractmethod
+    async def import_catalog(self, chunks: AsyncIterator[ImportChunk]) -> ImportDTO:
+        """Abstract for importing a parsed catalog into the repository.
+        Args:
+            chunks (AsyncIterator[ImportChunk]): The parsed catalog.
+        Returns:
+            ImportDTO: The import statistics."""
@@ -0,0 +1,212 @@
+"""A module containing the catalog import repository."""
+
+import logging
+import time
+from typing import AsyncIterator
+
+from sqlalchemy import (
+    ColumnElement,
+    any_,
+    exists,
+    func,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.schema import CreateTable
+
+from filmapi.cache.versions import table_versions
+from filmapi.db import (
+    database,
+    director_table,
+    film_genre_table,
+    film_import_table,
+    film_table,
+    genre_table,
+    versioned_tables,
+)
+from filmapi.dto.importdto import ImportDTO, ImportErrorDTO
+from filmapi.repositories.batch import count_rows
+from filmapi.repositories.iimport import IImportRepository
+from filmapi.utils.catalog import ImportChunk
+
+logger = logging.getLogger(__name__)
+
+IMPORT_LOCK_KEY = 0x66696C6D
+MAX_REPORTED_ERRORS = 100
+STAGING_COLUMNS = (
+    "line",
+    "title",
+    "description",
+    "release_year",
+    "director_name",
+    "birth_year",
+    "genres",
+)
+
+
+def _same_director(staged: ColumnElement) -> ColumnElement:
+    """A function matching directors to staged rows by name and birth year.
+
+    Args:
+        staged (ColumnElement): The staged columns.
+
+    Returns:
+        ColumnElement: The join condition.
+    """
+    return (
+        (director_table.c.name == staged.director_name)
+        & director_table.c.birth_year.is_not_distinct_from(staged.birth_year)
+    )
+
+
+def _same_film(staged: ColumnElement) -> ColumnElement:
+    """A function matching films to staged rows on their natural key.
+
+    Films are deduplicated on `(title, release_year, director)`.
+
+    Args:
+        staged (ColumnElement): The staged columns.
+
+    Returns:
+        ColumnElement: The join condition.
+    """
+    return (
+        (film_table.c.title == staged.title)
+        & film_table.c.release_year.is_not_distinct_from(staged.release_year)
+        & film_table.c.director_id.is_not_distinct_from(staged.director_id)
+    )
+
+
+class ImportRepository(IImportRepository):
+    """A class implementing the catalog import repository."""
+
+    async def import_catalog(self, chunks: AsyncIterator[ImportChunk]) -> ImportDTO:
+        """The method for importing a catalog into the database.
+            Rows are copied with binary COPY into a temporary staging
+            table, then merged into directors, genres, films and
+            film_genres with set-based statements in one transaction.
+            Args:
+                chunks (AsyncIterator[ImportChunk]): The parsed catalog.
+            Returns:
+                ImportDTO: The import statistics."""
+        report = ImportDTO()
+        started = time.perf_counter()
+
+        async with database.transaction():
+            await database.fetch_val(
+                select(func.pg_advisory_xact_lock(literal_column(str(IMPORT_LOCK_KEY)))),
+            )
+            await database.execute(CreateTable(film_import_table))
+            raw_connection = database.connection().raw_connection
+
+            async for chunk in chunks:
+                if chunk.rows:
+                    await raw_connection.copy_records_to_table(
+                        film_import_table.name,
+                        records=chunk.rows,
+                        columns=STAGING_COLUMNS,
+                    )
+                report.rows += len(chunk.rows)
+                report.rejected += len(chunk.errors)
+                report.errors.extend(
+                    ImportErrorDTO(line=line, detail=detail)
+                    for line, detail in chunk.errors[:MAX_REPORTED_ERRORS - len(report.errors)]
+                )
+                logger.info(
+                    "Copied %d rows (%.0f rows/s)",
+                    report.rows,
+                    report.rows / (time.perf_counter() - started),
+                )
+
+            await database.execute(text(f"ANALYZE {film_import_table.name}"))
+            await self._merge(report)
+        table_versions.bump(*(table.name for table in versioned_tables))
+
+        report.elapsed_seconds = time.perf_counter() - started
+        report.rows_per_second = report.rows / report.elapsed_seconds
+        logger.info(
+            "Imported %d rows in %.1f s (%.0f rows/s)",
+            report.rows,
+            report.elapsed_seconds,
+            report.rows_per_second,
+        )
+        return report
+
+    @staticmethod
+    async def _merge(report: ImportDTO) -> None:
+        """The method for merging the staging table into the catalog.
+            Args:
+                report (ImportDTO): The statistics to fill in."""
+        staged = film_import_table.c
+
+        report.directors_created = await count_rows(
+            director_table.insert().from_select(
+                ["name", "birth_year"],
+                select(staged.director_name, staged.birth_year)
+                .distinct()
+                .where(staged.director_name.is_not(None))
+                .where(~exists().where(_same_director(staged))),
+            )
+        )
+        await database.execute(
+            film_import_table.update().values(
+                director_id=select(func.min(director_table.c.id))
+                .where(_same_director(staged))
+                .scalar_subquery(),
+            ).where(staged.director_name.is_not(None))
+        )
+
+        report.genres_created = await count_rows(
+            insert(genre_table).from_select(
+                ["name"],
+                select(func.unnest(staged.genres).label("name")).distinct(),
+            ).on_conflict_do_nothing(index_elements=[genre_table.c.name])
+        )
+
+        # DISTINCT ON groups missing years together, like `_same_film`
+        # matches them, so every staged row finds the film it created.
+        latest = (
+            select(staged.title, staged.description, staged.release_year, staged.director_id)
+            .distinct(staged.title, staged.release_year, staged.director_id)
+            .order_by(
+                staged.title,
+                staged.release_year,
+                staged.director_id,
+                staged.line.desc(),
+            )
+            .subquery()
+        )
+        report.films_updated = await count_rows(
+            film_table.update()
+            .values(description=latest.c.description)
+            .where(_same_film(latest.c))
+            .where(film_table.c.description.is_distinct_from(latest.c.description))
+        )
+        report.films_created = await count_rows(
+            film_table.insert().from_select(
+                ["title", "description", "release_year", "director_id"],
+                select(latest).where(~exists().where(_same_film(latest.c))),
+            )
+        )
+        await database.execute(
+            film_import_table.update().values(
+                film_id=select(func.min(film_table.c.id))
+                .where(_same_film(staged))
+                .scalar_subquery(),
+            )
+        )
+
+        report.film_genres_created = await count_rows(
+            insert(film_genre_table).from_select(
+                ["film_id", "genre_id"],
+                select(staged.film_id, genre_table.c.id)
+                .distinct()
+                .join_from(
+                    film_import_table,
+                    genre_table,
+                    genre_table.c.name == any_(staged.genres),
+                ),
+            ).on_conflict_do_nothing()
+        )
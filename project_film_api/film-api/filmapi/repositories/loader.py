@@ -0,0 +1,169 @@
+"""A module containing loaders batching lookups made within one loop tick."""
+
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+from sqlalchemy import any_, select
+
+from filmapi.db import film_genre_table, genre_table, read_from_primary
+from filmapi.domain.genre import Genre
+from filmapi.repositories.batch import MAX_BATCH_SIZE, chunked, int_array_param
+from filmapi.repositories.statements import statements
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+_RETRY = object()
+
+
+class BatchLoader(Generic[KeyT, ValueT]):
+    """A loader resolving every key requested within one loop tick at once.
+
+    Keys passed to `load` are collected for one loop tick, then the first
+    caller to wake up resolves all of them with a single call of the batch
+    function, so code assembling many entities one by one issues one query
+    per kind of entity instead of one per entity. The batch runs in that
+    caller's task, on its request connection, and the other callers await
+    their results. Keys are deduplicated, missing ones resolve to the
+    default and a failed batch raises in every caller waiting on it. If
+    the resolving caller is cancelled, the others request their keys
+    again. Nothing is memoized between batches.
+
+    Keys are batched per database they are read from, so callers pinned
+    to the primary never share a batch read from the replica.
+    """
+
+    def __init__(
+            self,
+            batch_load: Callable[[list[KeyT]], Awaitable[Mapping[KeyT, ValueT]]],
+            default: Callable[[], ValueT | None] = lambda: None,
+            max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """The initializer of the loader.
+
+        Args:
+            batch_load (Callable[[list[KeyT]], Awaitable[Mapping[KeyT, ValueT]]]):
+                The function resolving a list of keys to their values.
+            default (Callable[[], ValueT | None]): The factory of the value
+                of a key the batch function did not return.
+            max_batch_size (int): The maximum number of keys in one call.
+        """
+        self._batch_load = batch_load
+        self._default = default
+        self._max_batch_size = max_batch_size
+        self._pending: dict[bool, dict[KeyT, list[asyncio.Future]]] = {}
+        self.batches = 0
+        self.keys = 0
+
+    async def load(self, key: KeyT) -> ValueT | None:
+        """A method requesting the value of a key in the next batch.
+
+        Args:
+            key (KeyT): The key.
+
+        Returns:
+            ValueT | None: The value, once the batch is resolved.
+        """
+        values = await self.load_many([key])
+        return values[0]
+
+    async def load_many(self, keys: Iterable[KeyT]) -> list[ValueT | None]:
+        """A method requesting the values of many keys in the next batch.
+
+        Args:
+            keys (Iterable[KeyT]): The keys.
+
+        Returns:
+            list[ValueT | None]: The values in the order of the keys.
+        """
+        keys = list(keys)
+        values: list[ValueT | None] = [None] * len(keys)
+        primary = read_from_primary.get()
+        loop = asyncio.get_running_loop()
+        waiting = range(len(keys))
+        while waiting:
+            pending = self._pending.setdefault(primary, {})
+            futures = {}
+            for index in waiting:
+                futures[index] = loop.create_future()
+                pending.setdefault(keys[index], []).append(futures[index])
+
+            await asyncio.sleep(0)
+            if self._pending.get(primary) is pending:
+                del self._pending[primary]
+                await self._resolve(pending)
+
+            waiting = []
+            for index, future in futures.items():
+                value = await future
+                if value is _RETRY:
+                    waiting.append(index)
+                else:
+                    values[index] = value
+        return values
+
+    async def _resolve(self, pending: dict[KeyT, list[asyncio.Future]]) -> None:
+        """A method running the batch function and handing out its results.
+
+        Args:
+            pending (dict[KeyT, list[asyncio.Future]]): The waiters by key.
+        """
+        try:
+            for batch in chunked(list(pending), self._max_batch_size):
+                self.batches += 1
+                self.keys += len(batch)
+                values = await self._batch_load(list(batch))
+                for key in batch:
+                    for future in pending[key]:
+                        if not future.done():
+                            future.set_result(values[key] if key in values else self._default())
+        except BaseException as e:
+            for futures in pending.values():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                        # Marks the exception as retrieved in case nobody awaits it.
+                        future.exception()
+                    else:
+                        future.set_result(_RETRY)
+            raise
+
+    def stats(self) -> dict:
+        """A method returning the batching counters.
+
+        Returns:
+            dict: The number of batches and of keys they resolved.
+        """
+        return {"batches": self.batches, "keys": self.keys}
+
+
+FILM_GENRES_BY_FILM_IDS = statements.register(
+    "film_genres_by_film_ids",
+    select(film_genre_table.c.film_id, genre_table.c.id, genre_table.c.name)
+    .select_from(
+        film_genre_table
+        .join(genre_table, film_genre_table.c.genre_id == genre_table.c.id)
+    )
+    .where(film_genre_table.c.film_id == any_(int_array_param("film_ids")))
+    .order_by(genre_table.c.name),
+)
+
+
+async def load_film_genres(film_ids: list[int]) -> dict[int, list[Genre]]:
+    """A function reading the genres of many films with one query.
+
+    Args:
+        film_ids (list[int]): The film ids.
+
+    Returns:
+        dict[int, list[Genre]]: The genres of every film having any, by
+            film id and ordered by name.
+    """
+    genres: dict[int, list[Genre]] = defaultdict(list)
+    for record in await FILM_GENRES_BY_FILM_IDS.fetch_all(film_ids=film_ids):
+        genres[record["film_id"]].append(Genre(id=record["id"], name=record["name"]))
+    return genres
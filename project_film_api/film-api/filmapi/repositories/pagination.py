@@ -0,0 +1,289 @@
+"""A module containing keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import bisect
+import json
+import math
+from typing import Any, Callable, Literal, Mapping, Sequence
+
+from asyncpg import Record  # type: ignore
+from sqlalchemy import ColumnElement, Integer, Select, bindparam, tuple_
+
+from filmapi.dto.pagedto import PageDTO
+
+FilmSort = Literal["id", "title", "release_year"]
+FilmSearchSort = Literal["id", "title", "release_year", "relevance"]
+NameSort = Literal["id", "name"]
+NameSearchSort = Literal["id", "name", "relevance"]
+PageRendering = Literal["app", "db"]
+
+# A missing name sorts as an empty one, like `coalesce(name, '')` in SQL.
+NAME_SORT_KEYS = {
+    "id": lambda item: item.id,
+    "name": lambda item: item.name or "",
+}
+
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+SORT_KEY = "sort_key"
+
+
+class InvalidCursorError(ValueError):
+    """An error raised when a client sends a malformed or foreign cursor."""
+
+
+def _is_int(value: Any) -> bool:
+    """A function checking whether a value fits an `INTEGER` column.
+
+    Args:
+        value (Any): The decoded value.
+
+    Returns:
+        bool: True if the value is an integer in the column range.
+    """
+    return type(value) is int and INT_MIN <= value <= INT_MAX
+
+
+def _is_text(value: Any) -> bool:
+    """A function checking whether a value fits a text column.
+
+    Args:
+        value (Any): The decoded value.
+
+    Returns:
+        bool: True if the value is a string Postgres accepts.
+    """
+    return isinstance(value, str) and "\x00" not in value
+
+
+def _is_number(value: Any) -> bool:
+    """A function checking whether a value fits a `double precision` key.
+
+    Args:
+        value (Any): The decoded value.
+
+    Returns:
+        bool: True if the value is a finite number.
+    """
+    return type(value) in (int, float) and math.isfinite(value)
+
+
+CURSOR_VALUE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "id": _is_int,
+    "title": _is_text,
+    "name": _is_text,
+    "release_year": _is_int,
+    "relevance": _is_number,
+}
+
+
+def encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    """A function encoding the position of the last row of a page.
+
+    Args:
+        sort (str): The sort key the page was ordered by.
+        value (Any): The sort key value of the last row.
+        last_id (int): The id of the last row.
+
+    Returns:
+        str: The opaque cursor.
+    """
+    payload = json.dumps([sort, value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, int]:
+    """A function decoding a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor.
+        sort (str): The sort key of the current request.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, was issued for a
+            different sort key or holds values of the wrong type.
+
+    Returns:
+        tuple[Any, int]: The sort key value and id of the last row.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if cursor_sort != sort:
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    if not _is_int(last_id) or not CURSOR_VALUE_CHECKS[sort](value):
+        raise InvalidCursorError("Malformed cursor")
+
+    return value, last_id
+
+
+def keyset_page(
+        query: Select,
+        sort_column: ColumnElement,
+        id_column: ColumnElement,
+        after: bool,
+) -> Select:
+    """A function applying keyset pagination with bound parameters.
+
+    The query is ordered by `(sort_column, id_column)` so an index on that
+    pair serves every page with a range scan, no matter how deep it is.
+    The position and page size are the `sort_value`, `last_id` and `fetch`
+    bind parameters filled by `keyset_params`, so one compiled statement
+    serves every page.
+
+    Args:
+        query (Select): The base query.
+        sort_column (ColumnElement): The column the sort key maps to.
+        id_column (ColumnElement): The unique tie-breaker column.
+        after (bool): Whether the page starts after a cursor.
+
+    Returns:
+        Select: The paginated query.
+    """
+    query = query.add_columns(sort_column.label(SORT_KEY))
+    last_id = bindparam("last_id", type_=Integer)
+    fetch = bindparam("fetch", type_=Integer)
+
+    if sort_column is id_column:
+        if after:
+            query = query.where(id_column > last_id)
+        return query.order_by(id_column).limit(fetch)
+
+    if after:
+        sort_value = bindparam("sort_value", type_=sort_column.type)
+        query = query.where(tuple_(sort_column, id_column) > tuple_(sort_value, last_id))
+    return query.order_by(sort_column, id_column).limit(fetch)
+
+
+def keyset_params(sort: str, limit: int, cursor: str | None = None) -> dict[str, Any]:
+    """A function building the bind parameters of a `keyset_page` query.
+
+    One extra row is fetched to find out whether a next page exists.
+
+    Args:
+        sort (str): The sort key name.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+
+    Returns:
+        dict[str, Any]: The values by bind parameter name.
+    """
+    params: dict[str, Any] = {"fetch": limit + 1}
+    if cursor:
+        params["sort_value"], params["last_id"] = decode_cursor(cursor, sort)
+    return params
+
+
+def paginate(
+        query: Select,
+        sort: str,
+        sort_column: ColumnElement,
+        id_column: ColumnElement,
+        limit: int,
+        cursor: str | None = None,
+) -> Select:
+    """A function applying keyset pagination to a query.
+
+    It is `keyset_page` with its parameters bound to the values of one
+    page, for queries built and compiled per request.
+
+    Args:
+        query (Select): The base query.
+        sort (str): The sort key name.
+        sort_column (ColumnElement): The column the sort key maps to.
+        id_column (ColumnElement): The unique tie-breaker column.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+
+    Returns:
+        Select: The paginated query.
+    """
+    page = keyset_page(query, sort_column, id_column, after=bool(cursor))
+    return page.params(**keyset_params(sort, limit, cursor))
+
+
+def build_page(
+        records: Sequence[Record],
+        sort: str,
+        limit: int,
+        convert: Callable[[Record], Any],
+) -> PageDTO:
+    """A function building a page out of records fetched by a paginated query.
+
+    The converted items are taken as they are, so a converter returning
+    plain data lets the page be serialized without validating any model.
+
+    Args:
+        records (Sequence[Record]): Up to `limit + 1` fetched records.
+        sort (str): The sort key name.
+        limit (int): The page size.
+        convert (Callable[[Record], Any]): The record to item converter.
+
+    Returns:
+        PageDTO: The page with a cursor to the next one, if it exists.
+    """
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        last = records[-1]
+        next_cursor = encode_cursor(sort, last[SORT_KEY], last["id"])
+
+    return PageDTO.model_construct(
+        items=[convert(record) for record in records],
+        next_cursor=next_cursor,
+    )
+
+
+def paginate_sorted(
+        keys: Sequence[tuple[Any, int]],
+        items: Sequence[Any],
+        sort: str,
+        limit: int,
+        cursor: str | None,
+        serialized: Mapping[int, bytes],
+) -> PageDTO:
+    """A function paginating items already sorted in memory.
+
+    The cursors are the same as those of `paginate`, and the position
+    after a cursor is found with a binary search over the keys.
+
+    Args:
+        keys (Sequence[tuple[Any, int]]): The ascending `(sort value, id)`
+            key of every item.
+        items (Sequence[Any]): The items in the order of `keys`.
+        sort (str): The sort key name.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        serialized (Mapping[int, bytes]): The JSON of every item by id.
+
+    Raises:
+        InvalidCursorError: If the cursor value cannot be compared
+            with the keys.
+
+    Returns:
+        PageDTO: The page with a cursor to the next one, if it exists.
+    """
+    start = 0
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort)
+        try:
+            start = bisect.bisect_right(keys, (value, last_id))
+        except TypeError as e:
+            raise InvalidCursorError("Cursor does not match the requested sort") from e
+
+    end = start + limit
+    page = items[start:end]
+    next_cursor = encode_cursor(sort, *keys[end - 1]) if end < len(items) else None
+
+    return PageDTO.from_serialized(
+        list(page),
+        next_cursor,
+        [serialized[item.id] for item in page],
+    )
@@ -0,0 +1,158 @@
+"""A module containing trigram and full-text search helpers."""
+
+import re
+from typing import Literal
+
+from sqlalchemy import ColumnElement, func, literal_column
+
+from filmapi.db import fts_config
+
+GenreMatch = Literal["any", "all"]
+
+LIKE_ESCAPE = "\\"
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def escape_like(term: str) -> str:
+    """A function escaping LIKE wildcards in user input.
+
+    Args:
+        term (str): The raw search term.
+
+    Returns:
+        str: The term matching itself literally in a LIKE pattern.
+    """
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def like_pattern(term: str) -> str:
+    """A function building the LIKE pattern of a substring search.
+
+    Args:
+        term (str): The searched text.
+
+    Returns:
+        str: The escaped term wrapped in wildcards.
+    """
+    return f"%{escape_like(term)}%"
+
+
+def contains(column: ColumnElement, term: str | ColumnElement) -> ColumnElement:
+    """A function building a case-insensitive substring filter.
+
+    The pattern is bound as a single parameter, so the `gin_trgm_ops`
+    index on the column serves it instead of a sequential scan.
+
+    Args:
+        column (ColumnElement): The searched column.
+        term (str | ColumnElement): The searched text, or a bind parameter
+            of its `like_pattern`.
+
+    Returns:
+        ColumnElement: The filter clause.
+    """
+    pattern = like_pattern(term) if isinstance(term, str) else term
+    return column.ilike(pattern, escape=LIKE_ESCAPE)
+
+
+def relevance(column: ColumnElement, term: str | ColumnElement) -> ColumnElement:
+    """A function building the trigram distance between a term and a column.
+
+    The distance is `1 - word_similarity(term, column)`, so ascending
+    order puts the closest matches first.
+
+    Args:
+        column (ColumnElement): The searched column.
+        term (str | ColumnElement): The searched text.
+
+    Returns:
+        ColumnElement: The distance expression.
+    """
+    return literal_column("1") - func.word_similarity(term, column)
+
+
+def matches(vector: ColumnElement, phrase: str | ColumnElement) -> ColumnElement:
+    """A function building a full-text match against a tsvector expression.
+
+    Args:
+        vector (ColumnElement): The indexed tsvector expression.
+        phrase (str | ColumnElement): The web-search style query, e.g.
+            `space -wars`.
+
+    Returns:
+        ColumnElement: The filter clause.
+    """
+    return vector.op("@@")(func.websearch_to_tsquery(fts_config, phrase))
+
+
+def rank(vector: ColumnElement, phrase: str | ColumnElement) -> ColumnElement:
+    """A function building the negated full-text rank of a tsvector expression.
+
+    The rank is negated, so ascending order puts the best matches first.
+
+    Args:
+        vector (ColumnElement): The indexed tsvector expression.
+        phrase (str | ColumnElement): The web-search style query.
+
+    Returns:
+        ColumnElement: The negated rank expression.
+    """
+    return -func.ts_rank_cd(vector, func.websearch_to_tsquery(fts_config, phrase))
+
+
+def trigrams(text: str) -> list[str]:
+    """A function extracting trigrams the way `pg_trgm` does.
+
+    Every word is lowercased and padded with two spaces in front and one
+    behind before it is split into trigrams.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[str]: The trigrams of the text in the order they appear.
+    """
+    grams = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_distance(term: str, text: str) -> float:
+    """A function computing the trigram distance in memory.
+
+    It mirrors `1 - word_similarity(term, text)` of `pg_trgm`, the
+    distance the SQL path orders by: the term is compared with the most
+    similar contiguous extent of the text's trigrams rather than with the
+    whole text, so a short term found in a long name is a close match.
+    Only extents starting and ending on a trigram of the term are tried,
+    as trimming any other trigram off an extent makes it more similar.
+
+    Args:
+        term (str): The searched text.
+        text (str): The compared text.
+
+    Returns:
+        float: The distance between 0 (the term is in the text) and 1.
+    """
+    term_grams = set(trigrams(term))
+    text_grams = trigrams(text)
+    shared = [i for i, gram in enumerate(text_grams) if gram in term_grams]
+    if not term_grams or not shared:
+        return 1.0
+
+    best = 0.0
+    for start_index, start in enumerate(shared):
+        extent = set()
+        previous = start
+        for end in shared[start_index:]:
+            extent.update(text_grams[previous:end + 1])
+            previous = end + 1
+            found = len(extent & term_grams)
+            best = max(best, found / (len(term_grams) + len(extent) - found))
+    return 1 - best
@@ -0,0 +1,201 @@
+"""A module containing the registry of statements compiled once."""
+
+import time
+from typing import Any, Callable
+
+from databases.backends.common.records import Record, create_column_maps
+from sqlalchemy import ClauseElement
+
+from filmapi.config import config
+from filmapi.db import database, reader
+
+
+class Statement:
+    """A query compiled to SQL once and run with bound parameters only.
+
+    The query is compiled the way `databases` compiles every query it
+    runs, but only once, so a call costs neither building the SQLAlchemy
+    construct nor compiling it. The SQL text is the same on every call,
+    so asyncpg's per-connection statement cache keeps it prepared on
+    every pooled connection after its first use there. Statements are
+    read-only, so they run against the database chosen by `reader`.
+    """
+
+    def __init__(self, name: str, query: ClauseElement) -> None:
+        """The initializer of the statement.
+
+        Args:
+            name (str): The name the statement is reported under.
+            query (ClauseElement): The query, its variable values bound
+                with named `bindparam`s.
+        """
+        self.name = name
+        self._dialect = database.dialect
+        compiled = query.compile(
+            dialect=self._dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        self._defaults = dict(compiled.params)
+        self._keys = sorted(self._defaults)
+        self.sql = compiled.string % {
+            key: f"${position}" for position, key in enumerate(self._keys, start=1)
+        }
+        self._bind_processors = compiled._bind_processors
+        self._result_columns = compiled._result_columns
+        self._column_maps = create_column_maps(self._result_columns)
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def _args(self, params: dict[str, Any]) -> list:
+        """A method ordering the parameters of a call.
+
+        Args:
+            params (dict[str, Any]): The values by bind parameter name.
+
+        Returns:
+            list: The positional arguments of the SQL text.
+        """
+        args = []
+        for key in self._keys:
+            value = params[key] if key in params else self._defaults[key]
+            processor = self._bind_processors.get(key)
+            args.append(processor(value) if processor else value)
+        return args
+
+    def _record_time(self, elapsed: float) -> None:
+        """A method adding a call to the timing statistics.
+
+        Args:
+            elapsed (float): Seconds the call took.
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    async def _fetch(self, method: str, params: dict[str, Any]) -> Any:
+        """A method running the statement on the request's connection.
+
+        Args:
+            method (str): The name of the asyncpg fetch method.
+            params (dict[str, Any]): The values of the bind parameters.
+
+        Returns:
+            Any: The result of the fetch method.
+        """
+        args = self._args(params)
+        started = time.perf_counter()
+        result = await reader().fetch_prepared(method, self.sql, args)
+        self._record_time(time.perf_counter() - started)
+        return result
+
+    async def fetch_all(self, **params: Any) -> list[Record]:
+        """A method running the statement and returning every row.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            list[Record]: The rows.
+        """
+        rows = await self._fetch("fetch", params)
+        return [
+            Record(row, self._result_columns, self._dialect, self._column_maps)
+            for row in rows
+        ]
+
+    async def fetch_one(self, **params: Any) -> Record | None:
+        """A method running the statement and returning its first row.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            Record | None: The row, None if there is none.
+        """
+        row = await self._fetch("fetchrow", params)
+        if row is None:
+            return None
+        return Record(row, self._result_columns, self._dialect, self._column_maps)
+
+    def stats(self) -> dict:
+        """A method returning the timing statistics.
+
+        Returns:
+            dict: The number of calls and their total, mean and max time.
+        """
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_time * 1000, 3),
+            "mean_ms": round(self.total_time * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_time * 1000, 3),
+        }
+
+
+class StatementRegistry:
+    """A registry of the precompiled statements by name.
+
+    Every statement stays prepared on the connections only while it fits
+    in asyncpg's per-connection statement cache, so the registry holds at
+    most `capacity` statements, half of `DB_STATEMENT_CACHE_SIZE` by
+    default to leave room for the queries run through `databases`.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """The initializer of the registry.
+
+        Args:
+            capacity (int): The maximum number of statements.
+        """
+        self.capacity = capacity
+        self._statements: dict[str, Statement] = {}
+
+    def register(self, name: str, query: ClauseElement) -> Statement:
+        """A method compiling a statement and registering it.
+
+        Args:
+            name (str): The unique statement name.
+            query (ClauseElement): The query with named bind parameters.
+
+        Raises:
+            RuntimeError: If the registry is full.
+
+        Returns:
+            Statement: The compiled statement.
+        """
+        if name not in self._statements and len(self._statements) >= self.capacity:
+            raise RuntimeError(
+                f"Cannot register statement {name}: the registry is full "
+                f"({self.capacity} statements), raise DB_STATEMENT_CACHE_SIZE"
+            )
+        statement = self._statements[name] = Statement(name, query)
+        return statement
+
+    def get_or_register(self, name: str, build: Callable[[], ClauseElement]) -> Statement:
+        """A method returning a statement, compiling it on its first use.
+
+        It serves queries with too many variants to compile up front, each
+        variant being compiled once under its own name.
+
+        Args:
+            name (str): The unique statement name.
+            build (Callable[[], ClauseElement]): The builder of the query.
+
+        Returns:
+            Statement: The compiled statement.
+        """
+        statement = self._statements.get(name)
+        if statement is None:
+            statement = self.register(name, build())
+        return statement
+
+    def stats(self) -> dict:
+        """A method returning the timing statistics of every statement.
+
+        Returns:
+            dict: The statistics by statement name.
+        """
+        return {name: statement.stats() for name, statement in sorted(self._statements.items())}
+
+
+statements = StatementRegistry(config.DB_STATEMENT_CACHE_SIZE // 2)
@@ -27,7 +27,7 @@ class UserRepository(IUserRepository):
         if await self.get_by_email(user.email):
             return None
 
-        user.password = hash_password(user.password)
+        user.password = await hash_password(user.password)
 
         query = user_table.insert().values(**user.model_dump())
         new_user_uuid = await database.execute(query)
@@ -0,0 +1,249 @@
+"""A module running the app with preloaded, forked server workers."""
+
+import gc
+import logging
+import math
+import os
+import signal
+import socket
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import uvicorn
+
+from filmapi.config import config
+
+logger = logging.getLogger(__name__)
+
+STARTUP_FAILURE = 3
+
+CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+CGROUP_V1_CPU_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+CGROUP_V1_CPU_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+
+
+def _cpu_quota() -> float | None:
+    """A function reading the CPU limit of the container.
+
+    Returns:
+        float | None: The number of CPUs the cgroup may use, None if it
+            is not limited.
+    """
+    try:
+        quota, period = CGROUP_V2_CPU_MAX.read_text().split()
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int(CGROUP_V1_CPU_QUOTA.read_text())
+        period = int(CGROUP_V1_CPU_PERIOD.read_text())
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 else None
+
+
+def available_cpus() -> int:
+    """A function counting the CPUs the process can actually use.
+
+    Both the CPU affinity and the cgroup quota of a container are taken
+    into account, so a container limited to two CPUs on a larger host
+    does not start a worker per host CPU.
+
+    Returns:
+        int: The number of usable CPUs, at least one.
+    """
+    cpus = len(os.sched_getaffinity(0))
+    quota = _cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+class _Worker(uvicorn.Server):
+    """A uvicorn server reporting how long after launch it became ready."""
+
+    def __init__(self, server_config: uvicorn.Config, launched: float) -> None:
+        """The initializer of the worker.
+
+        Args:
+            server_config (uvicorn.Config): The server configuration.
+            launched (float): The `perf_counter` time of the launch.
+        """
+        super().__init__(server_config)
+        self._launched = launched
+
+    async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+        """A method starting the server and logging the startup time.
+
+        Args:
+            sockets (list[socket.socket] | None): The shared listening sockets.
+        """
+        await super().startup(sockets)
+        if self.started:
+            logger.info(
+                "Worker %d ready %.0f ms after launch",
+                os.getpid(),
+                (time.perf_counter() - self._launched) * 1000,
+            )
+
+
+def worker_pool_size(workers: int) -> int:
+    """A function sharing the connection budget of a database among workers.
+
+    All workers together open at most `DB_MAX_CONNECTIONS` connections to
+    each database, which has to stay below its `max_connections`. Every
+    worker also keeps one connection listening for table changes, so its
+    pool gets what is left of its share, up to `DB_POOL_MAX_SIZE`.
+
+    Args:
+        workers (int): The number of worker processes.
+
+    Returns:
+        int: The maximum pool size of a worker, below one if the budget
+            cannot cover that many workers.
+    """
+    return min(config.DB_POOL_MAX_SIZE, config.DB_MAX_CONNECTIONS // workers - 1)
+
+
+def _run_worker(
+        server_config: uvicorn.Config,
+        sock: socket.socket,
+        launched: float,
+) -> None:
+    """A function running one worker in a forked process until it stops.
+
+    Args:
+        server_config (uvicorn.Config): The server configuration.
+        sock (socket.socket): The listening socket shared by the workers.
+        launched (float): The `perf_counter` time of the launch.
+    """
+    status = STARTUP_FAILURE
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        gc.enable()
+        worker = _Worker(server_config, launched)
+        worker.run(sockets=[sock])
+        status = 0 if worker.started else STARTUP_FAILURE
+    except BaseException:
+        logger.exception("Worker %d failed", os.getpid())
+    finally:
+        logging.shutdown()
+        os._exit(status)
+
+
+def serve(host: str, port: int, workers: int | None = None) -> int:
+    """A function serving the app with preloaded worker processes.
+
+    The app is imported once, its objects are moved out of the collected
+    generations with `gc.freeze()` and the workers are forked from the
+    loaded process, so they start without importing anything and share
+    its memory pages copy-on-write. Workers use uvloop and httptools when
+    they are installed, share one listening socket and are restarted if
+    they die, unless their startup failed. The pools of every worker are
+    sized so all workers stay within `DB_MAX_CONNECTIONS`.
+
+    Args:
+        host (str): The address to bind.
+        port (int): The port to bind.
+        workers (int | None): The number of worker processes, one per
+            usable CPU if None.
+
+    Returns:
+        int: The exit status of the server.
+    """
+    launched = time.perf_counter()
+    workers = workers or config.SERVER_WORKERS or available_cpus()
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+
+    pool_size = worker_pool_size(workers)
+    if pool_size < 1:
+        logger.error(
+            "DB_MAX_CONNECTIONS=%d cannot cover %d workers, each needing at least "
+            "two connections",
+            config.DB_MAX_CONNECTIONS,
+            workers,
+        )
+        return STARTUP_FAILURE
+
+    config.DB_POOL_MAX_SIZE = pool_size
+
+    gc.disable()
+    from filmapi.main import app
+
+    server_config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=config.SERVER_BACKLOG,
+        timeout_keep_alive=config.SERVER_KEEP_ALIVE,
+        access_log=config.SERVER_ACCESS_LOG,
+    )
+    sock = server_config.bind_socket()
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "Loaded the app in %.0f ms, starting %d workers (%s, %s) on %s:%d "
+        "with up to %d pooled connections each",
+        (time.perf_counter() - launched) * 1000,
+        workers,
+        loop,
+        http,
+        host,
+        port,
+        pool_size,
+    )
+
+    children: set[int] = set()
+    stopping = False
+
+    def spawn() -> None:
+        """A helper forking a new worker."""
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(server_config, sock, launched)
+        children.add(pid)
+
+    def stop(signum: int, _: object) -> None:
+        """A helper asking every worker to shut down gracefully."""
+        nonlocal stopping
+        stopping = True
+        for child in list(children):
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    gc.enable()
+
+    status = 0
+    while children:
+        try:
+            pid, wait_status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        code = os.waitstatus_to_exitcode(wait_status)
+        if stopping:
+            continue
+        if code == STARTUP_FAILURE:
+            logger.error("Worker %d failed to start, stopping", pid)
+            status = STARTUP_FAILURE
+            stop(signal.SIGTERM, None)
+        else:
+            logger.warning("Worker %d exited with %d, restarting it", pid, code)
+            spawn()
+
+    sock.close()
+    return status
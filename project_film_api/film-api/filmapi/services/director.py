@@ -1,7 +1,12 @@
 
-from typing import Iterable
+from typing import Any, Iterable
 
+from filmapi.cache.shared import SharedCache
+from filmapi.cache.singleflight import SingleFlight
 from filmapi.domain.director import Director, DirectorIn
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import DEFAULT_LIMIT, NameSearchSort, NameSort
 from filmapi.repositories.idirector import IDirectorRepository
 from filmapi.services.idirector import IDirectorService
 
@@ -9,29 +14,71 @@ from filmapi.services.idirector import IDirectorService
 class DirectorService(IDirectorService):
     """A class implementing the director service."""
     _repository: IDirectorRepository
+    _film_store: SharedCache[FilmDTO]
+    _flights: SingleFlight[tuple, Any]
 
-    def __init__(self, repository: IDirectorRepository) -> None:
+    def __init__(
+            self,
+            repository: IDirectorRepository,
+            film_store: SharedCache[FilmDTO],
+            flights: SingleFlight[tuple, Any],
+    ) -> None:
         """The initializer of the 'director service'.
 
         Args:
             repository (IDirectorRepository): The reference to the repository.
+            film_store (SharedCache[FilmDTO]): The shared cache of films,
+                cleared when a director changes.
+            flights (SingleFlight[tuple, Any]): The group coalescing
+                identical concurrent reads.
             """
         self._repository = repository
+        self._film_store = film_store
+        self._flights = flights
 
-    async def get_all_directors(self) -> Iterable[Director]:
-        """The abstract for getting all directors from the repository.
+    async def get_all_directors(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The abstract for getting a page of all directors from the repository.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
-        return await self._repository.get_all_directors()
+            PageDTO: The page of directors in database."""
+        return await self._flights.do(
+            ("directors", limit, cursor, sort),
+            lambda: self._repository.get_all_directors(limit, cursor, sort),
+        )
 
-    async def get_director_by_name(self, name: str) -> Iterable[Director]:
+    async def get_director_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The abstract for getting a director from the repository by a part of its name.
         Args:
             name (str): Part of the director's name.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSearchSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
+            PageDTO: The page of directors in database."""
 
-        return await self._repository.get_director_by_name(name)
+        return await self._flights.do(
+            ("director_search", name, limit, cursor, sort),
+            lambda: self._repository.get_director_by_name(
+                name,
+                limit,
+                cursor,
+                sort,
+            ),
+        )
 
     async def get_director_by_id(self, director_id: int) -> Director | None:
         """The abstract for getting a director from the repository by its id.
@@ -56,7 +103,9 @@ class DirectorService(IDirectorService):
             data (DirectorIn): Attributes of the director.
         Returns:
             Director | None: The updated director."""
-        return await self._repository.edit_director(director_id, data)
+        director = await self._repository.edit_director(director_id, data)
+        await self._film_store.clear()
+        return director
 
     async def delete_director(self, director_id: int) -> bool:
         """Abstract for deleting a director.
@@ -64,4 +113,6 @@ class DirectorService(IDirectorService):
             director_id (int): The id of the director.
         Returns:
             bool: Success of the operation."""
-        return await self._repository.delete_director(director_id)
\ No newline at end of file
+        deleted = await self._repository.delete_director(director_id)
+        await self._film_store.clear()
+        return deleted
\ No newline at end of file
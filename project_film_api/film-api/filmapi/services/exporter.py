@@ -0,0 +1,26 @@
+from typing import AsyncIterator
+
+from filmapi.repositories.iexport import IExportRepository
+from filmapi.services.iexport import IExportService
+from filmapi.utils.catalog import ExportFormat
+
+
+class ExportService(IExportService):
+    """A class implementing the catalog export service."""
+    _repository: IExportRepository
+
+    def __init__(self, repository: IExportRepository) -> None:
+        """The initializer of the 'export service'.
+
+        Args:
+            repository (IExportRepository): The reference to the repository.
+            """
+        self._repository = repository
+
+    def export_catalog(self, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        """The method for streaming the whole catalog.
+        Args:
+            fmt (ExportFormat): The output format.
+        Returns:
+            AsyncIterator[bytes]: The chunks of the encoded catalog."""
+        return self._repository.export_catalog(fmt)
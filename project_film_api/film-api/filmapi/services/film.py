@@ -1,52 +1,196 @@
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
-from filmapi.domain.film import Film, FilmIn
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.shared import SharedCache
+from filmapi.cache.singleflight import SingleFlight
+from filmapi.domain.film import Film, FilmBatchItem, FilmGenresIn, FilmIn
+from filmapi.dto.batchdto import BatchDTO
+from filmapi.dto.filmgenresdto import FilmGenresDTO
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.search import GenreMatch
+from filmapi.repositories.pagination import DEFAULT_LIMIT, FilmSearchSort, FilmSort
 from filmapi.repositories.ifilm import IFilmRepository
 from filmapi.services.ifilm import IFilmService
 
 
+def _search_key(
+        title: str | None,
+        genre_ids: list[int] | None,
+        genre_match: GenreMatch,
+        director_name: str | None,
+        year: int | None,
+        fulltext: str | None,
+        limit: int,
+        cursor: str | None,
+        sort: FilmSearchSort | None,
+) -> tuple:
+    """A function building the canonical cache key of a film search.
+
+    Filters matched case-insensitively are lowercased, empty filters are
+    dropped and genre ids are deduplicated and sorted, so equivalent
+    searches share one entry.
+    Returns:
+        tuple: The cache key."""
+    return (
+        title.lower() if title else None,
+        tuple(sorted(set(genre_ids))) if genre_ids else (),
+        genre_match if genre_ids and len(set(genre_ids)) > 1 else "any",
+        director_name or None,
+        year or None,
+        fulltext.lower() if fulltext else None,
+        sort or ("relevance" if fulltext else "id"),
+        limit,
+        cursor,
+    )
+
+
 class FilmService(IFilmService):
     """A class implementing the director service."""
     _repository: IFilmRepository
+    _cache: TTLCache[int, FilmDTO]
+    _store: SharedCache[FilmDTO]
+    _search_cache: TTLCache[tuple, PageDTO]
+    _flights: SingleFlight[tuple, Any]
 
-    def __init__(self, repository: IFilmRepository) -> None:
+    def __init__(
+            self,
+            repository: IFilmRepository,
+            cache: TTLCache[int, FilmDTO],
+            store: SharedCache[FilmDTO],
+            search_cache: TTLCache[tuple, PageDTO],
+            flights: SingleFlight[tuple, Any],
+    ) -> None:
         """The initializer of the 'film service'.
 
         Args:
             repository (IFilmRepository): The reference to the repository.
+            cache (TTLCache[int, FilmDTO]): The cache of films by id.
+            store (SharedCache[FilmDTO]): The cache of films by id shared
+                with the other workers.
+            search_cache (TTLCache[tuple, PageDTO]): The cache of
+                search result pages.
+            flights (SingleFlight[tuple, Any]): The group coalescing
+                identical concurrent reads.
             """
         self._repository = repository
+        self._cache = cache
+        self._store = store
+        self._search_cache = search_cache
+        self._flights = flights
 
-    async def get_all_films(self) -> Iterable[Film]:
-        """Abstract for getting all films.
+    async def get_all_films(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> PageDTO:
+        """Abstract for getting a page of all films.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSort): The sort key.
+        Returns:
+            PageDTO: The page of films in database."""
+        return await self._flights.do(
+            ("films", limit, cursor, sort),
+            lambda: self._repository.get_all_films(limit, cursor, sort),
+        )
+
+    async def get_all_films_json(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> bytes:
+        """The method for getting a page of all films rendered by the database.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSort): The sort key.
         Returns:
-            Iterable[Film]: Films in database."""
-        return await self._repository.get_all_films()
+            bytes: The JSON of the page."""
+        return await self._flights.do(
+            ("films_json", limit, cursor, sort),
+            lambda: self._repository.get_all_films_json(limit, cursor, sort),
+        )
+
+    def stream_films(self) -> AsyncIterator[Any]:
+        """The abstract for streaming every film from the repository.
+        Yields:
+            FilmDTO: The next film ordered by id."""
+        return self._repository.stream_films()
 
     async def search_films(
             self,
             title: str | None = None,
             genre_ids: list[int] | None = None,
+            genre_match: GenreMatch = "any",
             director_name: str | None = None,
             year: int | None = None,
-    ) -> Iterable[Any]:
+            fulltext: str | None = None,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSearchSort | None = None,
+    ) -> PageDTO:
         """The abstract for searching a film from the repository with various filters.
         Args:
             title (str): Part of film's title.
             genre_ids (list[int]): Film's genres.
+            genre_match (GenreMatch): Whether a film needs any or all of the genres.
             director_name (str): Name of the film's director.
             year (int): Release year.
+            fulltext (str): Full-text query over title and description.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSearchSort): The sort key, relevance if `fulltext` is given.
         Returns:
-            Iterable[Any]: List of films that match the criteria."""
-        return await self._repository.search_films(title, genre_ids, director_name, year)
+            PageDTO: The page of films that match the criteria."""
+        key = _search_key(
+            title=title,
+            genre_ids=genre_ids,
+            genre_match=genre_match,
+            director_name=director_name,
+            year=year,
+            fulltext=fulltext,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+        )
+        return await self._flights.do(
+            ("film_search", key),
+            lambda: self._search_cache.get_or_load(
+                key,
+                lambda: self._repository.search_films(
+                    title=title,
+                    genre_ids=genre_ids,
+                    genre_match=genre_match,
+                    director_name=director_name,
+                    year=year,
+                    fulltext=fulltext,
+                    limit=limit,
+                    cursor=cursor,
+                    sort=sort,
+                ),
+            ),
+        )
 
-    async def get_film_by_id(self, film_id: int) -> Film | None:
+    async def get_film_by_id(self, film_id: int) -> FilmDTO | None:
         """The abstract for getting a film by its id.
         Args:
             film_id (int): Film's id.
         Returns:
-            Film | None: Film in database if it exists."""
-        return await self._repository.get_film_by_id(film_id)
+            FilmDTO | None: Film with its director and genres if it exists."""
+        return await self._flights.do(
+            ("film", film_id),
+            lambda: self._cache.get_or_load(
+                film_id,
+                lambda: self._store.get_or_load(
+                    film_id,
+                    lambda: self._repository.get_film_by_id(film_id),
+                ),
+            ),
+        )
 
     async def create_film(self, data: FilmIn) -> Film | None:
         """The abstract for creating a new film in the repository.
@@ -54,7 +198,11 @@ class FilmService(IFilmService):
             data (FilmIn): Attributes of the film.
         Returns:
             Film | None: The newly created film. """
-        return await self._repository.create_film(data)
+        new_film = await self._repository.create_film(data)
+        if new_film:
+            self._cache.invalidate(new_film.id)
+            await self._store.invalidate(new_film.id)
+        return new_film
 
     async def add_film_genre(self, film_id: int, genre_id: int) -> Iterable[Any] | None:
         """Abstract for adding a genre to a film in the repository.
@@ -63,7 +211,23 @@ class FilmService(IFilmService):
             genre_id (int): A genre's id.
         Returns:
             Iterable[Any] | None: List of a film's genres."""
-        return await self._repository.add_film_genre(film_id, genre_id)
+        genres = await self._repository.add_film_genre(film_id, genre_id)
+        if genres is not None:
+            self._cache.invalidate(film_id)
+            await self._store.invalidate(film_id)
+        return genres
+
+    async def set_film_genres(self, data: FilmGenresIn) -> FilmGenresDTO:
+        """The method for adding, removing or replacing genres of many films.
+        Args:
+            data (FilmGenresIn): Genre ids per film and the assignment mode.
+        Returns:
+            FilmGenresDTO: Numbers of added and removed pairs, or the
+                missing ids if nothing was changed."""
+        result = await self._repository.set_film_genres(data)
+        self._cache.invalidate(*data.films)
+        await self._store.invalidate(*data.films)
+        return result
 
     async def get_film_genres(self, film_id: int) -> Iterable[Any] | None:
         """Abstract for getting a film's genres.
@@ -71,7 +235,28 @@ class FilmService(IFilmService):
             film_id (int): A film's id.
         Returns:
             Iterable[Any] | None: List of a film's genres."""
-        return await self._repository.get_film_genres(film_id)
+        return await self._flights.do(
+            ("film_genres", film_id),
+            lambda: self._repository.get_film_genres(film_id),
+        )
+
+    async def create_films(
+            self,
+            data: list[FilmBatchItem],
+            partial: bool = False,
+    ) -> BatchDTO:
+        """The method for creating a batch of films.
+        Args:
+            data (list[FilmBatchItem]): Attributes and genre ids of the films.
+            partial (bool): Whether to create the valid films when some
+                items are rejected.
+        Returns:
+            BatchDTO: Created ids in input order and per-item errors."""
+        batch = await self._repository.create_films(data, partial=partial)
+        created = [film_id for film_id in batch.ids if film_id is not None]
+        self._cache.invalidate(*created)
+        await self._store.invalidate(*created)
+        return batch
 
     async def update_film(self, film_id: int, data: FilmIn) -> Film | None:
         """The abstract for updating a film in the repository.
@@ -80,7 +265,10 @@ class FilmService(IFilmService):
             data (FilmIn): Attributes of the film
         Returns:
             Film | None: An updated film."""
-        return await self._repository.update_film(film_id, data)
+        film = await self._repository.update_film(film_id, data)
+        self._cache.invalidate(film_id)
+        await self._store.invalidate(film_id)
+        return film
 
     async def delete_film(self, film_id: int) -> bool:
         """The abstract for deleting a film from the repository.
@@ -88,4 +276,7 @@ class FilmService(IFilmService):
             film_id (int): A film's id.
         Returns:
             bool: success of the operation."""
-        return await self._repository.delete_film(film_id)
\ No newline at end of file
+        deleted = await self._repository.delete_film(film_id)
+        self._cache.invalidate(film_id)
+        await self._store.invalidate(film_id)
+        return deleted
\ No newline at end of file
@@ -1,7 +1,12 @@
 from abc import abstractmethod
-from typing import Iterable
+from typing import Any, Iterable
 
+from filmapi.cache.shared import SharedCache
+from filmapi.cache.singleflight import SingleFlight
 from filmapi.domain.genre import Genre, GenreIn
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import DEFAULT_LIMIT, NameSearchSort, NameSort
 from filmapi.repositories.igenre import IGenreRepository
 from filmapi.services.igenre import IGenreService
 
@@ -9,20 +14,45 @@ from filmapi.services.igenre import IGenreService
 class GenreService(IGenreService):
     """A class implementing the genre service."""
     _repository: IGenreRepository
+    _film_store: SharedCache[FilmDTO]
+    _flights: SingleFlight[tuple, Any]
 
-    def __init__(self, repository: IGenreRepository) -> None:
+    def __init__(
+            self,
+            repository: IGenreRepository,
+            film_store: SharedCache[FilmDTO],
+            flights: SingleFlight[tuple, Any],
+    ) -> None:
         """The initializer of the 'genre service'.
 
         Args:
             repository (IGenreRepository): The reference to the repository.
+            film_store (SharedCache[FilmDTO]): The shared cache of films,
+                cleared when a genre changes.
+            flights (SingleFlight[tuple, Any]): The group coalescing
+                identical concurrent reads.
             """
         self._repository = repository
+        self._film_store = film_store
+        self._flights = flights
 
-    async def get_all_genres(self) -> Iterable[Genre]:
-        """The abstract for getting all genres.
+    async def get_all_genres(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The abstract for getting a page of all genres.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSort): The sort key.
         Returns:
-            Iterable[Genre]: Genres in database."""
-        return await self._repository.get_all_genres()
+            PageDTO: The page of genres in database."""
+        return await self._flights.do(
+            ("genres", limit, cursor, sort),
+            lambda: self._repository.get_all_genres(limit, cursor, sort),
+        )
 
     async def get_by_id(self, genre_id: int) -> Genre | None:
         """The abstract for getting a genre by its id.
@@ -32,13 +62,30 @@ class GenreService(IGenreService):
             Genre | None: Genre in the database."""
         return await self._repository.get_by_id(genre_id)
 
-    async def get_genre_by_name(self, name: str) -> Iterable[Genre]:
+    async def get_genre_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The abstract for getting a genre by a part of its name.
         Args:
             name (str): Part of the genre's name.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSearchSort): The sort key.
         Returns:
-            Iterable[Genre]: List of genres."""
-        return await self._repository.get_genre_by_name(name)
+            PageDTO: The page of genres."""
+        return await self._flights.do(
+            ("genre_search", name, limit, cursor, sort),
+            lambda: self._repository.get_genre_by_name(
+                name,
+                limit,
+                cursor,
+                sort,
+            ),
+        )
 
     async def create_genre(self, data: GenreIn) -> Genre | None:
         """The abstract for creating a new genre.
@@ -55,7 +102,9 @@ class GenreService(IGenreService):
                 data (GenreIn): New attributes for the genre.
             Returns:
                 Any | None: Updated genre. """
-        return await self._repository.edit_genre(genre_id, data)
+        genre = await self._repository.edit_genre(genre_id, data)
+        await self._film_store.clear()
+        return genre
 
     async def delete_genre(self, genre_id: int) -> bool:
         """The abstract for deleting a genre.
@@ -63,4 +112,6 @@ class GenreService(IGenreService):
             genre_id (int): The id of the genre.
         Returns:
             bool: Success of the operation."""
-        return await self._repository.delete_genre(genre_id)
\ No newline at end of file
+        deleted = await self._repository.delete_genre(genre_id)
+        await self._film_store.clear()
+        return deleted
\ No newline at end of file
@@ -3,22 +3,42 @@ from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
 from filmapi.domain.director import Director, DirectorIn
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import DEFAULT_LIMIT, NameSearchSort, NameSort
 
 
 class IDirectorService(ABC):
     @abstractmethod
-    async def get_all_directors(self) -> Iterable[Director]:
-        """The abstract for getting all directors from the repository.
+    async def get_all_directors(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The abstract for getting a page of all directors from the repository.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
+            PageDTO: The page of directors in database."""
 
     @abstractmethod
-    async def get_director_by_name(self, name: str) -> Iterable[Director]:
+    async def get_director_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The abstract for getting a director from the repository by a part of its name.
         Args:
             name (str): Part of the director's name.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSearchSort): The sort key.
         Returns:
-            Iterable[Director]: Directors in database."""
+            PageDTO: The page of directors in database."""
     @abstractmethod
     async def get_director_by_id(self, director_id: int) -> Director | None:
         """The abstract for getting a director from the repository by its id.
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from filmapi.utils.catalog import ExportFormat
+
+
+class IExportService(ABC):
+    @abstractmethod
+    def export_catalog(self, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        """The abstract for streaming the whole catalog.
+        Args:
+            fmt (ExportFormat): The output format.
+        Returns:
+            AsyncIterator[bytes]: The chunks of the encoded catalog."""
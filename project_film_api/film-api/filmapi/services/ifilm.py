@@ -1,40 +1,86 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
-from filmapi.domain.film import Film, FilmIn
+from filmapi.domain.film import Film, FilmBatchItem, FilmGenresIn, FilmIn
+from filmapi.dto.batchdto import BatchDTO
+from filmapi.dto.filmgenresdto import FilmGenresDTO
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.search import GenreMatch
+from filmapi.repositories.pagination import DEFAULT_LIMIT, FilmSearchSort, FilmSort
 
 
 class IFilmService(ABC):
     @abstractmethod
-    async def get_all_films(self) -> Iterable[Film]:
-        """Abstract for getting all films.
+    async def get_all_films(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> PageDTO:
+        """Abstract for getting a page of all films.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSort): The sort key.
         Returns:
-            Iterable[Film]: Films from repository."""
+            PageDTO: The page of films from repository."""
+
+    @abstractmethod
+    async def get_all_films_json(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSort = "id",
+    ) -> bytes:
+        """Abstract for getting a page of all films rendered by the database.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSort): The sort key.
+        Returns:
+            bytes: The JSON of the page."""
+
+    @abstractmethod
+    def stream_films(self) -> AsyncIterator[Any]:
+        """Abstract for streaming every film from the repository.
+        Yields:
+            FilmDTO: The next film ordered by id."""
 
     @abstractmethod
     async def search_films(
             self,
             title: str | None = None,
             genre_ids: list[int] | None = None,
+            genre_match: GenreMatch = "any",
             director_name: str | None = None,
             year: int | None = None,
-    ) -> Iterable[Any]:
+            fulltext: str | None = None,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: FilmSearchSort | None = None,
+    ) -> PageDTO:
         """The abstract for searching a film from the repository with various filters.
         Args:
             title (str): Part of film's title.
             genre_ids (list[int]): Film's genres.
+            genre_match (GenreMatch): Whether a film needs any or all of the genres.
             director_name (str): Name of the film's director.
             year (int): Release year.
+            fulltext (str): Full-text query over title and description.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (FilmSearchSort): The sort key, relevance if `fulltext` is given.
         Returns:
-            Iterable[Any]: List of films that match the criteria."""
+            PageDTO: The page of films that match the criteria."""
 
     @abstractmethod
-    async def get_film_by_id(self, film_id: int) -> Film | None:
+    async def get_film_by_id(self, film_id: int) -> FilmDTO | None:
         """The abstract for getting a film from the repository by its id.
         Args:
             film_id (int): Film's id.
         Returns:
-            Film | None: Film in database if it exists."""
+            FilmDTO | None: Film with its director and genres if it exists."""
     @abstractmethod
     async def create_film(self, data: FilmIn) -> Film | None:
         """The abstract for creating a new film in the repository.
@@ -43,6 +89,20 @@ class IFilmService(ABC):
         Returns:
             Film | None: The newly created film. """
 
+    @abstractmethod
+    async def create_films(
+            self,
+            data: list[FilmBatchItem],
+            partial: bool = False,
+    ) -> BatchDTO:
+        """The abstract for creating a batch of films.
+        Args:
+            data (list[FilmBatchItem]): Attributes and genre ids of the films.
+            partial (bool): Whether to create the valid films when some
+                items are rejected.
+        Returns:
+            BatchDTO: Created ids in input order and per-item errors."""
+
     @abstractmethod
     async def update_film(self, film_id: int, data: FilmIn) -> Film | None:
         """The abstract for updating a film in the repository.
@@ -61,6 +121,15 @@ class IFilmService(ABC):
         Returns:
             Iterable[Any] | None: List of a film's genres."""
 
+    @abstractmethod
+    async def set_film_genres(self, data: FilmGenresIn) -> FilmGenresDTO:
+        """The abstract for adding, removing or replacing genres of many films.
+        Args:
+            data (FilmGenresIn): Genre ids per film and the assignment mode.
+        Returns:
+            FilmGenresDTO: Numbers of added and removed pairs, or the
+                missing ids if nothing was changed."""
+
     @abstractmethod
     async def get_film_genres(self, film_id: int) -> Iterable[Any] | None:
         """Abstract for getting a film's genres.
@@ -2,14 +2,25 @@ from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
 from filmapi.domain.genre import Genre, GenreIn
+from filmapi.dto.pagedto import PageDTO
+from filmapi.repositories.pagination import DEFAULT_LIMIT, NameSearchSort, NameSort
 
 
 class IGenreService(ABC):
     @abstractmethod
-    async def get_all_genres(self) -> Iterable[Genre]:
-        """The abstract for getting all genres.
+    async def get_all_genres(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSort = "name",
+    ) -> PageDTO:
+        """The abstract for getting a page of all genres.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSort): The sort key.
         Returns:
-            Iterable[Genre]: Genres in database."""
+            PageDTO: The page of genres in database."""
 
     @abstractmethod
     async def get_by_id(self, genre_id: int) -> Genre | None:
@@ -20,12 +31,21 @@ class IGenreService(ABC):
             Genre | None: Genre from the database."""
 
     @abstractmethod
-    async def get_genre_by_name(self, name: str) -> Iterable[Genre]:
+    async def get_genre_by_name(
+            self,
+            name: str,
+            limit: int = DEFAULT_LIMIT,
+            cursor: str | None = None,
+            sort: NameSearchSort = "name",
+    ) -> PageDTO:
         """The abstract for getting a genre by a part of its name.
         Args:
             name (str): Part of the genre's name.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the previous page.
+            sort (NameSearchSort): The sort key.
         Returns:
-            Iterable[Genre]: List of genres."""
+            PageDTO: The page of genres."""
 
     @abstractmethod
     async def create_genre(self, data: GenreIn) -> Genre | None:
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from filmapi.dto.importdto import ImportDTO
+from filmapi.utils.catalog import CatalogFormat
+
+
+class IImportService(ABC):
+    @abstractmethod
+    async def import_catalog(self, stream: TextIO, fmt: CatalogFormat) -> ImportDTO:
+        """The abstract for importing a catalog file.
+        Args:
+            stream (TextIO): The opened catalog file.
+            fmt (CatalogFormat): The file format.
+        Returns:
+            ImportDTO: The import statistics."""
@@ -0,0 +1,53 @@
+from typing import Iterable, TextIO
+
+from starlette.concurrency import iterate_in_threadpool
+
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.shared import SharedCache
+from filmapi.dto.importdto import ImportDTO
+from filmapi.repositories.iimport import IImportRepository
+from filmapi.services.iimport import IImportService
+from filmapi.utils.catalog import CatalogFormat, read_chunks
+
+
+class ImportService(IImportService):
+    """A class implementing the catalog import service."""
+    _repository: IImportRepository
+    _caches: Iterable[TTLCache]
+    _stores: Iterable[SharedCache]
+
+    def __init__(
+            self,
+            repository: IImportRepository,
+            caches: Iterable[TTLCache],
+            stores: Iterable[SharedCache],
+    ) -> None:
+        """The initializer of the 'import service'.
+
+        Args:
+            repository (IImportRepository): The reference to the repository.
+            caches (Iterable[TTLCache]): The entity caches cleared after
+                an import.
+            stores (Iterable[SharedCache]): The shared entity caches
+                cleared after an import.
+            """
+        self._repository = repository
+        self._caches = caches
+        self._stores = stores
+
+    async def import_catalog(self, stream: TextIO, fmt: CatalogFormat) -> ImportDTO:
+        """The method for importing a catalog file.
+            The file is parsed chunk by chunk in a worker thread, so
+            parsing never blocks the event loop.
+        Args:
+            stream (TextIO): The opened catalog file.
+            fmt (CatalogFormat): The file format.
+        Returns:
+            ImportDTO: The import statistics."""
+        chunks = iterate_in_threadpool(read_chunks(stream, fmt))
+        report = await self._repository.import_catalog(chunks)
+        for cache in self._caches:
+            cache.clear()
+        for store in self._stores:
+            await store.clear()
+        return report
@@ -42,7 +42,7 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
+            if await verify_password(user.password, user_data.password):
                 token_details = generate_user_token(user_data.id)
                 # trunk-ignore(bandit/B106)
                 return TokenDTO(token_type="Bearer", **token_details)
@@ -0,0 +1,96 @@
+"""A module benchmarking the ways a page of films can be rendered."""
+
+import time
+from typing import Awaitable, Callable
+
+from filmapi.db import database
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.repositories.filmdb import FilmRepository, film_page_query
+from filmapi.repositories.pagination import FilmSort, build_page
+
+PageRenderer = Callable[[int, str | None, FilmSort], Awaitable[bytes]]
+
+
+async def _render_models(limit: int, cursor: str | None, sort: FilmSort) -> bytes:
+    """A function rendering a page through `FilmDTO.from_record` models.
+
+    Args:
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (FilmSort): The sort key.
+
+    Returns:
+        bytes: The JSON of the page.
+    """
+    films = await database.fetch_all(film_page_query(limit, cursor, sort))
+    return build_page(films, sort, limit, FilmDTO.from_record).to_json()
+
+
+async def _render_plain(limit: int, cursor: str | None, sort: FilmSort) -> bytes:
+    """A function rendering a page from plain data, as `/film/all` does.
+
+    Args:
+        limit (int): The page size.
+        cursor (str | None): The cursor of the previous page.
+        sort (FilmSort): The sort key.
+
+    Returns:
+        bytes: The JSON of the page.
+    """
+    films = await database.fetch_all(film_page_query(limit, cursor, sort))
+    return build_page(films, sort, limit, FilmDTO.dump_record).to_json()
+
+
+async def benchmark_film_pages(
+        limit: int,
+        pages: int,
+        rounds: int,
+        sort: FilmSort = "id",
+) -> list[dict]:
+    """A function timing every way of rendering the same pages of films.
+
+    The pages are walked once to collect their cursors, then every
+    renderer renders each of them `rounds` times. CPU time is the time
+    spent in this process, which is what rendering in Postgres saves.
+
+    Args:
+        limit (int): The page size.
+        pages (int): The number of consecutive pages to render.
+        rounds (int): The number of times every page is rendered.
+        sort (FilmSort): The sort key.
+
+    Returns:
+        list[dict]: The per page wall time, CPU time and size of every
+            renderer.
+    """
+    cursors: list[str | None] = [None]
+    while len(cursors) < pages:
+        films = await database.fetch_all(film_page_query(limit, cursors[-1], sort))
+        page = build_page(films, sort, limit, FilmDTO.dump_record)
+        if page.next_cursor is None:
+            break
+        cursors.append(page.next_cursor)
+
+    renderers: dict[str, PageRenderer] = {
+        "models": _render_models,
+        "plain": _render_plain,
+        "db": FilmRepository().get_all_films_json,
+    }
+    results = []
+    for name, render in renderers.items():
+        size = 0
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(rounds):
+            for cursor in cursors:
+                size += len(await render(limit, cursor, sort))
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+        rendered = rounds * len(cursors)
+        results.append({
+            "renderer": name,
+            "pages": rendered,
+            "wall_ms_per_page": round(wall * 1000 / rendered, 3),
+            "cpu_ms_per_page": round(cpu * 1000 / rendered, 3),
+            "bytes_per_page": size // rendered,
+        })
+    return results
@@ -0,0 +1,211 @@
+"""A module containing parsers for catalog import files."""
+
+import csv
+import json
+from typing import Any, Iterable, Iterator, Literal, NamedTuple, TextIO
+
+CatalogFormat = Literal["csv", "ndjson"]
+ExportFormat = Literal["csv", "ndjson", "parquet", "arrow"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+GENRE_SEPARATOR = "|"
+IMPORT_CHUNK_ROWS = 10000
+MAX_INT = 2 ** 31
+
+
+class ImportChunk(NamedTuple):
+    """A chunk of parsed catalog rows ready to be copied to the database."""
+    rows: list[tuple]
+    errors: list[tuple[int, str]]
+
+
+def _optional_int(value: Any) -> int | None:
+    """A function parsing an optional integer field.
+
+    Args:
+        value (Any): The raw field value.
+
+    Raises:
+        ValueError: If the value is not an integer.
+
+    Returns:
+        int | None: The parsed value, None if the field is empty.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{value!r} is not an integer")
+
+    if not -MAX_INT <= (number := int(value)) < MAX_INT:
+        raise ValueError(f"{value!r} is out of range")
+
+    return number
+
+
+def _optional_str(value: Any) -> str | None:
+    """A function parsing an optional text field.
+
+    Args:
+        value (Any): The raw field value.
+
+    Raises:
+        ValueError: If the value is a list or an object.
+
+    Returns:
+        str | None: The stripped text, None if the field is empty.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        raise ValueError(f"{value!r} is not a text")
+
+    return str(value).strip() or None
+
+
+def _genres(value: Any) -> list[str]:
+    """A function parsing the genre names of a film.
+
+    Args:
+        value (Any): A list of names or a `|` separated string.
+
+    Raises:
+        ValueError: If the value is neither a list nor a string.
+
+    Returns:
+        list[str]: The distinct, non-empty genre names.
+    """
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        value = value.split(GENRE_SEPARATOR)
+    if not isinstance(value, list):
+        raise ValueError(f"{value!r} is not a list of genres")
+
+    return list(dict.fromkeys(name for item in value if (name := _optional_str(item))))
+
+
+def _to_row(line: int, record: Any) -> tuple:
+    """A function converting a raw record into a staging table row.
+
+    Args:
+        line (int): The line number of the record.
+        record (Any): The decoded record.
+
+    Raises:
+        ValueError: If the record is not a valid film.
+
+    Returns:
+        tuple: The row in the order of the staging table columns.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Record is not an object")
+    if not (title := _optional_str(record.get("title"))):
+        raise ValueError("Missing title")
+    if not (director_name := _optional_str(record.get("director_name"))):
+        raise ValueError("Missing director_name")
+
+    return (
+        line,
+        title,
+        _optional_str(record.get("description")),
+        _optional_int(record.get("release_year")),
+        director_name,
+        _optional_int(record.get("birth_year")),
+        _genres(record.get("genres")),
+    )
+
+
+def _csv_records(stream: TextIO) -> Iterator[tuple[int, Any]]:
+    """A generator decoding CSV records with a header row.
+
+    Args:
+        stream (TextIO): The file opened with `newline=""`.
+
+    Yields:
+        tuple[int, Any]: The line number and the record.
+    """
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def _ndjson_records(stream: TextIO) -> Iterator[tuple[int, Any]]:
+    """A generator decoding newline delimited JSON records.
+
+    Args:
+        stream (TextIO): The opened file.
+
+    Yields:
+        tuple[int, Any]: The line number and the record, or the
+            `ValueError` raised while decoding it.
+    """
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            yield line, json.loads(text)
+        except ValueError as e:
+            yield line, e
+
+
+def read_chunks(
+        stream: TextIO,
+        fmt: CatalogFormat,
+        chunk_rows: int = IMPORT_CHUNK_ROWS,
+) -> Iterator[ImportChunk]:
+    """A generator parsing a catalog file into chunks of staging rows.
+
+    Only one chunk is held in memory at a time, so files of any size
+    are parsed with bounded memory.
+
+    Args:
+        stream (TextIO): The opened catalog file.
+        fmt (CatalogFormat): The file format.
+        chunk_rows (int): The maximum number of rows in a chunk.
+
+    Yields:
+        ImportChunk: The valid rows and the rejected line numbers
+            with the reasons.
+    """
+    records: Iterable[tuple[int, Any]] = (
+        _csv_records(stream) if fmt == "csv" else _ndjson_records(stream)
+    )
+    chunk = ImportChunk([], [])
+    for line, record in records:
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            chunk.rows.append(_to_row(line, record))
+        except ValueError as e:
+            chunk.errors.append((line, str(e)))
+
+        if len(chunk.rows) + len(chunk.errors) >= chunk_rows:
+            yield chunk
+            chunk = ImportChunk([], [])
+
+    if chunk.rows or chunk.errors:
+        yield chunk
+
+
+def detect_format(name: str) -> CatalogFormat | None:
+    """A function guessing the catalog format from a file name.
+
+    Args:
+        name (str): The file name.
+
+    Returns:
+        CatalogFormat | None: The format, None if it is not recognized.
+    """
+    name = name.lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+
+    return None
@@ -1,12 +1,134 @@
 """A module containing password helper methods."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
 
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"])
+from filmapi.config import config
+from filmapi.pool import release_request_connections
 
+ResultT = TypeVar("ResultT")
 
-def hash_password(password: str) -> str:
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__rounds=config.PASSWORD_BCRYPT_ROUNDS,
+)
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """An error raised when too many password operations are waiting."""
+
+
+class PasswordHasher:
+    """A bounded executor of the CPU heavy bcrypt operations.
+
+    bcrypt releases the GIL while hashing, so running it on a few threads
+    keeps the event loop serving other requests in the meantime. At most
+    `workers` operations run at once, at most `max_queue` wait for a
+    thread and any further one is rejected instead of piling up.
+
+    The database connections of the calling request go back to the pool
+    before it waits, so a burst of logins queued for a thread does not
+    keep the connections other requests need.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        """The initializer of the hasher.
+
+        Args:
+            workers (int): The maximum number of concurrent operations.
+            max_queue (int): The maximum number of waiting operations.
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = asyncio.Semaphore(workers)
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.total_time = 0.0
+
+    async def run(self, operation: Callable[..., ResultT], *args: str) -> ResultT:
+        """A method running an operation on a thread of the executor.
+
+        Args:
+            operation (Callable[..., ResultT]): The blocking operation.
+            *args (str): The arguments of the operation.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+
+        Returns:
+            ResultT: The result of the operation.
+        """
+        await release_request_connections()
+        if self._slots.locked() and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Too many password operations in progress")
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        waiting = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        self.total_wait += started - waiting
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, operation, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.total_time += time.perf_counter() - started
+            self._slots.release()
+
+    def stats(self) -> dict:
+        """A method returning the executor counters.
+
+        Returns:
+            dict: The concurrency, queue depth and timing of the operations.
+        """
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": self._average(self.total_wait),
+            "avg_time_ms": self._average(self.total_time),
+            "rounds": config.PASSWORD_BCRYPT_ROUNDS,
+        }
+
+    def _average(self, total: float) -> float:
+        """A private method computing the average duration per operation.
+
+        Args:
+            total (float): The accumulated duration in seconds.
+
+        Returns:
+            float: The average duration in milliseconds.
+        """
+        if not self.completed:
+            return 0.0
+        return round(total / self.completed * 1000, 3)
+
+
+password_hasher = PasswordHasher(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_MAX_QUEUE)
+
+
+async def hash_password(password: str) -> str:
     """A function generating has password.
 
     Args:
@@ -15,10 +137,10 @@ def hash_password(password: str) -> str:
     Returns:
         str: The hashed password.
     """
-    return pwd_context.hash(password)
+    return await password_hasher.run(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """A function verifying a password against its hash.
 
     Args:
@@ -28,4 +150,4 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return await password_hasher.run(pwd_context.verify, plain_password, hashed_password)
@@ -0,0 +1,67 @@
+"""Tests of the catalog file parsers."""
+
+import io
+import json
+
+from filmapi.utils.catalog import read_chunks
+
+
+def _ndjson(*records: object) -> io.StringIO:
+    """A function writing records as an NDJSON file.
+
+    Args:
+        *records (object): The records.
+
+    Returns:
+        io.StringIO: The opened file.
+    """
+    return io.StringIO("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_values_of_wrong_types_reject_their_line_only():
+    """Valid JSON with values of wrong types is rejected line by line."""
+    stream = _ndjson(
+        {"title": "a", "release_year": [1]},
+        {"title": "b", "genres": 5},
+        {"title": "c", "genres": [[1]]},
+        {"title": {"text": "d"}},
+        {"title": "e", "birth_year": 1.5},
+        {"title": "f", "director_name": "g"},
+        {
+            "title": "h",
+            "release_year": "1999",
+            "director_name": "i",
+            "genres": ["Drama", "Drama", ""],
+        },
+    )
+
+    chunks = list(read_chunks(stream, "ndjson"))
+
+    assert [line for chunk in chunks for line, _ in chunk.errors] == [1, 2, 3, 4, 5]
+    assert [row for chunk in chunks for row in chunk.rows] == [
+        (6, "f", None, None, "g", None, []),
+        (7, "h", None, 1999, "i", None, ["Drama"]),
+    ]
+
+
+def test_undecodable_lines_are_rejected():
+    """A line which is not JSON is reported with its number."""
+    stream = io.StringIO(
+        '{"title": "a", "director_name": "b"}\n{not json\n\n'
+        '{"title": "c", "director_name": "d"}\n'
+    )
+
+    chunks = list(read_chunks(stream, "ndjson"))
+
+    assert [line for chunk in chunks for line, _ in chunk.errors] == [2]
+    assert [row[1] for chunk in chunks for row in chunk.rows] == ["a", "c"]
+
+
+def test_films_without_a_director_are_rejected():
+    """Every imported film needs a director, as films created by the API."""
+    stream = io.StringIO('title,director_name\na,\nb,c\n')
+
+    chunks = list(read_chunks(stream, "csv"))
+
+    assert [chunk.errors for chunk in chunks] == [[(2, "Missing director_name")]]
+    assert [row[1] for chunk in chunks for row in chunk.rows] == ["b"]
@@ -0,0 +1,98 @@
+"""Tests of the cache key and caching of film searches."""
+
+import asyncio
+
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.memory import MemoryBackend
+from filmapi.cache.shared import SharedCache
+from filmapi.cache.singleflight import SingleFlight
+from filmapi.dto.filmdto import FilmDTO
+from filmapi.services.film import FilmService, _search_key
+
+
+def _key(**filters: object) -> tuple:
+    """A function building the key of a search with default filters.
+
+    Args:
+        **filters (object): The filters differing from the defaults.
+
+    Returns:
+        tuple: The cache key.
+    """
+    search = {
+        "title": None,
+        "genre_ids": None,
+        "genre_match": "any",
+        "director_name": None,
+        "year": None,
+        "fulltext": None,
+        "limit": 20,
+        "cursor": None,
+        "sort": None,
+    }
+    return _search_key(**{**search, **filters})
+
+
+def test_equivalent_searches_share_a_key():
+    """Searches differing only in ignored details get the same key."""
+    assert _key(title="Alien") == _key(title="ALIEN") == _key(title="alien")
+    assert _key(title="") == _key()
+    assert _key(genre_ids=[3, 1, 3]) == _key(genre_ids=[1, 3])
+    assert _key(genre_ids=[]) == _key(genre_ids=None, genre_match="all")
+    assert _key(genre_ids=[2], genre_match="all") == _key(genre_ids=[2, 2])
+    assert _key(director_name="", year=0) == _key()
+    assert _key(fulltext="Space Horror") == _key(fulltext="space horror")
+    assert _key(fulltext="space", sort="relevance") == _key(fulltext="space")
+    assert _key(sort="id") == _key()
+
+
+def test_different_searches_get_different_keys():
+    """Filters that change the result are kept apart."""
+    assert _key(genre_ids=[1, 2], genre_match="all") != _key(genre_ids=[1, 2])
+    assert _key(director_name="Ridley Scott") != _key(director_name="ridley scott")
+    assert _key(sort="title") != _key()
+    assert _key(limit=10) != _key()
+    assert _key(cursor="abc") != _key()
+
+
+class FakeRepository:
+    """A film repository counting the searches it runs."""
+
+    def __init__(self) -> None:
+        """The initializer of the repository."""
+        self.searches = 0
+
+    async def search_films(self, **filters: object) -> dict:
+        """A method answering a search.
+
+        Args:
+            **filters (object): The search filters.
+
+        Returns:
+            dict: The filters the search ran with.
+        """
+        self.searches += 1
+        await asyncio.sleep(0)
+        return filters
+
+
+def test_equivalent_searches_are_loaded_once():
+    """Concurrent and later equivalent searches share one database search."""
+    async def search() -> FakeRepository:
+        """A helper running equivalent searches through the service."""
+        repository = FakeRepository()
+        service = FilmService(
+            repository=repository,
+            cache=TTLCache(maxsize=10, ttl=60),
+            store=SharedCache(MemoryBackend(maxsize=10), "film", FilmDTO, ttl=60, negative_ttl=5),
+            search_cache=TTLCache(maxsize=10, ttl=60),
+            flights=SingleFlight(),
+        )
+        await asyncio.gather(
+            service.search_films(title="Alien", genre_ids=[2, 1]),
+            service.search_films(title="alien", genre_ids=[1, 2]),
+        )
+        await service.search_films(title="ALIEN", genre_ids=[1, 2, 2])
+        return repository
+
+    assert asyncio.run(search()).searches == 1
@@ -0,0 +1,95 @@
+"""Tests of the loader batching lookups made within one loop tick."""
+
+import asyncio
+
+import pytest
+
+from filmapi.repositories.loader import BatchLoader
+
+
+class FakeBatch:
+    """A batch function recording the keys of every call."""
+
+    def __init__(self) -> None:
+        """The initializer of the batch function."""
+        self.calls: list[list[int]] = []
+        self.release = asyncio.Event()
+        self.block_first = False
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        """A method resolving keys to their values, even keys only.
+
+        Args:
+            keys (list[int]): The requested keys.
+
+        Returns:
+            dict[int, str]: The values by key.
+        """
+        self.calls.append(keys)
+        if self.block_first and len(self.calls) == 1:
+            await self.release.wait()
+        return {key: f"value {key}" for key in keys if key % 2 == 0}
+
+
+def test_loads_of_one_tick_share_one_batch():
+    """N loads started within one tick are resolved by a single call."""
+    async def load() -> tuple[list, FakeBatch]:
+        """A helper loading the keys concurrently."""
+        batch = FakeBatch()
+        loader = BatchLoader(batch, default=lambda: "missing")
+        values = await asyncio.gather(*(loader.load(key) for key in [2, 4, 2, 5]))
+        return values, batch
+
+    values, batch = asyncio.run(load())
+
+    assert values == ["value 2", "value 4", "value 2", "missing"]
+    assert batch.calls == [[2, 4, 5]]
+
+
+def test_batches_are_split_at_the_maximum_size():
+    """A batch larger than the maximum size is resolved in chunks."""
+    async def load() -> FakeBatch:
+        """A helper loading more keys than fit in one call."""
+        batch = FakeBatch()
+        loader = BatchLoader(batch, max_batch_size=2)
+        await loader.load_many([0, 1, 2, 3, 4])
+        return batch
+
+    assert asyncio.run(load()).calls == [[0, 1], [2, 3], [4]]
+
+
+def test_waiters_retry_when_the_resolving_caller_is_cancelled():
+    """The keys of a cancelled caller's batch are requested again."""
+    async def load() -> tuple[str, FakeBatch]:
+        """A helper cancelling the caller resolving the batch."""
+        batch = FakeBatch()
+        batch.block_first = True
+        loader = BatchLoader(batch)
+        resolver = asyncio.create_task(loader.load(2))
+        waiter = asyncio.create_task(loader.load(4))
+        while not batch.calls:
+            await asyncio.sleep(0)
+
+        resolver.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await resolver
+        return await waiter, batch
+
+    value, batch = asyncio.run(load())
+
+    assert value == "value 4"
+    assert batch.calls == [[2, 4], [4]]
+
+
+def test_a_failed_batch_raises_in_every_caller():
+    """An error of the batch function reaches every waiting caller."""
+    async def failing(keys: list[int]) -> dict[int, str]:
+        """A batch function failing on every call."""
+        raise LookupError("batch failed")
+
+    async def load() -> list:
+        """A helper loading two keys through the failing batch."""
+        loader = BatchLoader(failing)
+        return await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(load())] == [LookupError, LookupError]
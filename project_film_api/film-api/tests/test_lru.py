@@ -0,0 +1,52 @@
+"""Tests of the in-process cache tied to table versions."""
+
+import asyncio
+
+from filmapi.cache.lru import TTLCache
+from filmapi.cache.versions import table_versions
+
+
+def test_entries_are_bounded_by_their_total_size():
+    """Least recently used values are evicted to fit the sized ones."""
+    cache = TTLCache(maxsize=10, ttl=60, size_of=len)
+    cache.store("a", "aaaa")
+    cache.store("b", "bbbb")
+    cache.lookup("a")
+    cache.store("c", "cccc")
+    cache.store("d", "d" * 11)
+
+    assert cache.lookup("a") == (True, "aaaa")
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("c") == (True, "cccc")
+    assert cache.lookup("d") == (False, None)
+    assert cache.stats()["size"] == 8
+
+
+def test_a_change_of_the_tables_drops_the_entries():
+    """An entry read before a write to its tables is not served."""
+    cache = TTLCache(maxsize=10, ttl=60, tables=["films"])
+    cache.store(1, "film")
+    table_versions.bump("films")
+
+    assert cache.lookup(1) == (False, None)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_missing_values_are_cached_and_invalidated():
+    """A missing entity is served from the cache until it is invalidated."""
+    async def load() -> list:
+        """A helper loading a missing entity around an invalidation."""
+        cache = TTLCache(maxsize=10, ttl=60, negative_ttl=5)
+        loads = []
+
+        async def missing() -> None:
+            """A loader finding nothing."""
+            loads.append(1)
+
+        await cache.get_or_load(1, missing)
+        await cache.get_or_load(1, missing)
+        cache.invalidate(1)
+        await cache.get_or_load(1, missing)
+        return loads
+
+    assert asyncio.run(load()) == [1, 1]
@@ -0,0 +1,136 @@
+"""Tests of password operations running next to catalog reads."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from passlib.hash import bcrypt
+
+from filmapi.db import database, film_table
+from filmapi.domain.user import UserIn
+from filmapi.pool import request_connections
+from filmapi.repositories.user import UserRepository
+from filmapi.services.user import UserService
+from filmapi.utils import password
+from filmapi.utils.password import PasswordHasher
+
+POOL_SIZE = 2
+ACQUIRE_TIMEOUT = 0.5
+LOGINS = 20
+READS = 20
+PASSWORD = "secret"
+PASSWORD_HASH = bcrypt.using(rounds=10).hash(PASSWORD)
+
+
+class FakeBackend:
+    """A database backend with a small pool and instant queries."""
+
+    def __init__(self) -> None:
+        """The initializer of the backend."""
+        self.slots = asyncio.Semaphore(POOL_SIZE)
+
+    def connection(self) -> "FakeConnection":
+        """A method creating a connection of the pool.
+
+        Returns:
+            FakeConnection: The connection.
+        """
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    """A pooled connection answering user and catalog queries."""
+
+    def __init__(self, backend: FakeBackend) -> None:
+        """The initializer of the connection.
+
+        Args:
+            backend (FakeBackend): The backend owning the pool.
+        """
+        self._backend = backend
+
+    async def acquire(self) -> None:
+        """A method checking the connection out within the acquire timeout."""
+        await asyncio.wait_for(self._backend.slots.acquire(), ACQUIRE_TIMEOUT)
+
+    async def release(self) -> None:
+        """A method returning the connection to the pool."""
+        self._backend.slots.release()
+
+    async def fetch_one(self, query: object) -> SimpleNamespace:
+        """A method returning the user every login looks up.
+
+        Args:
+            query (object): The user query.
+
+        Returns:
+            SimpleNamespace: The user.
+        """
+        await asyncio.sleep(0.001)
+        return SimpleNamespace(id=uuid4(), email="user@example.com", password=PASSWORD_HASH)
+
+    async def fetch_all(self, query: object) -> list:
+        """A method answering a catalog query.
+
+        Args:
+            query (object): The catalog query.
+
+        Returns:
+            list: No rows.
+        """
+        await asyncio.sleep(0.001)
+        return []
+
+
+async def _login(service: UserService) -> object:
+    """A function logging in the way a request does.
+
+    Args:
+        service (UserService): The user service.
+
+    Returns:
+        object: The token details.
+    """
+    async with request_connections():
+        return await service.authenticate_user(
+            UserIn(email="user@example.com", password=PASSWORD),
+        )
+
+
+async def _read_catalog() -> float:
+    """A function reading the catalog the way a request does.
+
+    Returns:
+        float: The seconds the read took.
+    """
+    started = time.perf_counter()
+    async with request_connections():
+        await database.fetch_all(film_table.select())
+    return time.perf_counter() - started
+
+
+async def _logins_and_reads() -> tuple[list, list]:
+    """A function running concurrent logins, then catalog reads among them.
+
+    Returns:
+        tuple[list, list]: The login results and the read durations.
+    """
+    service = UserService(UserRepository())
+    logins = [asyncio.create_task(_login(service)) for _ in range(LOGINS)]
+    await asyncio.sleep(0.05)
+    reads = await asyncio.gather(*(_read_catalog() for _ in range(READS)))
+    return await asyncio.gather(*logins), reads
+
+
+def test_logins_do_not_starve_catalog_reads(monkeypatch):
+    """Queued logins hold no connection, so catalog reads still get one."""
+    monkeypatch.setattr(database, "_backend", FakeBackend())
+    monkeypatch.setattr(database, "is_connected", True)
+    monkeypatch.setattr(password, "password_hasher", PasswordHasher(workers=2, max_queue=LOGINS))
+
+    tokens, reads = asyncio.run(_logins_and_reads())
+
+    assert all(token is not None for token in tokens)
+    assert max(reads) < ACQUIRE_TIMEOUT
+    assert password.password_hasher.stats()["max_queued"] >= POOL_SIZE
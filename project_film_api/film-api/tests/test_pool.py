@@ -0,0 +1,136 @@
+"""Tests of the connections shared within a request."""
+
+import asyncio
+
+from filmapi.db import database, film_table
+from filmapi.pool import release_request_connections, request_connections
+
+
+class FakeBackend:
+    """A database backend counting the connections checked out."""
+
+    def __init__(self) -> None:
+        """The initializer of the backend."""
+        self.checkouts = 0
+        self.in_use = 0
+
+    def connection(self) -> "FakeConnection":
+        """A method creating a connection of the pool.
+
+        Returns:
+            FakeConnection: The connection.
+        """
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    """A pooled connection answering every query with no rows."""
+
+    def __init__(self, backend: FakeBackend) -> None:
+        """The initializer of the connection.
+
+        Args:
+            backend (FakeBackend): The backend owning the pool.
+        """
+        self._backend = backend
+        self.raw_connection = self
+
+    async def acquire(self) -> None:
+        """A method checking the connection out."""
+        self._backend.checkouts += 1
+        self._backend.in_use += 1
+
+    async def release(self) -> None:
+        """A method returning the connection to the pool."""
+        self._backend.in_use -= 1
+
+    async def fetch_all(self, query: object) -> list:
+        """A method answering a query run through `databases`.
+
+        Args:
+            query (object): The query.
+
+        Returns:
+            list: No rows.
+        """
+        await asyncio.sleep(0)
+        return []
+
+    async def fetch(self, sql: str, *args: object) -> list:
+        """A method answering SQL text run directly on asyncpg.
+
+        Args:
+            sql (str): The SQL text.
+            *args (object): The parameters.
+
+        Returns:
+            list: No rows.
+        """
+        await asyncio.sleep(0)
+        return []
+
+
+def _use(monkeypatch) -> FakeBackend:
+    """A function making the database run on a fake backend.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        FakeBackend: The backend.
+    """
+    backend = FakeBackend()
+    monkeypatch.setattr(database, "_backend", backend)
+    monkeypatch.setattr(database, "is_connected", True)
+    return backend
+
+
+def test_a_request_checks_out_one_connection_for_all_its_queries(monkeypatch):
+    """Queries of a request and of the tasks it starts share a connection."""
+    backend = _use(monkeypatch)
+
+    async def request() -> int:
+        """A helper querying the way a request with a streamed body does."""
+        async with request_connections():
+            await database.fetch_all(film_table.select())
+            await asyncio.create_task(database.fetch_all(film_table.select()))
+            await database.fetch_prepared("fetch", "SELECT 1", [])
+            in_use = backend.in_use
+        return in_use
+
+    assert asyncio.run(request()) == 1
+    assert backend.checkouts == 1
+    assert backend.in_use == 0
+
+
+def test_a_released_request_checks_out_again(monkeypatch):
+    """A request giving its connection back early takes one for its next query."""
+    backend = _use(monkeypatch)
+
+    async def request() -> int:
+        """A helper releasing the connection between two queries."""
+        async with request_connections():
+            await database.fetch_all(film_table.select())
+            await release_request_connections()
+            in_use = backend.in_use
+            await database.fetch_all(film_table.select())
+        return in_use
+
+    assert asyncio.run(request()) == 0
+    assert backend.checkouts == 2
+    assert backend.in_use == 0
+
+
+def test_queries_outside_a_request_return_their_connection(monkeypatch):
+    """Without a request every query checks a connection out and back."""
+    backend = _use(monkeypatch)
+
+    async def queries() -> None:
+        """A helper running queries outside of any request."""
+        await database.fetch_all(film_table.select())
+        await database.fetch_all(film_table.select())
+
+    asyncio.run(queries())
+
+    assert backend.checkouts == 2
+    assert backend.in_use == 0
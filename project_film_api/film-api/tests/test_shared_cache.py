@@ -0,0 +1,45 @@
+"""Tests of the entity cache kept in a shared backend."""
+
+import asyncio
+
+from pydantic import BaseModel
+
+from filmapi.cache.memory import MemoryBackend
+from filmapi.cache.shared import SharedCache
+
+
+class Entity(BaseModel):
+    """A cached entity."""
+    version: int
+
+
+def test_a_load_racing_an_invalidation_is_not_served():
+    """A value loaded before another worker's invalidation is reloaded."""
+    async def race() -> tuple[Entity | None, Entity | None]:
+        """A helper invalidating an entity while a worker loads it."""
+        backend = MemoryBackend(maxsize=100)
+        first = SharedCache(backend, "film", Entity, ttl=60, negative_ttl=5)
+        second = SharedCache(backend, "film", Entity, ttl=60, negative_ttl=5)
+        loading = asyncio.Event()
+        written = asyncio.Event()
+
+        async def load_old() -> Entity:
+            """A loader reading the entity before the write."""
+            loading.set()
+            await written.wait()
+            return Entity(version=1)
+
+        async def load_new() -> Entity:
+            """A loader reading the entity after the write."""
+            return Entity(version=2)
+
+        racing = asyncio.create_task(first.get_or_load(1, load_old))
+        await loading.wait()
+        await second.invalidate(1)
+        written.set()
+        return await racing, await second.get_or_load(1, load_new)
+
+    raced, reread = asyncio.run(race())
+
+    assert raced == Entity(version=1)
+    assert reread == Entity(version=2)
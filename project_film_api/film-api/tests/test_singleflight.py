@@ -0,0 +1,109 @@
+"""Tests of the coalescing of identical concurrent reads."""
+
+import asyncio
+
+import pytest
+
+from filmapi.cache.singleflight import SingleFlight
+from filmapi.db import read_from_primary
+
+
+def test_identical_concurrent_loads_run_once():
+    """Callers of a key in flight get the result of its single load."""
+    async def load() -> tuple[list, list, dict]:
+        """A helper loading one key from several callers at once."""
+        flights = SingleFlight()
+        calls = []
+
+        async def slow() -> str:
+            """A loader taking a few loop iterations."""
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        values = await asyncio.gather(*(flights.do("key", slow) for _ in range(5)))
+        return values, calls, flights.stats()
+
+    values, calls, stats = asyncio.run(load())
+
+    assert values == ["value"] * 5
+    assert calls == [1]
+    assert stats == {"in_flight": 0, "loads": 1, "coalesced": 4}
+
+
+def test_a_waiter_takes_over_from_a_cancelled_leader():
+    """Cancelling the loading caller makes a waiter load the key again."""
+    async def load() -> tuple[str, list]:
+        """A helper cancelling the first caller while others wait."""
+        flights = SingleFlight()
+        calls = []
+        blocked = asyncio.Event()
+
+        async def first() -> str:
+            """A loader blocked until its caller is cancelled."""
+            calls.append("first")
+            await blocked.wait()
+            return "stale"
+
+        async def second() -> str:
+            """A loader completing right away."""
+            calls.append("second")
+            return "value"
+
+        leader = asyncio.create_task(flights.do("key", first))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flights.do("key", second))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter, calls
+
+    assert asyncio.run(load()) == ("value", ["first", "second"])
+
+
+def test_failures_reach_every_caller_and_are_not_kept():
+    """An error is raised in every waiting caller, then the key loads again."""
+    async def load() -> tuple[list, str]:
+        """A helper failing a shared load, then loading the key again."""
+        flights = SingleFlight()
+
+        async def failing() -> str:
+            """A loader failing after a loop iteration."""
+            await asyncio.sleep(0)
+            raise LookupError("load failed")
+
+        async def working() -> str:
+            """A loader succeeding."""
+            return "value"
+
+        results = await asyncio.gather(
+            flights.do("key", failing),
+            flights.do("key", failing),
+            return_exceptions=True,
+        )
+        return [type(result) for result in results], await flights.do("key", working)
+
+    assert asyncio.run(load()) == ([LookupError, LookupError], "value")
+
+
+def test_loads_pinned_to_the_primary_are_kept_apart():
+    """A caller pinned to the primary never joins a load from the replica."""
+    async def load() -> list:
+        """A helper loading one key for a replica and a primary caller."""
+        flights = SingleFlight()
+
+        async def read() -> bool:
+            """A loader reporting the database it reads from."""
+            await asyncio.sleep(0)
+            return read_from_primary.get()
+
+        async def pinned() -> bool:
+            """A helper loading the key pinned to the primary."""
+            read_from_primary.set(True)
+            return await flights.do("key", read)
+
+        return await asyncio.gather(flights.do("key", read), pinned())
+
+    assert asyncio.run(load()) == [False, True]
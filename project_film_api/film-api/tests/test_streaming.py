@@ -0,0 +1,105 @@
+"""Tests of the negotiation and serialization of streamed responses."""
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from filmapi.api.utils.streaming import (
+    CHUNK_ROWS,
+    _json_array_chunks,
+    _ndjson_chunks,
+    wants_ndjson,
+)
+
+
+class Item(BaseModel):
+    """A streamed model."""
+    id: int
+    title: str
+
+
+def _request(accept: str | None) -> Request:
+    """A function building a request with the given Accept header.
+
+    Args:
+        accept (str | None): The header value, no header if None.
+
+    Returns:
+        Request: The request.
+    """
+    headers = [] if accept is None else [(b"accept", accept.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+async def _items(count: int) -> AsyncIterator[Item]:
+    """A generator yielding models with escaped characters in them.
+
+    Args:
+        count (int): The number of models.
+
+    Yields:
+        Item: The models.
+    """
+    for number in range(count):
+        yield Item(id=number, title=f'"Film"\n{number}')
+
+
+async def _body(chunks: AsyncIterator[bytes]) -> tuple[bytes, int]:
+    """A function collecting the chunks of a streamed body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks.
+
+    Returns:
+        tuple[bytes, int]: The body and the number of chunks.
+    """
+    collected = [chunk async for chunk in chunks]
+    return b"".join(collected), len(collected)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, False),
+        ("*/*", False),
+        ("application/*", False),
+        ("application/x-ndjson", True),
+        ("application/x-ndjson, */*", True),
+        ("application/x-ndjson;q=0", False),
+        ("application/x-ndjson;q=0, */*", False),
+        ("application/json, application/x-ndjson;q=0.5", False),
+        ("application/json;q=0.5, application/x-ndjson", True),
+        ("application/x-ndjson;q=0.8, */*;q=0.9", False),
+        ("application/x-ndjson;q=0.5, application/*;q=0.5", True),
+        ("application/x-ndjson;q=oops", False),
+    ],
+)
+def test_ndjson_is_sent_only_when_preferred(accept, expected):
+    """NDJSON needs an explicit, nonzero quality not below the JSON one."""
+    assert wants_ndjson(_request(accept)) is expected
+
+
+@pytest.mark.parametrize("count", [0, 1, CHUNK_ROWS + 1])
+def test_json_array_chunks_form_one_array(count):
+    """The chunks of the JSON stream join into one valid array."""
+    body, _ = asyncio.run(_body(_json_array_chunks(_items(count))))
+
+    assert [Item(**item) for item in json.loads(body)] == [
+        Item(id=number, title=f'"Film"\n{number}') for number in range(count)
+    ]
+
+
+@pytest.mark.parametrize(("count", "chunks"), [(0, 0), (1, 1), (CHUNK_ROWS + 1, 2)])
+def test_ndjson_chunks_hold_one_model_per_line(count, chunks):
+    """Every line of the NDJSON stream is a valid JSON document."""
+    body, sent = asyncio.run(_body(_ndjson_chunks(_items(count))))
+
+    assert sent == chunks
+    assert body.endswith(b"\n") or not body
+    assert [Item(**json.loads(line)) for line in body.splitlines()] == [
+        Item(id=number, title=f'"Film"\n{number}') for number in range(count)
+    ]